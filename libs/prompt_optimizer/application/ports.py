@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import datetime
 from typing import TypedDict
 
 from ..domain.entities import (
+    EffectivenessScore,
     FeedbackRecord,
     ModelType,
     OptimizationGoal,
     OptimizationResult,
     Prompt,
+    PromptFeatures,
     PromptId,
     PromptOptimizationSession,
     TokenCount,
@@ -37,11 +41,28 @@ class TokenCounterPort(ABC):
         """Count tokens accurately for the specified model."""
         pass
 
+    async def count_tokens_many(
+        self, contents: Sequence[str], model: ModelType
+    ) -> list[TokenCount]:
+        """Count tokens for many contents, in order.
+
+        The default counts them one at a time; adapters override it to batch.
+        """
+        return [await self.count_tokens(content, model) for content in contents]
+
     @abstractmethod
     async def estimate_cost(self, token_count: int, model: ModelType) -> float:
         """Estimate the cost for the given token count and model."""
         pass
 
+    @property
+    def counter_kind(self) -> str:
+        """Name of the counting method the next count will use.
+
+        Counts from different methods disagree, so cached analyses are keyed by it.
+        """
+        return type(self).__name__
+
 
 class PromptRepositoryPort(ABC):
     """Port for prompt persistence and retrieval."""
@@ -128,3 +149,65 @@ class NotificationPort(ABC):
     async def notify_model_updated(self, model_version: str) -> None:
         """Notify when ML model is updated."""
         pass
+
+
+@dataclass(frozen=True)
+class CachedAnalysis:
+    """Analysis results of one prompt content and model, as stored in a cache."""
+
+    features: PromptFeatures
+    token_count: TokenCount
+    effectiveness_score: EffectivenessScore
+
+
+@dataclass
+class AnalysisCacheStats:
+    """Counters of an analysis cache."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    memory_bytes: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, int | float]:
+        """Convert to dictionary for reporting."""
+        return {
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "entries": self.entries,
+            "memory_bytes": self.memory_bytes,
+        }
+
+
+class AnalysisCachePort(ABC):
+    """Port for caching prompt analysis results by content key."""
+
+    @abstractmethod
+    async def get(self, key: str) -> CachedAnalysis | None:
+        """Return the cached analysis for ``key``, if any."""
+        pass
+
+    @abstractmethod
+    async def put(self, key: str, analysis: CachedAnalysis) -> None:
+        """Store the analysis for ``key``."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> AnalysisCacheStats:
+        """Return hit/miss counters."""
+        pass
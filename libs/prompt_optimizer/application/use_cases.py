@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from uuid import uuid4
@@ -17,6 +18,9 @@ from ..domain.entities import (
 )
 from ..domain.services import PromptAnalyzer, PromptFeatureExtractor, PromptOptimizer
 from .ports import (
+    AnalysisCachePort,
+    AnalysisCacheStats,
+    CachedAnalysis,
     MLModelPort,
     NotificationPort,
     PromptRepositoryPort,
@@ -90,18 +94,85 @@ class AnalyzePromptUseCase:
 
         # Store results if requested
         if command.store_result:
-            await self.prompt_repository.save_prompt(prompt)
-            await self.temporal_db.store_prompt_analysis(prompt, datetime.now(UTC))
+            await self.store_result(prompt)
 
         return prompt
 
+    async def store_result(self, prompt: Prompt) -> None:
+        """Persist an analyzed prompt."""
+        await self.prompt_repository.save_prompt(prompt)
+        await self.temporal_db.store_prompt_analysis(prompt, datetime.now(UTC))
+
+
+# Bump when feature extraction, token counting or scoring changes cached results
+ANALYSIS_CACHE_VERSION = 2
+
+
+def analysis_cache_key(content: str, model: ModelType, counter_kind: str) -> str:
+    """Return the cache key of an analysis: a hash of the exact content, model and counter.
+
+    Content is not normalized further: token counts depend on case and whitespace. The
+    counter kind keeps estimated counts apart from exact ones.
+    """
+    digest = hashlib.sha256(f"v{ANALYSIS_CACHE_VERSION}:{model.value}:{counter_kind}:".encode())
+    digest.update(content.encode())
+    return digest.hexdigest()
+
+
+class CachedAnalyzePromptUseCase:
+    """Decorator around :class:`AnalyzePromptUseCase` that reuses earlier analyses.
+
+    Features, token counts and effectiveness scores of previously seen content are
+    served from the cache; each call still returns a new ``Prompt`` and stores it when
+    requested.
+    """
+
+    def __init__(self, analyze_use_case: AnalyzePromptUseCase, cache: AnalysisCachePort):
+        self.analyze_use_case = analyze_use_case
+        self.cache = cache
+
+    async def execute(self, command: AnalyzePromptCommand) -> Prompt:
+        """Execute prompt analysis, consulting the cache first."""
+        key = analysis_cache_key(
+            command.content,
+            command.model,
+            self.analyze_use_case.token_counter.counter_kind,
+        )
+        cached = await self.cache.get(key)
+        if cached is None:
+            prompt = await self.analyze_use_case.execute(command)
+            if prompt.features and prompt.token_count and prompt.effectiveness_score:
+                await self.cache.put(
+                    key,
+                    CachedAnalysis(
+                        features=prompt.features,
+                        token_count=prompt.token_count,
+                        effectiveness_score=prompt.effectiveness_score,
+                    ),
+                )
+            return prompt
+
+        prompt = Prompt(id=PromptId(), content=command.content, created_at=datetime.now(UTC))
+        prompt.update_features(cached.features)
+        prompt.update_token_count(cached.token_count)
+        prompt.update_effectiveness_score(cached.effectiveness_score)
+
+        if command.store_result:
+            await self.analyze_use_case.store_result(prompt)
+
+        return prompt
+
+    def stats(self) -> AnalysisCacheStats:
+        """Return the cache hit/miss counters."""
+        return self.cache.stats()
+
 
 class OptimizePromptUseCase:
     """Use case for optimizing prompts based on specific goals."""
 
     def __init__(
         self,
-        analyze_use_case: AnalyzePromptUseCase,
+        analyze_use_case: AnalyzePromptUseCase | CachedAnalyzePromptUseCase,
         ml_model: MLModelPort,
         temporal_db: TemporalDatabasePort,
         notification: NotificationPort,
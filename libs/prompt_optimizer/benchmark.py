@@ -0,0 +1,284 @@
+"""Offline benchmark harness for the prompt optimizer.
+
+Generates deterministic synthetic prompts of a given size, times the prompt analysis
+hot paths and emits JSON whose scenario names are stable so results can be compared
+across commits::
+
+    python -m libs.prompt_optimizer.benchmark --size-kb 100 --output bench.json
+    python -m libs.prompt_optimizer.benchmark --size-kb 100 --compare bench.json
+
+Only the standard library is required; the batch scenarios need NumPy and the token
+counting scenarios need tiktoken with its GPT-4 encoding available.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import cached_property
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+from .domain.entities import ModelType, Prompt, PromptId
+from .domain.services import PromptAnalyzer, PromptFeatureExtractor
+from .infrastructure.adapters import IncrementalTiktokenAdapter, TiktokenAdapter
+
+RESULT_SCHEMA_VERSION = 1
+
+# Words that exercise every feature indicator, mixed with generated filler words
+_PROMPT_VOCABULARY = (
+    "you are an expert reviewer. please analyze the following context carefully, "
+    "for example: the billing service must never drop events! should we consider "
+    "maybe a better approach? generate a summary in exactly three bullet points; "
+    "avoid jargon and keep the tone suitable for the audience. e.g. use the "
+    "repository pattern, such as an adapter layer. make sure to explain why."
+).split()
+_SYLLABLES = ("ka", "lo", "mi", "tre", "sun", "op", "ex", "ar", "bel", "de", "ri", "on")
+
+
+def generate_prompt(size_bytes: int, *, seed: int = 1337) -> str:
+    """Return a deterministic synthetic prompt of roughly ``size_bytes`` characters."""
+    rng = random.Random(seed)  # noqa: S311 - deterministic synthetic prompts, not security
+    filler = [
+        "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 4))) for _ in range(4_000)
+    ]
+    words: list[str] = []
+    length = 0
+    while length < size_bytes:
+        word = rng.choice(_PROMPT_VOCABULARY) if rng.random() < 0.5 else rng.choice(filler)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size_bytes]
+
+
+@dataclass
+class BenchmarkContext:
+    """Shared state handed to every scenario."""
+
+    prompts: list[Prompt]
+    feature_extractor: PromptFeatureExtractor = field(default_factory=PromptFeatureExtractor)
+
+    @property
+    def contents(self) -> list[str]:
+        return [prompt.content for prompt in self.prompts]
+
+    @cached_property
+    def variants(self) -> list[str]:
+        """Prompts sharing the first prompt, cut into 100-character lines, as preamble."""
+        content = self.prompts[0].content
+        preamble = "\n".join(content[start : start + 100] for start in range(0, len(content), 100))
+        return [f"{preamble}\n\nRequest {index}: list the open issues." for index in range(20)]
+
+
+@dataclass
+class BenchmarkScenario:
+    """A named, repeatable timed operation."""
+
+    name: str
+    run: Callable[[BenchmarkContext], object]
+    iterations: int = 20
+
+
+def _load_tiktoken_encoding() -> Any | None:
+    """Return the GPT-4 tiktoken encoding, or None when it cannot be loaded."""
+    if find_spec("tiktoken") is None:
+        return None
+    import tiktoken
+
+    try:
+        # The encoding file is downloaded on first use
+        return tiktoken.encoding_for_model("gpt-4")
+    except Exception:
+        return None
+
+
+def _count_tokens_decode_each(encoding: Any, content: str) -> dict[str, int]:
+    """Token distribution computed by decoding every token (the pre-lookup-table path)."""
+    decoded = [encoding.decode([token]) for token in encoding.encode(content)]
+    return TiktokenAdapter()._analyze_token_distribution(decoded)
+
+
+def _count_tokens(adapter: TiktokenAdapter, contents: list[str]) -> None:
+    async def count_all() -> None:
+        for content in contents:
+            await adapter.count_tokens(content, ModelType.GPT_4)
+
+    asyncio.run(count_all())
+    adapter.close()
+
+
+def default_scenarios() -> list[BenchmarkScenario]:
+    """Return the standard scenario list (some need optional dependencies)."""
+    scenarios = [
+        BenchmarkScenario(
+            "extract_features",
+            lambda ctx: [ctx.feature_extractor.extract_features(p) for p in ctx.prompts],
+        ),
+    ]
+    if find_spec("numpy") is not None:
+        scenarios += [
+            BenchmarkScenario(
+                "extract_features_batch",
+                lambda ctx: ctx.feature_extractor.extract_features_batch(ctx.contents),
+            ),
+            BenchmarkScenario(
+                "analyze_effectiveness_batch",
+                lambda ctx: PromptAnalyzer(ctx.feature_extractor).analyze_effectiveness_batch(
+                    ctx.feature_extractor.extract_features_batch(ctx.contents)
+                ),
+            ),
+        ]
+    encoding = _load_tiktoken_encoding()
+    if encoding is not None:
+        adapter = TiktokenAdapter()
+        scenarios += [
+            BenchmarkScenario(
+                "count_tokens",
+                lambda ctx: _count_tokens(adapter, ctx.contents),
+            ),
+            BenchmarkScenario(
+                "count_tokens_decode_each",
+                lambda ctx: [_count_tokens_decode_each(encoding, c) for c in ctx.contents],
+                iterations=5,
+            ),
+            BenchmarkScenario(
+                "count_tokens_variants",
+                lambda ctx: _count_tokens(adapter, ctx.variants),
+                iterations=5,
+            ),
+            BenchmarkScenario(
+                "count_tokens_variants_incremental",
+                lambda ctx: _count_tokens(IncrementalTiktokenAdapter(), ctx.variants),
+                iterations=5,
+            ),
+        ]
+    return scenarios
+
+
+def _summarize(samples_ms: list[float]) -> dict[str, float | int]:
+    ordered = sorted(samples_ms)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "iterations": len(ordered),
+        "min_ms": round(ordered[0], 4),
+        "median_ms": round(statistics.median(ordered), 4),
+        "mean_ms": round(statistics.fmean(ordered), 4),
+        "p95_ms": round(ordered[p95_index], 4),
+        "max_ms": round(ordered[-1], 4),
+    }
+
+
+def run_benchmark(
+    *,
+    size_kb: int = 100,
+    prompts: int = 1,
+    seed: int = 1337,
+    iteration_scale: float = 1.0,
+    only: set[str] | None = None,
+) -> dict[str, Any]:
+    """Time every scenario over ``prompts`` synthetic prompts and return the JSON payload."""
+    now = datetime.now(UTC)
+    ctx = BenchmarkContext(
+        prompts=[
+            Prompt(
+                id=PromptId(),
+                content=generate_prompt(size_kb * 1024, seed=seed + index),
+                created_at=now,
+            )
+            for index in range(prompts)
+        ]
+    )
+
+    scenarios: dict[str, dict[str, float | int]] = {}
+    for scenario in default_scenarios():
+        if only and scenario.name not in only:
+            continue
+        # An untimed first run keeps one-off setup (encodings, lookup tables) out of the samples
+        scenario.run(ctx)
+        samples: list[float] = []
+        for _ in range(max(1, int(scenario.iterations * iteration_scale))):
+            start = time.perf_counter()
+            scenario.run(ctx)
+            samples.append((time.perf_counter() - start) * 1000)
+        scenarios[scenario.name] = _summarize(samples)
+
+    return {
+        "schema_version": RESULT_SCHEMA_VERSION,
+        "generated_at": now.isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "dataset": {"seed": seed, "size_kb": size_kb, "prompts": prompts},
+        "scenarios": scenarios,
+    }
+
+
+def compare_results(current: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """Return human-readable median ratios of ``current`` against ``baseline``."""
+    lines = [f"{'scenario':<45} {'baseline':>12} {'current':>12} {'ratio':>8}"]
+    for name, stats in current["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            lines.append(f"{name:<45} {'-':>12} {stats['median_ms']:>10.3f}ms {'new':>8}")
+            continue
+        ratio = stats["median_ms"] / previous["median_ms"] if previous["median_ms"] else 0.0
+        lines.append(
+            f"{name:<45} {previous['median_ms']:>10.3f}ms {stats['median_ms']:>10.3f}ms "
+            f"{ratio:>7.2f}x"
+        )
+    return lines
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark the prompt optimizer")
+    parser.add_argument("--size-kb", type=int, default=100, help="Size of each prompt in KB")
+    parser.add_argument("--prompts", type=int, default=1, help="Number of prompts per iteration")
+    parser.add_argument("--seed", type=int, default=1337, help="Random seed for prompt generation")
+    parser.add_argument(
+        "--iteration-scale",
+        type=float,
+        default=1.0,
+        help="Multiplier applied to each scenario's iteration count",
+    )
+    parser.add_argument(
+        "--scenario", action="append", help="Run only the named scenario (repeatable)"
+    )
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    parser.add_argument("--compare", help="Baseline JSON results to compare against")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    payload = run_benchmark(
+        size_kb=args.size_kb,
+        prompts=args.prompts,
+        seed=args.seed,
+        iteration_scale=args.iteration_scale,
+        only=set(args.scenario) if args.scenario else None,
+    )
+
+    text = json.dumps(payload, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        print("\n".join(compare_results(payload, baseline)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
 
 from .entities import (
     EffectivenessScore,
@@ -11,202 +14,445 @@ from .entities import (
     PromptFeatures,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+# Characters stripped from words before vocabulary matching and syllable counting
+_WORD_STRIP_CHARS = ".,!?;:\"'"
+_SENTENCE_TERMINATORS = re.compile(r"[.!?]+")
+# A sentence starts at its first non-space character and runs to the next terminator
+_SENTENCE = re.compile(r"[^\s.!?][^.!?]*")
+_VOWEL_GROUPS = re.compile(r"[aeiouy]+")
+
+
+def _estimate_word_syllables(word: str) -> int:
+    """Estimate the syllables of a lowercased, stripped word."""
+    syllable_count = sum(1 for _ in _VOWEL_GROUPS.finditer(word))
+
+    # Adjust for silent 'e'
+    if word.endswith("e") and syllable_count > 1:
+        syllable_count -= 1
+
+    # Minimum one syllable per word
+    return max(1, syllable_count)
+
+
+# Per-token (stripped word, syllables, words split at sentence terminators)
+type TokenStats = dict[str, tuple[str, int, int]]
+
+
+def _token_stats(token: str) -> tuple[str, int, int]:
+    word = token.strip(_WORD_STRIP_CHARS)
+    sentence_words = sum(1 for piece in _SENTENCE_TERMINATORS.split(token) if piece)
+    return word, _estimate_word_syllables(word), sentence_words
+
+
+class LexicalScan:
+    """Word, sentence and phrase statistics gathered in one pass over a prompt.
+
+    The lowercased content is tokenized once on whitespace; everything word-based
+    (stripped vocabulary counts, syllables, words per sentence) is computed once per
+    distinct token and weighted by its frequency. Phrases without whitespace are looked
+    up in the newline-joined distinct tokens (the *lexicon*), which is usually far
+    smaller than the content; phrases spanning words only scan the content when each
+    of their words occurs in the lexicon.
+    """
+
+    __slots__ = (
+        "lowered",
+        "lexicon",
+        "word_count",
+        "words",
+        "sentence_count",
+        "sentence_word_count",
+        "syllable_count",
+        "_phrases",
+    )
+
+    def __init__(self, content: str, token_stats: TokenStats | None = None):
+        """Scan ``content``.
+
+        Args:
+            content: The prompt text.
+            token_stats: Per-token statistics shared between scans (e.g. over a batch),
+                filled in as new tokens are seen.
+        """
+        self.lowered = content.lower()
+        tokens = Counter(self.lowered.split())
+        self.lexicon = "\n".join(tokens)
+        self.word_count = sum(tokens.values())
+        if token_stats is None:
+            token_stats = {}
+
+        words: Counter[str] = Counter()
+        sentence_word_count = syllable_count = 0
+        for token, occurrences in tokens.items():
+            stats = token_stats.get(token)
+            if stats is None:
+                stats = token_stats[token] = _token_stats(token)
+            word, syllables, sentence_words = stats
+            words[word] += occurrences
+            syllable_count += occurrences * syllables
+            sentence_word_count += occurrences * sentence_words
+
+        self.words = words
+        self.syllable_count = syllable_count
+        self.sentence_word_count = sentence_word_count
+        self.sentence_count = sum(1 for _ in _SENTENCE.finditer(self.lowered))
+        self._phrases: dict[str, bool] = {}
+
+    def contains(self, phrase: str) -> bool:
+        """Return whether the lowercased content contains ``phrase`` as a substring."""
+        found = self._phrases.get(phrase)
+        if found is None:
+            parts = phrase.split()
+            if len(parts) == 1 and parts[0] == phrase:
+                found = phrase in self.lexicon
+            else:
+                found = all(part in self.lexicon for part in parts) and phrase in self.lowered
+            self._phrases[phrase] = found
+        return found
+
+    def count(self, phrase: str) -> int:
+        """Count non-overlapping occurrences of ``phrase`` in the lowercased content."""
+        return self.lowered.count(phrase) if self.contains(phrase) else 0
+
+    def count_words(self, vocabulary: frozenset[str]) -> int:
+        """Count words (stripped of surrounding punctuation) that are in ``vocabulary``."""
+        return sum(self.words.get(word, 0) for word in vocabulary)
+
+
+# Column order of feature matrices: the key order of ``PromptFeatures.to_dict``
+FEATURE_COLUMNS: tuple[str, ...] = (
+    "token_count",
+    "sentence_count",
+    "avg_sentence_length",
+    "instruction_clarity",
+    "context_completeness",
+    "task_specificity",
+    "role_definition",
+    "example_count",
+    "constraint_clarity",
+    "readability_score",
+    "ambiguity_score",
+    "directive_strength",
+)
+
+# Column order of batch effectiveness scores: the fields of ``EffectivenessScore``
+EFFECTIVENESS_COLUMNS: tuple[str, ...] = (
+    "overall_score",
+    "clarity_score",
+    "specificity_score",
+    "completeness_score",
+)
+
+_EXAMPLE_COUNT = FEATURE_COLUMNS.index("example_count")
+_SENTENCE_COUNT = FEATURE_COLUMNS.index("sentence_count")
+_OVERALL_SCORE = EFFECTIVENESS_COLUMNS.index("overall_score")
+_COMPLETENESS_SCORE = EFFECTIVENESS_COLUMNS.index("completeness_score")
+
+# Per-feature weights of the clarity, specificity and completeness scores (the example
+# and sentence counts enter saturated, see ``PromptAnalyzer.analyze_effectiveness_batch``)
+_SCORE_WEIGHTS: dict[str, tuple[float, float, float]] = {
+    "instruction_clarity": (40.0, 0.0, 0.0),
+    "ambiguity_score": (-30.0, 0.0, 0.0),
+    "readability_score": (20.0, 0.0, 0.0),
+    "directive_strength": (10.0, 0.0, 0.0),
+    "task_specificity": (0.0, 50.0, 0.0),
+    "constraint_clarity": (0.0, 30.0, 0.0),
+    "example_count": (0.0, 20.0, 0.0),
+    "context_completeness": (0.0, 0.0, 60.0),
+    "role_definition": (0.0, 0.0, 20.0),
+    "sentence_count": (0.0, 0.0, 20.0),
+}
+# Constant terms: clarity's ``(1 - ambiguity_score) * 30``
+_SCORE_BIAS = (30.0, 0.0, 0.0)
+_OVERALL_WEIGHTS = (0.3, 0.4, 0.3)
+
+
+def _require_numpy() -> None:
+    """Raise a ``RuntimeError`` with install instructions when NumPy is missing."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise RuntimeError(
+            "Batch feature extraction requires NumPy; install it with 'pip install numpy'"
+        ) from exc
+
+
+_score_weight_arrays: (
+    tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]] | None
+) = None
+
+
+def _score_weights() -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Return the ``(features x scores)`` weight matrix, bias and overall weights."""
+    global _score_weight_arrays
+    if _score_weight_arrays is None:
+        _require_numpy()
+        import numpy as np
+
+        weights = np.zeros((len(FEATURE_COLUMNS), 3), dtype=np.float64)
+        for name, row in _SCORE_WEIGHTS.items():
+            weights[FEATURE_COLUMNS.index(name)] = row
+        bias = np.asarray(_SCORE_BIAS, dtype=np.float64)
+        _score_weight_arrays = weights, bias, np.asarray(_OVERALL_WEIGHTS, dtype=np.float64)
+    return _score_weight_arrays
+
 
 class PromptFeatureExtractor:
     """Domain service for extracting features from prompts."""
 
+    _CLARITY_INDICATORS = (
+        "please",
+        "must",
+        "should",
+        "need to",
+        "required",
+        "step by step",
+        "clearly",
+        "specifically",
+        "exactly",
+    )
+
+    _CONTEXT_INDICATORS = (
+        "context",
+        "background",
+        "given",
+        "assuming",
+        "consider",
+        "taking into account",
+        "based on",
+        "using",
+    )
+
+    _EXAMPLE_HINTS = ("example", "for instance", "such as", "like")
+
+    _ACTION_WORDS = (
+        "generate",
+        "create",
+        "write",
+        "analyze",
+        "summarize",
+        "explain",
+        "describe",
+        "list",
+        "compare",
+        "evaluate",
+    )
+
+    _TASK_CONSTRAINTS = (
+        "format",
+        "length",
+        "style",
+        "tone",
+        "audience",
+        "maximum",
+        "minimum",
+        "exactly",
+        "approximately",
+    )
+
+    _ROLE_INDICATORS = (
+        "you are",
+        "act as",
+        "assume the role",
+        "pretend to be",
+        "imagine you are",
+        "as a",
+        "your role is",
+    )
+
+    _EXAMPLE_MARKERS = (
+        "example:",
+        "for example",
+        "for instance",
+        "such as",
+        "e.g.",
+        "like this:",
+        "here's an example",
+    )
+
+    _CONSTRAINT_MARKERS = (
+        "must",
+        "should",
+        "cannot",
+        "don't",
+        "avoid",
+        "ensure",
+        "make sure",
+        "remember to",
+        "important",
+    )
+
+    _AMBIGUOUS_WORDS = frozenset(
+        {
+            "maybe",
+            "perhaps",
+            "possibly",
+            "might",
+            "could",
+            "some",
+            "several",
+            "various",
+            "different",
+            "appropriate",
+            "suitable",
+            "relevant",
+            "good",
+            "better",
+            "best",
+        }
+    )
+
+    _STRONG_DIRECTIVES = frozenset(
+        {
+            "must",
+            "will",
+            "shall",
+            "required",
+            "mandatory",
+            "always",
+            "never",
+            "exactly",
+            "precisely",
+        }
+    )
+
+    _WEAK_DIRECTIVES = frozenset(
+        {
+            "should",
+            "could",
+            "might",
+            "try",
+            "consider",
+            "perhaps",
+            "maybe",
+            "possibly",
+        }
+    )
+
     def extract_features(self, prompt: Prompt) -> PromptFeatures:
         """Extract ML features from prompt content."""
-        content = prompt.content
-
+        return PromptFeatures(*self._feature_values(LexicalScan(prompt.content)))
+
+    def extract_features_batch(self, contents: Iterable[str]) -> NDArray[np.float32]:
+        """Extract features for many prompt contents into a dense matrix.
+
+        Returns:
+            A ``float32`` array of shape ``(len(contents), len(FEATURE_COLUMNS))`` with one
+            row per content and columns in ``FEATURE_COLUMNS`` order (the key order of
+            ``PromptFeatures.to_dict``; ``role_definition`` is 0.0 or 1.0).
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+        """
+        _require_numpy()
+        import numpy as np
+
+        # Token statistics are shared across the batch; corpora repeat most words
+        token_stats: TokenStats = {}
+        rows = [self._feature_values(LexicalScan(content, token_stats)) for content in contents]
+        flat: Iterator[float] = (value for row in rows for value in row)
+        values = np.fromiter(flat, dtype=np.float32, count=len(rows) * len(FEATURE_COLUMNS))
+        return values.reshape(len(rows), len(FEATURE_COLUMNS))
+
+    def _feature_values(
+        self, scan: LexicalScan
+    ) -> tuple[int, int, float, float, float, float, bool, int, float, float, float, float]:
+        """Compute the feature values of a scanned prompt in ``FEATURE_COLUMNS`` order."""
         # Basic structural features
-        sentences = self._split_sentences(content)
-        sentence_count = len(sentences)
+        sentence_count = scan.sentence_count
         avg_sentence_length = (
-            sum(len(s.split()) for s in sentences) / sentence_count if sentence_count > 0 else 0.0
+            scan.sentence_word_count / sentence_count if sentence_count > 0 else 0.0
         )
 
         # Content analysis features
-        instruction_clarity = self._measure_instruction_clarity(content)
-        context_completeness = self._assess_context_completeness(content)
-        task_specificity = self._evaluate_task_specificity(content)
+        instruction_clarity = self._measure_instruction_clarity(scan)
+        context_completeness = self._assess_context_completeness(scan)
+        task_specificity = self._evaluate_task_specificity(scan)
 
         # Advanced structural features
-        role_definition = self._has_role_definition(content)
-        example_count = self._count_examples(content)
-        constraint_clarity = self._analyze_constraint_clarity(content)
+        role_definition = self._has_role_definition(scan)
+        example_count = self._count_examples(scan)
+        constraint_clarity = self._analyze_constraint_clarity(scan)
 
         # Linguistic features
-        readability_score = self._calculate_readability(content)
-        ambiguity_score = self._detect_ambiguity(content)
-        directive_strength = self._measure_directive_strength(content)
-
-        return PromptFeatures(
-            token_count=len(content.split()),  # Rough estimate, will be refined
-            sentence_count=sentence_count,
-            avg_sentence_length=avg_sentence_length,
-            instruction_clarity=instruction_clarity,
-            context_completeness=context_completeness,
-            task_specificity=task_specificity,
-            role_definition=role_definition,
-            example_count=example_count,
-            constraint_clarity=constraint_clarity,
-            readability_score=readability_score,
-            ambiguity_score=ambiguity_score,
-            directive_strength=directive_strength,
+        readability_score = self._calculate_readability(scan)
+        ambiguity_score = self._detect_ambiguity(scan)
+        directive_strength = self._measure_directive_strength(scan)
+
+        return (
+            scan.word_count,  # token_count: rough estimate, will be refined
+            sentence_count,
+            avg_sentence_length,
+            instruction_clarity,
+            context_completeness,
+            task_specificity,
+            role_definition,
+            example_count,
+            constraint_clarity,
+            readability_score,
+            ambiguity_score,
+            directive_strength,
         )
 
-    def _split_sentences(self, text: str) -> list[str]:
-        """Split text into sentences."""
-        # Simple sentence splitting - could be enhanced with NLP library
-        if not text:
-            return []
-        # Mypy can infer re.split as containing Any, so we assert the type.
-        sentences: list[str] = re.split(r"[.!?]+", text)
-        return [s.strip() for s in sentences if s.strip()]
-
-    def _measure_instruction_clarity(self, content: str) -> float:
+    def _measure_instruction_clarity(self, scan: LexicalScan) -> float:
         """Measure how clear the instructions are (0.0 to 1.0)."""
-        clarity_indicators = [
-            "please",
-            "must",
-            "should",
-            "need to",
-            "required",
-            "step by step",
-            "clearly",
-            "specifically",
-            "exactly",
-        ]
-
-        content_lower = content.lower()
-        indicator_count = sum(1 for indicator in clarity_indicators if indicator in content_lower)
+        indicator_count = sum(
+            1 for indicator in self._CLARITY_INDICATORS if scan.contains(indicator)
+        )
 
         # Normalize by content length and cap at 1.0
-        clarity = min(indicator_count / max(len(content.split()) / 10, 1), 1.0)
+        clarity = min(indicator_count / max(scan.word_count / 10, 1), 1.0)
         return clarity
 
-    def _assess_context_completeness(self, content: str) -> float:
+    def _assess_context_completeness(self, scan: LexicalScan) -> float:
         """Assess how complete the context is (0.0 to 1.0)."""
-        context_indicators = [
-            "context",
-            "background",
-            "given",
-            "assuming",
-            "consider",
-            "taking into account",
-            "based on",
-            "using",
-        ]
-
-        content_lower = content.lower()
-        context_count = sum(1 for indicator in context_indicators if indicator in content_lower)
+        context_count = sum(1 for indicator in self._CONTEXT_INDICATORS if scan.contains(indicator))
 
         # Check for examples or specific details
-        has_examples = any(
-            marker in content_lower for marker in ["example", "for instance", "such as", "like"]
-        )
+        has_examples = any(scan.contains(marker) for marker in self._EXAMPLE_HINTS)
 
         completeness = min((context_count + (2 if has_examples else 0)) / 5, 1.0)
         return completeness
 
-    def _evaluate_task_specificity(self, content: str) -> float:
+    def _evaluate_task_specificity(self, scan: LexicalScan) -> float:
         """Evaluate how specific the task description is (0.0 to 1.0)."""
         # Look for specific action words
-        action_words = [
-            "generate",
-            "create",
-            "write",
-            "analyze",
-            "summarize",
-            "explain",
-            "describe",
-            "list",
-            "compare",
-            "evaluate",
-        ]
-
-        content_lower = content.lower()
-        action_count = sum(1 for action in action_words if action in content_lower)
+        action_count = sum(1 for action in self._ACTION_WORDS if scan.contains(action))
 
         # Check for specific constraints or requirements
-        constraints = [
-            "format",
-            "length",
-            "style",
-            "tone",
-            "audience",
-            "maximum",
-            "minimum",
-            "exactly",
-            "approximately",
-        ]
-
-        constraint_count = sum(1 for constraint in constraints if constraint in content_lower)
+        constraint_count = sum(
+            1 for constraint in self._TASK_CONSTRAINTS if scan.contains(constraint)
+        )
 
         specificity = min((action_count + constraint_count) / 4, 1.0)
         return specificity
 
-    def _has_role_definition(self, content: str) -> bool:
+    def _has_role_definition(self, scan: LexicalScan) -> bool:
         """Check if the prompt defines a role for the AI."""
-        role_indicators = [
-            "you are",
-            "act as",
-            "assume the role",
-            "pretend to be",
-            "imagine you are",
-            "as a",
-            "your role is",
-        ]
-
-        content_lower = content.lower()
-        return any(indicator in content_lower for indicator in role_indicators)
-
-    def _count_examples(self, content: str) -> int:
+        return any(scan.contains(indicator) for indicator in self._ROLE_INDICATORS)
+
+    def _count_examples(self, scan: LexicalScan) -> int:
         """Count the number of examples in the prompt."""
-        example_markers = [
-            "example:",
-            "for example",
-            "for instance",
-            "such as",
-            "e.g.",
-            "like this:",
-            "here's an example",
-        ]
-
-        content_lower = content.lower()
-        return sum(content_lower.count(marker) for marker in example_markers)
-
-    def _analyze_constraint_clarity(self, content: str) -> float:
+        return sum(scan.count(marker) for marker in self._EXAMPLE_MARKERS)
+
+    def _analyze_constraint_clarity(self, scan: LexicalScan) -> float:
         """Analyze how clearly constraints are specified (0.0 to 1.0)."""
-        constraint_markers = [
-            "must",
-            "should",
-            "cannot",
-            "don't",
-            "avoid",
-            "ensure",
-            "make sure",
-            "remember to",
-            "important",
-        ]
-
-        content_lower = content.lower()
-        constraint_count = sum(1 for marker in constraint_markers if marker in content_lower)
-
-        clarity = min(constraint_count / max(len(content.split()) / 20, 1), 1.0)
+        constraint_count = sum(1 for marker in self._CONSTRAINT_MARKERS if scan.contains(marker))
+
+        clarity = min(constraint_count / max(scan.word_count / 20, 1), 1.0)
         return clarity
 
-    def _calculate_readability(self, content: str) -> float:
+    def _calculate_readability(self, scan: LexicalScan) -> float:
         """Calculate readability score (0.0 to 1.0, higher is more readable)."""
-        words = content.split()
-        sentences = self._split_sentences(content)
-
-        if not words or not sentences:
+        if not scan.word_count or not scan.sentence_count:
             return 0.0
 
-        avg_words_per_sentence = len(words) / len(sentences)
-        avg_syllables_per_word = self._estimate_syllables(words)
+        avg_words_per_sentence = scan.word_count / scan.sentence_count
+        avg_syllables_per_word = scan.syllable_count / scan.word_count
 
         # Simplified Flesch Reading Ease formula
         # Original: 206.835 - (1.015 * ASL) - (84.6 * ASW)
@@ -218,92 +464,17 @@ class PromptFeatureExtractor:
         # Normalize to 0-1 range (assuming max score of ~100)
         return min(flesch_score / 100, 1.0)
 
-    def _estimate_syllables(self, words: list[str]) -> float:
-        """Estimate average syllables per word."""
-        if not words:
-            return 0.0
-
-        total_syllables = 0
-        for word in words:
-            # Simple syllable estimation
-            word = word.lower().strip(".,!?;:\"'")
-            vowels = "aeiouy"
-            syllable_count = 0
-            prev_char_was_vowel = False
-
-            for char in word:
-                if char in vowels and not prev_char_was_vowel:
-                    syllable_count += 1
-                prev_char_was_vowel = char in vowels
-
-            # Adjust for silent 'e'
-            if word.endswith("e") and syllable_count > 1:
-                syllable_count -= 1
-
-            # Minimum one syllable per word
-            syllable_count = max(1, syllable_count)
-            total_syllables += syllable_count
-
-        return total_syllables / len(words)
-
-    def _detect_ambiguity(self, content: str) -> float:
+    def _detect_ambiguity(self, scan: LexicalScan) -> float:
         """Detect ambiguous language (0.0 to 1.0, higher is more ambiguous)."""
-        ambiguous_words = [
-            "maybe",
-            "perhaps",
-            "possibly",
-            "might",
-            "could",
-            "some",
-            "several",
-            "various",
-            "different",
-            "appropriate",
-            "suitable",
-            "relevant",
-            "good",
-            "better",
-            "best",
-        ]
-
-        content_lower = content.lower()
-        words = content_lower.split()
+        ambiguous_count = scan.count_words(self._AMBIGUOUS_WORDS)
 
-        ambiguous_count = sum(1 for word in words if word.strip(".,!?;:\"'") in ambiguous_words)
-
-        ambiguity = min(ambiguous_count / max(len(words) / 10, 1), 1.0)
+        ambiguity = min(ambiguous_count / max(scan.word_count / 10, 1), 1.0)
         return ambiguity
 
-    def _measure_directive_strength(self, content: str) -> float:
+    def _measure_directive_strength(self, scan: LexicalScan) -> float:
         """Measure strength of directives (0.0 to 1.0)."""
-        strong_directives = [
-            "must",
-            "will",
-            "shall",
-            "required",
-            "mandatory",
-            "always",
-            "never",
-            "exactly",
-            "precisely",
-        ]
-
-        weak_directives = [
-            "should",
-            "could",
-            "might",
-            "try",
-            "consider",
-            "perhaps",
-            "maybe",
-            "possibly",
-        ]
-
-        content_lower = content.lower()
-        words = content_lower.split()
-
-        strong_count = sum(1 for word in words if word.strip(".,!?;:\"'") in strong_directives)
-        weak_count = sum(1 for word in words if word.strip(".,!?;:\"'") in weak_directives)
+        strong_count = scan.count_words(self._STRONG_DIRECTIVES)
+        weak_count = scan.count_words(self._WEAK_DIRECTIVES)
 
         if strong_count + weak_count == 0:
             return 0.5  # Neutral
@@ -341,6 +512,40 @@ class PromptAnalyzer:
             completeness_score=completeness_score,
         )
 
+    def analyze_effectiveness_batch(
+        self, features: NDArray[np.float32] | NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """Score a feature matrix from ``PromptFeatureExtractor.extract_features_batch``.
+
+        Applies the same weights as :meth:`analyze_effectiveness` as matrix products over
+        all rows at once.
+
+        Returns:
+            A ``float64`` array of shape ``(rows, len(EFFECTIVENESS_COLUMNS))`` with columns
+            in ``EFFECTIVENESS_COLUMNS`` order.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+        """
+        _require_numpy()
+        import numpy as np
+
+        matrix = np.array(features, dtype=np.float64, ndmin=2)
+        columns = np.size(matrix, 1)
+        if columns != len(FEATURE_COLUMNS):
+            raise ValueError(f"Expected {len(FEATURE_COLUMNS)} feature columns, got {columns}")
+
+        # Saturating terms, as in the per-prompt score calculations
+        matrix[:, _EXAMPLE_COUNT] = np.minimum(matrix[:, _EXAMPLE_COUNT] / 3, 1.0)
+        matrix[:, _SENTENCE_COUNT] = np.minimum(matrix[:, _SENTENCE_COUNT] / 5, 1.0)
+
+        weights, bias, overall_weights = _score_weights()
+        scores = np.empty((len(matrix), len(EFFECTIVENESS_COLUMNS)), dtype=np.float64)
+        scores[:, 1:] = matrix @ weights + bias
+        scores[:, _COMPLETENESS_SCORE] = np.minimum(scores[:, _COMPLETENESS_SCORE], 100.0)
+        scores[:, _OVERALL_SCORE] = scores[:, 1:] @ overall_weights
+        return scores
+
     def _calculate_clarity_score(self, features: PromptFeatures) -> float:
         """Calculate clarity score from features."""
         score = (
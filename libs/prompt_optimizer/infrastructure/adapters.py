@@ -3,14 +3,41 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import importlib.util
 import json
+import math
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import TypedDict, cast
+from functools import cache
+from typing import Any, TypedDict, cast
 from uuid import UUID
 
-from ..application.ports import PromptRepositoryPort, TokenCounterPort
-from ..domain.entities import ModelType, Prompt, PromptId, TokenCount
+from ..application.ports import (
+    MLFeatures,
+    MLModelPort,
+    NotificationPort,
+    OptimizationPattern,
+    PromptRepositoryPort,
+    TemporalDatabasePort,
+    TokenCounterPort,
+)
+from ..domain.entities import (
+    FeedbackRecord,
+    ModelType,
+    OptimizationGoal,
+    OptimizationResult,
+    Prompt,
+    PromptId,
+    PromptOptimizationSession,
+    TokenCount,
+)
 
 
 class _TokenCountJSON(TypedDict):
@@ -53,10 +80,96 @@ class _PromptJSON(TypedDict):
     metadata: dict[str, object]
 
 
+# Token distribution categories, in the order of their ids in the category tables
+_TOKEN_CATEGORIES = ("words", "punctuation", "special", "whitespace")
+_PUNCTUATION = ".,!?;:\"'()[]{}"
+_SPECIAL_CATEGORY = _TOKEN_CATEGORIES.index("special")
+
+
+def _token_category(text: str) -> int:
+    """Return the category id of a decoded token."""
+    if text.isalpha():
+        return 0
+    if text in _PUNCTUATION:
+        return 1
+    if text.isspace():
+        return 3
+    return _SPECIAL_CATEGORY
+
+
+@cache
+def _encoding_for_model(model_name: str) -> Any:
+    """Return the tiktoken encoding for ``model_name``, loaded once per process."""
+    import tiktoken
+
+    return tiktoken.encoding_for_model(model_name)
+
+
+# ``functools.cache`` does not lock, so pool threads would each build the table
+_TOKEN_CATEGORY_TABLE_LOCK = threading.Lock()
+
+
+def _token_category_table(encoding: Any) -> bytes:
+    """Map every token id of ``encoding`` to its category id (built once per encoding)."""
+    with _TOKEN_CATEGORY_TABLE_LOCK:
+        return _build_token_category_table(encoding)
+
+
+@cache
+def _build_token_category_table(encoding: Any) -> bytes:
+    table = bytearray([_SPECIAL_CATEGORY]) * encoding.n_vocab
+    for token in range(encoding.n_vocab):
+        try:
+            token_bytes = encoding.decode_single_token_bytes(token)
+        except KeyError:
+            # Unassigned ids between the regular and the special tokens
+            continue
+        # Same lossy decoding as ``encoding.decode([token])``
+        table[token] = _token_category(token_bytes.decode("utf-8", errors="replace"))
+    return bytes(table)
+
+
+@cache
+def _token_category_array(encoding: Any) -> Any:
+    """Return the category table as a NumPy array, or None without NumPy."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy.frombuffer(_token_category_table(encoding), dtype=numpy.uint8)
+
+
+def _encode_with_distribution(encoding: Any, content: str) -> tuple[int, dict[str, int]]:
+    """Encode ``content`` and count its tokens per category by table lookup."""
+    categories = _token_category_array(encoding)
+    if categories is not None:
+        import numpy
+
+        tokens = encoding.encode_to_numpy(content)
+        counts = numpy.bincount(categories[tokens], minlength=len(_TOKEN_CATEGORIES)).tolist()
+        total_tokens = len(tokens)
+    else:
+        table = _token_category_table(encoding)
+        token_categories = bytes(map(table.__getitem__, encoding.encode(content)))
+        counts = [token_categories.count(index) for index in range(len(_TOKEN_CATEGORIES))]
+        total_tokens = len(token_categories)
+    return total_tokens, dict(zip(_TOKEN_CATEGORIES, counts, strict=True))
+
+
+# Same default as tiktoken's own ``encode_batch``
+_DEFAULT_MAX_WORKERS = 8
+
+
 class TiktokenAdapter(TokenCounterPort):
-    """Adapter for tiktoken-based accurate token counting."""
+    """Adapter for tiktoken-based accurate token counting.
 
-    def __init__(self) -> None:
+    Encoding is CPU-bound, so it runs on a bounded thread pool (tiktoken releases the
+    GIL while encoding) instead of blocking the event loop.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._max_workers = max_workers or min(_DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+        self._executor: ThreadPoolExecutor | None = None
         self._model_costs: dict[ModelType, dict[str, float]] = {
             ModelType.GPT_4: {"input": 0.00003, "output": 0.00006},
             ModelType.GPT_4_TURBO: {"input": 0.00001, "output": 0.00003},
@@ -67,38 +180,54 @@ class TiktokenAdapter(TokenCounterPort):
 
     async def count_tokens(self, content: str, model: ModelType) -> TokenCount:
         """Count tokens accurately using tiktoken."""
+        loop = asyncio.get_running_loop()
         try:
-            # Import tiktoken dynamically to avoid hard dependency
-            import tiktoken
-
-            # Get appropriate encoding for model
-            if model in [ModelType.GPT_4, ModelType.GPT_4_TURBO, ModelType.GPT_3_5_TURBO]:
-                encoding = tiktoken.encoding_for_model(model.value)
-            else:
-                # Use GPT-4 encoding as fallback for non-OpenAI models
-                encoding = tiktoken.encoding_for_model("gpt-4")
-
-            # Encode and count tokens
-            tokens = encoding.encode(content)
-            total_tokens = len(tokens)
-
-            # Analyze token distribution
-            decoded_tokens: list[str] = [encoding.decode([token]) for token in tokens]
-            token_distribution = self._analyze_token_distribution(decoded_tokens)
-
-            # Estimate cost
-            estimated_cost = await self.estimate_cost(total_tokens, model)
-
-            return TokenCount(
-                total_tokens=total_tokens,
-                model=model,
-                estimated_cost=estimated_cost,
-                token_distribution=token_distribution,
+            total_tokens, token_distribution = await loop.run_in_executor(
+                self._pool(), self._encode, content, model
             )
-
         except ImportError:
             # Fallback to simple word-based estimation
             return await self._fallback_token_count(content, model)
+        return await self._token_count(total_tokens, token_distribution, model)
+
+    async def count_tokens_many(
+        self, contents: Sequence[str], model: ModelType
+    ) -> list[TokenCount]:
+        """Count tokens for many contents in parallel chunks on the thread pool."""
+        if not contents:
+            return []
+
+        # A few chunks per worker keeps the pool busy without a future per content
+        chunk_size = math.ceil(len(contents) / (self._max_workers * 4))
+        loop = asyncio.get_running_loop()
+        pool = self._pool()
+        try:
+            chunks = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        pool, self._encode_many, contents[start : start + chunk_size], model
+                    )
+                    for start in range(0, len(contents), chunk_size)
+                )
+            )
+        except ImportError:
+            return [await self._fallback_token_count(content, model) for content in contents]
+        return [
+            await self._token_count(total_tokens, token_distribution, model)
+            for chunk in chunks
+            for total_tokens, token_distribution in chunk
+        ]
+
+    @property
+    def counter_kind(self) -> str:
+        """``"tiktoken"``, or ``"estimate"`` when counts fall back to word estimates."""
+        return "tiktoken" if importlib.util.find_spec("tiktoken") is not None else "estimate"
+
+    def close(self) -> None:
+        """Shut down the encoding thread pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     async def estimate_cost(self, token_count: int, model: ModelType) -> float:
         """Estimate cost based on token count and model pricing."""
@@ -109,20 +238,42 @@ class TiktokenAdapter(TokenCounterPort):
         cost_per_token = self._model_costs[model]["input"]
         return token_count * cost_per_token
 
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self._max_workers, thread_name_prefix="tiktoken")
+        return self._executor
+
+    def _encoding(self, model: ModelType) -> Any:
+        """Return the encoding for ``model`` (tiktoken is imported lazily)."""
+        if model in [ModelType.GPT_4, ModelType.GPT_4_TURBO, ModelType.GPT_3_5_TURBO]:
+            return _encoding_for_model(model.value)
+        # Use GPT-4 encoding as fallback for non-OpenAI models
+        return _encoding_for_model("gpt-4")
+
+    def _encode(self, content: str, model: ModelType) -> tuple[int, dict[str, int]]:
+        """Encode ``content`` on a worker thread."""
+        return _encode_with_distribution(self._encoding(model), content)
+
+    def _encode_many(
+        self, contents: Sequence[str], model: ModelType
+    ) -> list[tuple[int, dict[str, int]]]:
+        return [self._encode(content, model) for content in contents]
+
+    async def _token_count(
+        self, total_tokens: int, token_distribution: dict[str, int], model: ModelType
+    ) -> TokenCount:
+        return TokenCount(
+            total_tokens=total_tokens,
+            model=model,
+            estimated_cost=await self.estimate_cost(total_tokens, model),
+            token_distribution=token_distribution,
+        )
+
     def _analyze_token_distribution(self, decoded_tokens: list[str]) -> dict[str, int]:
         """Analyze the distribution of token types."""
-        distribution = {"words": 0, "punctuation": 0, "special": 0, "whitespace": 0}
-
+        distribution = dict.fromkeys(_TOKEN_CATEGORIES, 0)
         for token in decoded_tokens:
-            if token.isalpha():
-                distribution["words"] += 1
-            elif token in ".,!?;:\"'()[]{}":
-                distribution["punctuation"] += 1
-            elif token.isspace():
-                distribution["whitespace"] += 1
-            else:
-                distribution["special"] += 1
-
+            distribution[_TOKEN_CATEGORIES[_token_category(token)]] += 1
         return distribution
 
     async def _fallback_token_count(self, content: str, model: ModelType) -> TokenCount:
@@ -146,6 +297,110 @@ class TiktokenAdapter(TokenCounterPort):
         )
 
 
+# No pre-tokenizer piece of tiktoken's GPT encodings spans a newline followed by a
+# non-space character, so the text on either side of one encodes independently
+_SAFE_BOUNDARY = re.compile(r"\n(?=\S)")
+DEFAULT_PREFIX_CHUNK_CHARS = 1024
+DEFAULT_PREFIX_CACHE_ENTRIES = 4096
+
+
+class TokenPrefixCache:
+    """Token counts of known prompt prefixes, stored as a trie of content chunks.
+
+    Text is cut at safe boundaries into chunks of at least ``chunk_chars`` characters.
+    Each trie node is keyed by the hash of its parent's key and its own chunk, and holds
+    the cumulative token counts of the prefix ending there, so counting a prompt reuses
+    its deepest known prefix and encodes only the chunks after it. Counts are exact.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_PREFIX_CACHE_ENTRIES,
+        chunk_chars: int = DEFAULT_PREFIX_CHUNK_CHARS,
+    ) -> None:
+        if max_entries <= 0 or chunk_chars <= 0:
+            raise ValueError("max_entries and chunk_chars must be positive")
+        self.max_entries = max_entries
+        self.chunk_chars = chunk_chars
+        self.reused_chars = 0
+        self.encoded_chars = 0
+        # Least recently used nodes first
+        self._nodes: OrderedDict[bytes, tuple[int, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def count(self, encoding: Any, content: str) -> tuple[int, dict[str, int]]:
+        """Return the token total and distribution of ``content`` under ``encoding``."""
+        chunks = self._chunks(content)
+        keys: list[bytes] = []
+        key = hashlib.blake2b(encoding.name.encode(), digest_size=16).digest()
+        for chunk in chunks:
+            key = hashlib.blake2b(key + chunk.encode(), digest_size=16).digest()
+            keys.append(key)
+
+        counts = (0,) * (len(_TOKEN_CATEGORIES) + 1)
+        start = 0
+        with self._lock:
+            # Interior nodes may have been evicted while deeper ones survived
+            for index in range(len(keys) - 1, -1, -1):
+                known = self._nodes.get(keys[index])
+                if known is not None:
+                    self._nodes.move_to_end(keys[index])
+                    counts, start = known, index + 1
+                    break
+
+        new_nodes: list[tuple[bytes, tuple[int, ...]]] = []
+        for index in range(start, len(chunks)):
+            total_tokens, distribution = _encode_with_distribution(encoding, chunks[index])
+            counts = (
+                counts[0] + total_tokens,
+                *(
+                    previous + distribution[category]
+                    for previous, category in zip(counts[1:], _TOKEN_CATEGORIES, strict=True)
+                ),
+            )
+            new_nodes.append((keys[index], counts))
+
+        with self._lock:
+            self.reused_chars += sum(len(chunk) for chunk in chunks[:start])
+            self.encoded_chars += sum(len(chunk) for chunk in chunks[start:])
+            for node_key, node_counts in new_nodes:
+                self._nodes[node_key] = node_counts
+            while len(self._nodes) > self.max_entries:
+                self._nodes.popitem(last=False)
+
+        return counts[0], dict(zip(_TOKEN_CATEGORIES, counts[1:], strict=True))
+
+    def _chunks(self, content: str) -> list[str]:
+        """Cut ``content`` at the first safe boundary after every ``chunk_chars`` characters."""
+        chunks = []
+        start = 0
+        while (match := _SAFE_BOUNDARY.search(content, start + self.chunk_chars - 1)) is not None:
+            chunks.append(content[start : match.end()])
+            start = match.end()
+        chunks.append(content[start:])
+        return chunks
+
+
+class IncrementalTiktokenAdapter(TiktokenAdapter):
+    """TiktokenAdapter that only encodes what follows a previously seen prompt prefix.
+
+    Suited to prompt variants sharing a long preamble, such as an original prompt and
+    its optimized versions.
+    """
+
+    def __init__(
+        self, max_workers: int | None = None, prefix_cache: TokenPrefixCache | None = None
+    ) -> None:
+        super().__init__(max_workers)
+        self.prefix_cache = prefix_cache if prefix_cache is not None else TokenPrefixCache()
+
+    def _encode(self, content: str, model: ModelType) -> tuple[int, dict[str, int]]:
+        return self.prefix_cache.count(self._encoding(model), content)
+
+
 class InMemoryPromptRepository(PromptRepositoryPort):
     """In-memory prompt repository for development and testing."""
 
@@ -349,3 +604,52 @@ class FilePromptRepository(PromptRepositoryPort):
         """Generate hash for content similarity."""
         normalized = content.lower().strip()
         return hashlib.md5(normalized.encode()).hexdigest()
+
+
+class SimpleMLModelAdapter(MLModelPort):
+    """Offline stand-in for an ML model: neutral predictions and no extra suggestions."""
+
+    async def predict_effectiveness(self, features: MLFeatures) -> float:
+        """Return a neutral effectiveness prediction."""
+        return 0.5
+
+    async def generate_optimization_suggestions(
+        self, prompt_content: str, goal: OptimizationGoal
+    ) -> list[str]:
+        """Leave suggestions to the domain optimizer."""
+        return []
+
+    async def learn_from_feedback(self, feedback: FeedbackRecord) -> None:
+        """Ignore feedback; there is no model to update."""
+
+
+class SimpleNotificationAdapter(NotificationPort):
+    """Notification adapter that discards all events."""
+
+    async def notify_optimization_complete(self, result: OptimizationResult) -> None:
+        """Discard the notification."""
+
+    async def notify_model_updated(self, model_version: str) -> None:
+        """Discard the notification."""
+
+
+class SimpleTemporalDatabaseAdapter(TemporalDatabasePort):
+    """Temporal database adapter that stores nothing and has no history."""
+
+    async def store_prompt_analysis(self, prompt: Prompt, timestamp: datetime) -> None:
+        """Discard the analysis."""
+
+    async def store_optimization_session(self, session: PromptOptimizationSession) -> None:
+        """Discard the session."""
+
+    async def get_similar_prompts(
+        self, features: MLFeatures, similarity_threshold: float = 0.7
+    ) -> list[Prompt]:
+        """Return no similar prompts."""
+        return []
+
+    async def get_optimization_patterns(
+        self, goal: OptimizationGoal, days_back: int = 90
+    ) -> list[OptimizationPattern]:
+        """Return no historical patterns."""
+        return []
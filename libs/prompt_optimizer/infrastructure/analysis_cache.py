@@ -0,0 +1,230 @@
+"""Two-tier cache of prompt analysis results.
+
+Entries live in an in-process LRU bounded by a memory budget and, optionally, in a
+SQLite database that survives restarts. Disk hits are promoted into memory.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, TypedDict, cast
+
+from ..application.ports import AnalysisCachePort, AnalysisCacheStats, CachedAnalysis
+from ..domain.entities import EffectivenessScore, ModelType, PromptFeatures, TokenCount
+
+if TYPE_CHECKING:
+    import sqlite3
+
+DEFAULT_MEMORY_BUDGET = 32 * 1024 * 1024
+
+# Fixed per-entry allowance for the key, the value objects and the LRU bookkeeping
+_ENTRY_OVERHEAD = 1024
+
+
+class _TokenCountJSON(TypedDict):
+    total_tokens: int
+    model: str
+    estimated_cost: float
+    token_distribution: dict[str, int]
+
+
+class _EffectivenessScoreJSON(TypedDict):
+    overall_score: float
+    clarity_score: float
+    specificity_score: float
+    completeness_score: float
+
+
+class _PromptFeaturesJSON(TypedDict):
+    token_count: int
+    sentence_count: int
+    avg_sentence_length: float
+    instruction_clarity: float
+    context_completeness: float
+    task_specificity: float
+    role_definition: bool
+    example_count: int
+    constraint_clarity: float
+    readability_score: float
+    ambiguity_score: float
+    directive_strength: float
+
+
+class _CachedAnalysisJSON(TypedDict):
+    features: _PromptFeaturesJSON
+    token_count: _TokenCountJSON
+    effectiveness_score: _EffectivenessScoreJSON
+
+
+def _analysis_to_json(analysis: CachedAnalysis) -> str:
+    features = analysis.features
+    token_count = analysis.token_count
+    score = analysis.effectiveness_score
+    data: _CachedAnalysisJSON = {
+        "features": {
+            "token_count": features.token_count,
+            "sentence_count": features.sentence_count,
+            "avg_sentence_length": features.avg_sentence_length,
+            "instruction_clarity": features.instruction_clarity,
+            "context_completeness": features.context_completeness,
+            "task_specificity": features.task_specificity,
+            "role_definition": features.role_definition,
+            "example_count": features.example_count,
+            "constraint_clarity": features.constraint_clarity,
+            "readability_score": features.readability_score,
+            "ambiguity_score": features.ambiguity_score,
+            "directive_strength": features.directive_strength,
+        },
+        "token_count": {
+            "total_tokens": token_count.total_tokens,
+            "model": token_count.model.value,
+            "estimated_cost": token_count.estimated_cost,
+            "token_distribution": token_count.token_distribution,
+        },
+        "effectiveness_score": {
+            "overall_score": score.overall_score,
+            "clarity_score": score.clarity_score,
+            "specificity_score": score.specificity_score,
+            "completeness_score": score.completeness_score,
+        },
+    }
+    return json.dumps(data)
+
+
+def _analysis_from_json(payload: str) -> CachedAnalysis:
+    data = cast(_CachedAnalysisJSON, json.loads(payload))
+    features = data["features"]
+    token_count = data["token_count"]
+    score = data["effectiveness_score"]
+    return CachedAnalysis(
+        features=PromptFeatures(
+            token_count=features["token_count"],
+            sentence_count=features["sentence_count"],
+            avg_sentence_length=features["avg_sentence_length"],
+            instruction_clarity=features["instruction_clarity"],
+            context_completeness=features["context_completeness"],
+            task_specificity=features["task_specificity"],
+            role_definition=features["role_definition"],
+            example_count=features["example_count"],
+            constraint_clarity=features["constraint_clarity"],
+            readability_score=features["readability_score"],
+            ambiguity_score=features["ambiguity_score"],
+            directive_strength=features["directive_strength"],
+        ),
+        token_count=TokenCount(
+            total_tokens=token_count["total_tokens"],
+            model=ModelType(token_count["model"]),
+            estimated_cost=token_count["estimated_cost"],
+            token_distribution=token_count["token_distribution"],
+        ),
+        effectiveness_score=EffectivenessScore(
+            overall_score=score["overall_score"],
+            clarity_score=score["clarity_score"],
+            specificity_score=score["specificity_score"],
+            completeness_score=score["completeness_score"],
+        ),
+    )
+
+
+class TieredAnalysisCache(AnalysisCachePort):
+    """In-process LRU cache with an optional SQLite tier."""
+
+    def __init__(
+        self,
+        max_memory_bytes: int = DEFAULT_MEMORY_BUDGET,
+        db_path: str | Path | None = None,
+    ) -> None:
+        """Create the cache.
+
+        Args:
+            max_memory_bytes: Approximate memory budget of the in-process tier; least
+                recently used entries are evicted beyond it.
+            db_path: SQLite file for the persistent tier, or None for memory only.
+        """
+        if max_memory_bytes <= 0:
+            raise ValueError("max_memory_bytes must be positive")
+        self.max_memory_bytes = max_memory_bytes
+        self._entries: OrderedDict[str, tuple[CachedAnalysis, int]] = OrderedDict()
+        self._stats = AnalysisCacheStats()
+        self._connection: sqlite3.Connection | None = None
+
+        if db_path is not None:
+            # Imported here so memory-only caches don't pay for sqlite3 at startup
+            import sqlite3
+
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(db_path))
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS analysis_cache (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL
+                ) WITHOUT ROWID
+                """
+            )
+            self._connection.commit()
+
+    async def get(self, key: str) -> CachedAnalysis | None:
+        """Return the cached analysis for ``key``, if any."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._stats.memory_hits += 1
+            return entry[0]
+
+        if self._connection is not None:
+            row = cast(
+                tuple[str] | None,
+                self._connection.execute(
+                    "SELECT payload FROM analysis_cache WHERE key = ?", (key,)
+                ).fetchone(),
+            )
+            if row is not None:
+                payload = row[0]
+                analysis = _analysis_from_json(payload)
+                self._remember(key, analysis, len(payload))
+                self._stats.disk_hits += 1
+                return analysis
+
+        self._stats.misses += 1
+        return None
+
+    async def put(self, key: str, analysis: CachedAnalysis) -> None:
+        """Store the analysis for ``key`` in both tiers."""
+        payload = _analysis_to_json(analysis)
+        self._remember(key, analysis, len(payload))
+        if self._connection is not None:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO analysis_cache (key, payload) VALUES (?, ?)",
+                (key, payload),
+            )
+            self._connection.commit()
+
+    def stats(self) -> AnalysisCacheStats:
+        """Return hit/miss counters and the current memory tier size."""
+        self._stats.entries = len(self._entries)
+        return self._stats
+
+    def close(self) -> None:
+        """Close the SQLite tier."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _remember(self, key: str, analysis: CachedAnalysis, payload_size: int) -> None:
+        """Insert into the memory tier, evicting least recently used entries."""
+        size = payload_size + _ENTRY_OVERHEAD
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._stats.memory_bytes -= previous[1]
+        if size > self.max_memory_bytes:
+            return
+
+        self._entries[key] = (analysis, size)
+        self._stats.memory_bytes += size
+        while self._stats.memory_bytes > self.max_memory_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._stats.memory_bytes -= evicted_size
+            self._stats.evictions += 1
@@ -5,81 +5,49 @@ Integrates with the VibePro prompt optimization system.
 """
 
 import argparse
-import asyncio
-import importlib.util
 import json
+import os
 import sys
-from datetime import datetime
+from collections.abc import Iterator
 from pathlib import Path
-from typing import TypedDict, cast
+from typing import IO, Any, TypedDict, cast
 
-from prompt_optimizer.application.ports import (
-    MLFeatures,
-    OptimizationPattern,
-    TemporalDatabasePort,
-)
-from prompt_optimizer.domain.entities import Prompt, PromptOptimizationSession
+# The prompt optimizer stack, asyncio and tiktoken are imported only once a command
+# runs, so --help and argument errors return immediately
 
-# Add the prompt optimizer to the path
+# Directory containing the prompt optimizer package
 LIBS_ROOT = Path(__file__).parent.parent / "libs"
-sys.path.append(str(LIBS_ROOT))
 
-# Prefer a PEP8-friendly module directory name; fall back to the
-# generated hyphenated layout for backwards compatibility.
-PROMPT_OPTIMIZER_ROOT = LIBS_ROOT / "prompt_optimizer"
-if not PROMPT_OPTIMIZER_ROOT.exists():
-    PROMPT_OPTIMIZER_ROOT = LIBS_ROOT / "prompt-optimizer"
 
-if PROMPT_OPTIMIZER_ROOT.exists():
+def load_prompt_optimizer() -> None:
+    """Make the ``prompt_optimizer`` package importable.
+
+    Prefer the PEP8-friendly module directory name; fall back to the generated
+    hyphenated layout for backwards compatibility.
+    """
+    if str(LIBS_ROOT) not in sys.path:
+        sys.path.append(str(LIBS_ROOT))
+
+    legacy_root = LIBS_ROOT / "prompt-optimizer"
+    if (
+        "prompt_optimizer" in sys.modules
+        or (LIBS_ROOT / "prompt_optimizer").exists()
+        or not legacy_root.exists()
+    ):
+        return
+
+    import importlib.util
+
     spec = importlib.util.spec_from_file_location(
         "prompt_optimizer",
-        PROMPT_OPTIMIZER_ROOT / "__init__.py",
-        submodule_search_locations=[str(PROMPT_OPTIMIZER_ROOT)],
+        legacy_root / "__init__.py",
+        submodule_search_locations=[str(legacy_root)],
     )
     if spec and spec.loader:
         module = importlib.util.module_from_spec(spec)
         sys.modules["prompt_optimizer"] = module
         spec.loader.exec_module(module)
 
-from prompt_optimizer.application.use_cases import (  # type: ignore[import-untyped] # noqa: E402
-    AnalyzePromptCommand,
-    AnalyzePromptUseCase,
-    OptimizePromptCommand,
-    OptimizePromptUseCase,
-)
-from prompt_optimizer.domain.entities import ModelType, OptimizationGoal  # noqa: E402
-from prompt_optimizer.domain.services import (  # noqa: E402
-    PromptAnalyzer,
-    PromptFeatureExtractor,
-    PromptOptimizer,
-)
-from prompt_optimizer.infrastructure.adapters import (  # noqa: E402
-    InMemoryPromptRepository,
-    TiktokenAdapter,
-)
-from prompt_optimizer.infrastructure.temporal_db import (  # noqa: E402
-    SimpleMLModelAdapter,
-    SimpleNotificationAdapter,
-)
-
-
-class MockTemporalDatabase(TemporalDatabasePort):
-    async def store_prompt_analysis(self, prompt: Prompt, timestamp: datetime) -> None:
-        pass
-
-    async def get_similar_prompts(
-        self, features: MLFeatures, similarity_threshold: float = 0.7
-    ) -> list[Prompt]:
-        return []
-
-    async def get_optimization_patterns(
-        self, goal: OptimizationGoal, days_back: int = 90
-    ) -> list[OptimizationPattern]:
-        return []
-
-    async def store_optimization_session(self, session: PromptOptimizationSession) -> None:
-        pass
-
 
 class TokenCountDict(TypedDict):
     total: int
@@ -145,25 +113,51 @@ class OptimizationResultDict(TypedDict):
 class PromptOptimizerCLI:
     """CLI interface for the prompt optimization system."""
 
-    def __init__(self) -> None:
-        self.token_counter = TiktokenAdapter()
+    def __init__(self, cache_db: str | None = None) -> None:
+        load_prompt_optimizer()
+        from prompt_optimizer.application.use_cases import (
+            AnalyzePromptUseCase,
+            CachedAnalyzePromptUseCase,
+            OptimizePromptUseCase,
+        )
+        from prompt_optimizer.domain.services import (
+            PromptAnalyzer,
+            PromptFeatureExtractor,
+            PromptOptimizer,
+        )
+        from prompt_optimizer.infrastructure.adapters import (
+            IncrementalTiktokenAdapter,
+            InMemoryPromptRepository,
+            SimpleMLModelAdapter,
+            SimpleNotificationAdapter,
+            SimpleTemporalDatabaseAdapter,
+        )
+        from prompt_optimizer.infrastructure.analysis_cache import TieredAnalysisCache
+
+        # Optimized variants share most of the original prompt, so reuse its prefix counts;
+        # tiktoken and its encodings are loaded on the first count that needs them
+        self.token_counter = IncrementalTiktokenAdapter()
         self.prompt_repository = InMemoryPromptRepository()
         self.ml_model = SimpleMLModelAdapter()
         self.notification = SimpleNotificationAdapter()
-        self.temporal_db = MockTemporalDatabase()
+        self.temporal_db = SimpleTemporalDatabaseAdapter()
 
         # Domain services
         self.feature_extractor = PromptFeatureExtractor()
         self.analyzer = PromptAnalyzer(self.feature_extractor)
         self.optimizer = PromptOptimizer(self.analyzer)
 
-        # Use cases
-        self.analyze_use_case = AnalyzePromptUseCase(
-            self.token_counter,
-            self.prompt_repository,
-            self.temporal_db,
-            self.feature_extractor,
-            self.analyzer,
+        # Use cases; repeated content is analyzed once (persisted across runs with cache_db)
+        self.analysis_cache = TieredAnalysisCache(db_path=cache_db)
+        self.analyze_use_case = CachedAnalyzePromptUseCase(
+            AnalyzePromptUseCase(
+                self.token_counter,
+                self.prompt_repository,
+                self.temporal_db,
+                self.feature_extractor,
+                self.analyzer,
+            ),
+            self.analysis_cache,
         )
 
         self.optimize_use_case = OptimizePromptUseCase(
@@ -186,6 +180,15 @@ class PromptOptimizerCLI:
         except Exception as e:
             return {"error": f"Error reading file: {e}"}
 
+        return await self.analyze_prompt_content(file_path, content, model)
+
+    async def analyze_prompt_content(
+        self, file_path: str, content: str, model: str = "gpt-4"
+    ) -> AnalysisResultDict | ErrorDict:
+        """Analyze already loaded prompt content and return detailed results."""
+        from prompt_optimizer.application.use_cases import AnalyzePromptCommand
+        from prompt_optimizer.domain.entities import ModelType
+
         try:
             model_type = ModelType(model)
         except ValueError:
@@ -257,6 +260,9 @@ class PromptOptimizerCLI:
         self, file_path: str, goal: str = "effectiveness", model: str = "gpt-4"
     ) -> OptimizationResultDict | ErrorDict:
         """Optimize a prompt file and return the results."""
+        from prompt_optimizer.application.use_cases import OptimizePromptCommand
+        from prompt_optimizer.domain.entities import ModelType, OptimizationGoal
+
         try:
             with open(file_path, encoding="utf-8") as f:
                 content = f.read()
@@ -375,7 +381,415 @@ def format_output(
         return ""
 
 
-async def main() -> None:
+# Files picked up when a directory is given
+DEFAULT_INCLUDE = ("*.md", "*.txt")
+_GLOB_CHARS = frozenset("*?[")
+
+# Per-process CLI reused across the files a batch worker handles, keeping caches warm
+_worker: tuple[Any, PromptOptimizerCLI] | None = None
+
+
+def is_batch_request(paths: list[str]) -> bool:
+    """Whether ``paths`` name more than one file, a directory or a glob."""
+    return len(paths) != 1 or bool(_GLOB_CHARS.intersection(paths[0])) or Path(paths[0]).is_dir()
+
+
+def resolve_prompt_files(paths: list[str], include: tuple[str, ...] = DEFAULT_INCLUDE) -> list[str]:
+    """Expand directories and globs into files, de-duplicated in first-seen order.
+
+    Plain paths are kept even when missing so they are reported as failures.
+    """
+    import glob
+
+    candidates: list[str] = []
+    for path in paths:
+        if _GLOB_CHARS.intersection(path):
+            candidates.extend(sorted(glob.glob(path, recursive=True)))
+        elif Path(path).is_dir():
+            candidates.extend(
+                sorted(
+                    str(match)
+                    for pattern in include
+                    for match in Path(path).rglob(pattern)
+                    if match.is_file()
+                )
+            )
+        else:
+            candidates.append(path)
+
+    seen: set[Path] = set()
+    files = []
+    for candidate in candidates:
+        key = Path(candidate).resolve()
+        if key not in seen and not Path(candidate).is_dir():
+            seen.add(key)
+            files.append(candidate)
+    return files
+
+
+def _start_worker(cache_db: str | None) -> None:
+    """Create this process's event loop and CLI, reused for every file it handles."""
+    global _worker
+    import asyncio
+
+    _worker = (asyncio.Runner(), PromptOptimizerCLI(cache_db=cache_db))
+
+
+def _start_pool_worker(cache_db: str | None) -> None:
+    """Pool initializer: start the worker and close it when the process exits."""
+    from multiprocessing.util import Finalize
+
+    _start_worker(cache_db)
+    # atexit handlers do not run in forked pool workers; multiprocessing finalizers do
+    Finalize(None, _close_worker, exitpriority=0)
+
+
+def _close_worker() -> None:
+    """Close the event loop and analysis cache opened by :func:`_start_worker`."""
+    global _worker
+    if _worker is None:
+        return
+    runner, cli = _worker
+    _worker = None
+    try:
+        runner.close()
+    finally:
+        cli.analysis_cache.close()
+
+
+def process_file(file_path: str, options: dict[str, Any]) -> dict[str, Any]:
+    """Analyze or optimize one file with this process's CLI, capturing any failure."""
+    import time
+
+    start = time.perf_counter()
+    record: dict[str, Any] = {"file": file_path, "ok": False, "elapsed_ms": None}
+    try:
+        if _worker is None:
+            _start_worker(options["cache_db"])
+        runner, cli = _worker
+        if options["command"] == "optimize":
+            result = runner.run(
+                cli.optimize_prompt_file(file_path, options["goal"], options["model"])
+            )
+        else:
+            result = runner.run(cli.analyze_prompt_file(file_path, options["model"]))
+        record.update(result)
+        record["ok"] = "error" not in result
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return record
+
+
+def run_batch(
+    files: list[str],
+    options: dict[str, Any],
+    *,
+    workers: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield one result record per file, in completion order.
+
+    ``workers=1`` runs in-process, which is easier to debug. Each process keeps one
+    event loop and CLI for all of its files and closes them when it is done.
+    """
+    if workers == 1:
+        try:
+            for file_path in files:
+                yield process_file(file_path, options)
+        finally:
+            _close_worker()
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_start_pool_worker, initargs=(options["cache_db"],)
+    ) as pool:
+        futures = {pool.submit(process_file, file_path, options): file_path for file_path in files}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # The worker process itself died (e.g. BrokenProcessPool)
+                yield {
+                    "file": futures[future],
+                    "ok": False,
+                    "error": f"{type(e).__name__}: {e}",
+                    "elapsed_ms": None,
+                }
+
+
+def _distribution(values: list[float]) -> dict[str, float] | None:
+    """Summarize ``values`` as min, quartiles, max and mean."""
+    if not values:
+        return None
+    import statistics
+
+    ordered = sorted(values)
+    quartiles = statistics.quantiles(ordered, n=4) if len(ordered) > 1 else ordered * 3
+    return {
+        "min": round(ordered[0], 3),
+        "p25": round(quartiles[0], 3),
+        "median": round(quartiles[1], 3),
+        "p75": round(quartiles[2], 3),
+        "max": round(ordered[-1], 3),
+        "mean": round(statistics.fmean(ordered), 3),
+    }
+
+
+def summarize_batch(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Aggregate token totals, cost and score distributions of successful records."""
+    analyses = [record["analysis"] for record in records if record.get("analysis")]
+    optimizations = [record["optimization"] for record in records if record.get("optimization")]
+
+    summary: dict[str, Any] = {}
+    if analyses:
+        summary["total_tokens"] = sum(a["token_count"]["total"] for a in analyses)
+        summary["estimated_cost"] = round(
+            sum(a["token_count"]["estimated_cost"] for a in analyses), 6
+        )
+        summary["effectiveness"] = {
+            score: _distribution([a["effectiveness"][score] for a in analyses])
+            for score in ("overall", "clarity", "specificity", "completeness")
+        }
+    if optimizations:
+        summary["token_savings"] = sum(o["token_savings"] for o in optimizations)
+        summary["effectiveness_improvement"] = _distribution(
+            [o["effectiveness_improvement"] for o in optimizations]
+        )
+    return summary
+
+
+def write_batch(
+    files: list[str],
+    options: dict[str, Any],
+    stream: IO[str],
+    *,
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """Stream NDJSON records to ``stream`` and return aggregate statistics."""
+    import time
+
+    start = time.perf_counter()
+    records = []
+    for record in run_batch(files, options, workers=workers):
+        stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        stream.flush()
+        records.append(record)
+
+    succeeded = sum(1 for record in records if record["ok"])
+    return {
+        "files": len(files),
+        "succeeded": succeeded,
+        "failed": len(records) - succeeded,
+        "wall_ms": round((time.perf_counter() - start) * 1000, 3),
+        **summarize_batch(records),
+    }
+
+
+class PromptWatcher:
+    """Tracks prompt files and reports those whose content changed since the last scan.
+
+    Files are re-read only when their modification time or size changed, and reported
+    only when the hash of their content changed.
+    """
+
+    def __init__(self, paths: list[str], include: tuple[str, ...] = DEFAULT_INCLUDE) -> None:
+        self.paths = paths
+        self.include = include
+        # file -> ((mtime_ns, size), content hash)
+        self._files: dict[str, tuple[tuple[int, int], str]] = {}
+
+    def scan(self) -> list[tuple[str, str, str | None]]:
+        """Return ``(file, event, content)`` for added, changed and removed files."""
+        import hashlib
+
+        events: list[tuple[str, str, str | None]] = []
+        present = set()
+        for file_path in resolve_prompt_files(self.paths, self.include):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            present.add(file_path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            known = self._files.get(file_path)
+            if known is not None and known[0] == signature:
+                continue
+
+            try:
+                content = Path(file_path).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            digest = hashlib.sha256(content.encode()).hexdigest()
+            self._files[file_path] = (signature, digest)
+            if known is None:
+                events.append((file_path, "added", content))
+            elif known[1] != digest:
+                events.append((file_path, "changed", content))
+
+        for file_path in [file_path for file_path in self._files if file_path not in present]:
+            del self._files[file_path]
+            events.append((file_path, "removed", None))
+        return events
+
+    def directories(self) -> set[str]:
+        """Directories whose changes may add, change or remove a watched file."""
+        directories = {str(Path(file_path).parent) for file_path in self._files}
+        for path in self.paths:
+            if _GLOB_CHARS.intersection(path):
+                # The directory above the first component containing a wildcard
+                parts = Path(path).parts
+                first = next(i for i, part in enumerate(parts) if _GLOB_CHARS.intersection(part))
+                root = Path(*parts[:first]) if first else Path(".")
+            elif Path(path).is_dir():
+                root = Path(path)
+            else:
+                root = Path(path).parent
+            if root.is_dir():
+                directories.add(str(root))
+        return directories
+
+
+class InotifyWakeup:
+    """Waits for file system events in directories using Linux inotify (via ctypes)."""
+
+    # IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE: complete writes
+    # and atomic replaces, but not the partial writes IN_MODIFY would report
+    _MASK = 0x008 | 0x040 | 0x080 | 0x100 | 0x200
+    _IN_NONBLOCK_CLOEXEC = 0o4000 | 0o2000000
+
+    def __init__(self, libc: Any, fd: int) -> None:
+        self._libc = libc
+        self._fd = fd
+        self._watched: set[str] = set()
+
+    @classmethod
+    def create(cls) -> "InotifyWakeup | None":
+        """Return a wakeup source, or None where inotify is unavailable."""
+        if not sys.platform.startswith("linux"):
+            return None
+        import ctypes
+
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(cls._IN_NONBLOCK_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        return cls(libc, fd) if fd >= 0 else None
+
+    def watch(self, directories: set[str]) -> None:
+        """Also watch ``directories`` (already watched ones are skipped)."""
+        for directory in directories - self._watched:
+            if self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self._MASK) >= 0:
+                self._watched.add(directory)
+
+    def wait(self, timeout: float, settle: float = 0.01) -> bool:
+        """Block until an event arrives or ``timeout`` passes; True if events arrived.
+
+        Events arriving within ``settle`` seconds of each other are coalesced.
+        """
+        import select
+
+        if not select.select([self._fd], [], [], timeout)[0]:
+            return False
+        while select.select([self._fd], [], [], settle)[0]:
+            try:
+                os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                pass
+        return True
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def format_watch_event(
+    file_path: str,
+    event: str,
+    result: AnalysisResultDict | ErrorDict | None,
+    previous: AnalysisDict | None,
+) -> str:
+    """Format one watch update as a single human-readable line."""
+    if result is None:
+        return f"🗑️  {file_path}: {event}"
+    if "error" in result:
+        return f"❌ {file_path}: {cast(ErrorDict, result)['error']}"
+
+    analysis = cast(AnalysisResultDict, result)["analysis"]
+    tokens = analysis["token_count"]["total"]
+    scores = analysis["effectiveness"]
+    line = f"{'🔄' if event == 'changed' else '📄'} {file_path}: {tokens:,} tokens"
+    if previous is not None:
+        line += f" ({tokens - previous['token_count']['total']:+,})"
+    line += f" · overall {scores['overall']:.1f}"
+    if previous is not None:
+        line += f" ({scores['overall'] - previous['effectiveness']['overall']:+.1f})"
+    return line + (
+        f" · clarity {scores['clarity']:.1f} · specificity {scores['specificity']:.1f}"
+        f" · completeness {scores['completeness']:.1f}"
+    )
+
+
+def run_watch_command(args: argparse.Namespace) -> None:
+    """Analyze the watched files, then re-analyze each one whenever its content changes."""
+    import asyncio
+    import time
+
+    watcher = PromptWatcher(args.paths, tuple(args.include or DEFAULT_INCLUDE))
+    wakeup = None if args.poll else InotifyWakeup.create()
+    print(
+        f"👀 Watching {', '.join(args.paths)} ({'inotify' if wakeup else 'polling'});"
+        " press Ctrl+C to stop",
+        file=sys.stderr,
+        flush=True,
+    )
+
+    # One warm CLI and event loop for the whole session: encodings, lookup tables and the
+    # prefix and analysis caches persist between edits
+    cli = PromptOptimizerCLI(cache_db=args.cache_db)
+    latest: dict[str, AnalysisDict] = {}
+    try:
+        with asyncio.Runner() as runner:
+            while True:
+                for file_path, event, content in watcher.scan():
+                    start = time.perf_counter()
+                    result: AnalysisResultDict | ErrorDict | None = None
+                    if content is not None:
+                        result = runner.run(
+                            cli.analyze_prompt_content(file_path, content, args.model)
+                        )
+                    elapsed_ms = round((time.perf_counter() - start) * 1000, 3)
+
+                    if args.format == "json":
+                        record = {"file": file_path, "event": event, "elapsed_ms": elapsed_ms}
+                        print(json.dumps({**record, **(result or {})}, ensure_ascii=False))
+                    else:
+                        previous = latest.get(file_path)
+                        line = format_watch_event(file_path, event, result, previous)
+                        print(f"{line} [{elapsed_ms:.1f}ms]" if content is not None else line)
+                    sys.stdout.flush()
+
+                    if result is not None and "analysis" in result:
+                        latest[file_path] = cast(AnalysisResultDict, result)["analysis"]
+                    else:
+                        latest.pop(file_path, None)
+
+                # inotify wakes up on the first event; --interval bounds the time between
+                # scans either way (e.g. files created in brand-new subdirectories)
+                if wakeup is not None:
+                    wakeup.watch(watcher.directories())
+                    wakeup.wait(args.interval)
+                else:
+                    time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if wakeup is not None:
+            wakeup.close()
+
+
+def main() -> None:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
         description="Enhanced token counter with ML-powered prompt optimization",
@@ -393,6 +807,12 @@ Examples:
 
   # Use different model
   python measure_tokens_enhanced.py analyze prompt.txt --model gpt-4-turbo
+
+  # Audit a whole tree in parallel (NDJSON per file, summary on stderr)
+  python measure_tokens_enhanced.py analyze .github/prompts 'docs/**/*.prompt.md' --workers 4
+
+  # Re-analyze prompts as they are edited
+  python measure_tokens_enhanced.py watch .github/prompts
 """,
     )
 
@@ -400,7 +820,9 @@ Examples:
 
     # Analyze command
     analyze_parser = subparsers.add_parser("analyze", help="Analyze prompt effectiveness")
-    analyze_parser.add_argument("file", help="Prompt file to analyze")
+    analyze_parser.add_argument(
+        "paths", nargs="+", metavar="PATH", help="Prompt files, directories or globs to analyze"
+    )
     analyze_parser.add_argument(
         "--model",
         default="gpt-4",
@@ -410,10 +832,15 @@ Examples:
     analyze_parser.add_argument(
         "--format", default="human", choices=["human", "json"], help="Output format"
     )
+    analyze_parser.add_argument(
+        "--cache-db", help="SQLite file caching analysis results across runs"
+    )
 
     # Optimize command
     optimize_parser = subparsers.add_parser("optimize", help="Optimize prompt for specific goal")
-    optimize_parser.add_argument("file", help="Prompt file to optimize")
+    optimize_parser.add_argument(
+        "paths", nargs="+", metavar="PATH", help="Prompt files, directories or globs to optimize"
+    )
     optimize_parser.add_argument(
         "--goal",
         default="effectiveness",
@@ -429,6 +856,47 @@ Examples:
     optimize_parser.add_argument(
         "--format", default="human", choices=["human", "json"], help="Output format"
     )
+    optimize_parser.add_argument(
+        "--cache-db", help="SQLite file caching analysis results across runs"
+    )
+
+    # Watch command
+    watch_parser = subparsers.add_parser(
+        "watch", help="Re-analyze prompt files whenever their content changes"
+    )
+    watch_parser.add_argument(
+        "paths", nargs="+", metavar="PATH", help="Prompt files, directories or globs to watch"
+    )
+    watch_parser.add_argument(
+        "--model",
+        default="gpt-4",
+        choices=["gpt-4", "gpt-4-turbo", "gpt-3.5-turbo", "claude-3-opus", "claude-3-sonnet"],
+        help="Model to use for token counting",
+    )
+    watch_parser.add_argument(
+        "--format", default="human", choices=["human", "json"], help="Output format"
+    )
+    watch_parser.add_argument("--cache-db", help="SQLite file caching analysis results across runs")
+    watch_parser.add_argument(
+        "--interval", type=float, default=1.0, help="Maximum seconds between scans"
+    )
+    watch_parser.add_argument(
+        "--poll", action="store_true", help="Poll modification times even if inotify works"
+    )
+
+    for command_parser in (analyze_parser, optimize_parser):
+        command_parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="Worker processes for several files (1 = in-process)",
+        )
+    for command_parser in (analyze_parser, optimize_parser, watch_parser):
+        command_parser.add_argument(
+            "--include",
+            action="append",
+            help=f"File pattern searched in directories (repeatable; default {DEFAULT_INCLUDE})",
+        )
 
     args = parser.parse_args()
 
@@ -436,26 +904,59 @@ Examples:
         parser.print_help()
         return
 
-    cli = PromptOptimizerCLI()
-    result: AnalysisResultDict | OptimizationResultDict | ErrorDict
+    if args.command == "watch":
+        run_watch_command(args)
+        return
 
-    try:
-        if args.command == "analyze":
-            result = await cli.analyze_prompt_file(args.file, args.model)
-        elif args.command == "optimize":
-            result = await cli.optimize_prompt_file(args.file, args.goal, args.model)
-        else:
-            print("Unknown command")
-            return
+    if is_batch_request(args.paths):
+        run_batch_command(args)
+        return
 
-        output = format_output(result, args.format)
-        print(output)
+    import asyncio
 
+    try:
+        asyncio.run(run_command(args))
     except KeyboardInterrupt:
         print("\n❌ Operation cancelled")
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
 
 
+def run_batch_command(args: argparse.Namespace) -> None:
+    """Process every resolved file, streaming NDJSON and printing a summary to stderr."""
+    files = resolve_prompt_files(args.paths, tuple(args.include or DEFAULT_INCLUDE))
+    if not files:
+        print("Error: no prompt files matched", file=sys.stderr)
+        sys.exit(1)
+
+    options = {
+        "command": args.command,
+        "model": args.model,
+        "goal": getattr(args, "goal", None),
+        "cache_db": args.cache_db,
+    }
+    workers = max(1, min(args.workers or 1, len(files)))
+    summary = write_batch(files, options, sys.stdout, workers=workers)
+
+    print(json.dumps(summary), file=sys.stderr)
+    sys.exit(1 if summary["failed"] else 0)
+
+
+async def run_command(args: argparse.Namespace) -> None:
+    """Run the parsed command on a single file and print its result."""
+    cli = PromptOptimizerCLI(cache_db=args.cache_db)
+    result: AnalysisResultDict | OptimizationResultDict | ErrorDict
+
+    if args.command == "analyze":
+        result = await cli.analyze_prompt_file(args.paths[0], args.model)
+    elif args.command == "optimize":
+        result = await cli.optimize_prompt_file(args.paths[0], args.goal, args.model)
+    else:
+        print("Unknown command")
+        return
+
+    print(format_output(result, args.format))
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
@@ -6,9 +6,10 @@ This module provides Python access to the Rust-based temporal database
 implementation for storing specifications, architectural patterns, and decisions.
 """
 
-from .repository import TemporalRepository
+from .repository import InMemoryTemporalRepository, TemporalRepository
 from .types import (
     ArchitecturalPattern,
+    ChangeEvent,
     ChangeType,
     DecisionOption,
     DecisionPoint,
@@ -16,13 +17,17 @@ from .types import (
     PatternType,
     SpecificationChange,
     SpecificationRecord,
+    SpecificationSummary,
     SpecificationType,
 )
 
 __all__ = [
     "TemporalRepository",
+    "InMemoryTemporalRepository",
     "SpecificationRecord",
+    "SpecificationSummary",
     "SpecificationChange",
+    "ChangeEvent",
     "ArchitecturalPattern",
     "DecisionPoint",
     "PatternRecommendation",
@@ -0,0 +1,445 @@
+# mypy: ignore-errors
+"""Historical backtest harness for ``ArchitecturalPatternRecognizer``.
+
+Slides a time cursor across the decision history of an existing temporal database and,
+at every step, runs ``generate_recommendations`` in dry-run mode against the decisions
+visible at that time (``as_of``). Each configuration of the recognizer is scored on:
+
+* wall time and number of SQL statements per step;
+* acceptance rate: the share of later decisions (within ``horizon_days`` of the step)
+  on a recommended decision point that were made with high confidence;
+* feedback acceptance rate: accept/dismiss feedback recorded within the horizon on
+  stored recommendations with the same decision point and pattern.
+
+Architectural patterns carry no creation time and are treated as static reference
+data, so every step sees the current pattern catalogue. The command line opens the
+database read-only and refuses a missing file or one whose schema predates the current
+repository, so it is never modified::
+
+    python -m temporal_db.python.backtest --db-path ./temporal_db/project_specs \\
+        --config strict:minimum_confidence=0.7 --config decayed:half_life_days=14
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sqlite3
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, fields
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from .patterns import ArchitecturalPatternRecognizer
+from .repository import TemporalRepository, initialize_temporal_database
+from .scoring import ScoringModel
+from .types import ChangeType, PatternRecommendation
+
+RESULT_SCHEMA_VERSION = 1
+
+_SELECTED_CONFIDENCE = 0.7
+
+
+@dataclass(frozen=True)
+class BacktestConfig:
+    """Recognizer settings evaluated by the backtest."""
+
+    name: str
+    minimum_confidence: float = 0.55
+    lookback_days: int = 45
+    max_recommendations: int = 5
+    half_life_days: float | None = None
+    prior_strength: float = 0.0
+    feedback_weight: float = 0.0
+
+    def scoring_model(self) -> ScoringModel | None:
+        """Return the confidence model, or None for the default one."""
+        model = ScoringModel(
+            half_life_days=self.half_life_days,
+            prior_strength=self.prior_strength,
+            feedback_weight=self.feedback_weight,
+        )
+        return None if model == ScoringModel() else model
+
+    @classmethod
+    def parse(cls, spec: str) -> BacktestConfig:
+        """Parse ``name[:key=value,...]``, e.g. ``strict:minimum_confidence=0.7``."""
+        name, _, options = spec.partition(":")
+        if not name:
+            raise ValueError(f"Backtest config needs a name: {spec!r}")
+
+        types = {field.name: field.type for field in fields(cls) if field.name != "name"}
+        values: dict[str, Any] = {}
+        for option in filter(None, options.split(",")):
+            key, _, raw = option.partition("=")
+            key = key.strip()
+            if key not in types:
+                raise ValueError(
+                    f"Unknown backtest option '{key}'; expected one of {sorted(types)}"
+                )
+            values[key] = float(raw) if types[key].startswith("float") else int(raw)
+        return cls(name=name, **values)
+
+
+class QueryCounter:
+    """Count SQL statements executed on a connection while active."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+        self.count = 0
+
+    def _trace(self, _statement: str) -> None:
+        self.count += 1
+
+    def __enter__(self) -> QueryCounter:
+        self._connection.set_trace_callback(self._trace)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._connection.set_trace_callback(None)
+
+
+def _sqlite_time(moment: datetime) -> str:
+    return moment.astimezone(UTC).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def history_bounds(connection: sqlite3.Connection) -> tuple[datetime, datetime] | None:
+    """Return the first and last decision timestamps, or None without decisions."""
+    first, last = connection.execute(
+        """
+        SELECT MIN(datetime(timestamp)), MAX(datetime(timestamp))
+        FROM changes
+        WHERE change_type = ?
+        """,
+        (ChangeType.DECISION.value,),
+    ).fetchone()
+    if first is None:
+        return None
+    return (
+        datetime.fromisoformat(first).replace(tzinfo=UTC),
+        datetime.fromisoformat(last).replace(tzinfo=UTC),
+    )
+
+
+def time_cursors(start: datetime, end: datetime, step: timedelta) -> list[datetime]:
+    """Return cursor positions from ``start`` to ``end`` inclusive."""
+    if step <= timedelta(0):
+        raise ValueError("Backtest step must be positive")
+
+    cursors = []
+    cursor = start
+    while cursor < end:
+        cursors.append(cursor)
+        cursor += step
+    cursors.append(end)
+    return cursors
+
+
+def _score_outcomes(
+    connection: sqlite3.Connection,
+    recommendations: list[PatternRecommendation],
+    as_of: datetime,
+    horizon_days: int,
+) -> dict[str, int]:
+    outcomes = {
+        "future_decisions": 0,
+        "future_selected": 0,
+        "feedback_accepted": 0,
+        "feedback_dismissed": 0,
+    }
+    if not recommendations:
+        return outcomes
+
+    window = {
+        "start": _sqlite_time(as_of),
+        "end": _sqlite_time(as_of + timedelta(days=horizon_days)),
+    }
+    decisions = connection.execute(
+        """
+        SELECT COUNT(*), COALESCE(SUM(CASE WHEN confidence > :selected THEN 1 ELSE 0 END), 0)
+        FROM changes
+        WHERE change_type = :change_type
+          AND field IN (SELECT value FROM json_each(:points))
+          AND datetime(timestamp) > datetime(:start)
+          AND datetime(timestamp) <= datetime(:end)
+        """,
+        {
+            **window,
+            "selected": _SELECTED_CONFIDENCE,
+            "change_type": ChangeType.DECISION.value,
+            "points": json.dumps(sorted({rec.decision_point for rec in recommendations})),
+        },
+    ).fetchone()
+    outcomes["future_decisions"], outcomes["future_selected"] = decisions
+
+    feedback = connection.execute(
+        """
+        SELECT f.action, COUNT(*)
+        FROM recommendation_feedback AS f
+        JOIN pattern_recommendations AS r ON r.id = f.recommendation_id
+        JOIN json_each(:pairs) AS p
+          ON r.decision_point = json_extract(p.value, '$[0]')
+         AND r.pattern_name = json_extract(p.value, '$[1]')
+        WHERE datetime(f.created_at) > datetime(:start)
+          AND datetime(f.created_at) <= datetime(:end)
+        GROUP BY f.action
+        """,
+        {
+            **window,
+            "pairs": json.dumps(
+                sorted({(rec.decision_point, rec.pattern_name) for rec in recommendations})
+            ),
+        },
+    ).fetchall()
+    for action, count in feedback:
+        if action == "accept":
+            outcomes["feedback_accepted"] = count
+        elif action == "dismiss":
+            outcomes["feedback_dismissed"] = count
+    return outcomes
+
+
+def _ratio(numerator: int, denominator: int) -> float | None:
+    return round(numerator / denominator, 4) if denominator else None
+
+
+def _summarize(steps: list[dict[str, Any]]) -> dict[str, Any]:
+    wall = sorted(step["wall_ms"] for step in steps)
+    queries = [step["queries"] for step in steps]
+    totals = {
+        key: sum(step[key] for step in steps)
+        for key in (
+            "recommendations",
+            "future_decisions",
+            "future_selected",
+            "feedback_accepted",
+            "feedback_dismissed",
+        )
+    }
+    return {
+        "steps": len(steps),
+        "total_wall_ms": round(sum(wall), 4),
+        "median_wall_ms": round(statistics.median(wall), 4),
+        "max_wall_ms": round(wall[-1], 4),
+        "total_queries": sum(queries),
+        "mean_queries_per_step": round(statistics.fmean(queries), 2),
+        **totals,
+        "acceptance_rate": _ratio(totals["future_selected"], totals["future_decisions"]),
+        "feedback_acceptance_rate": _ratio(
+            totals["feedback_accepted"],
+            totals["feedback_accepted"] + totals["feedback_dismissed"],
+        ),
+    }
+
+
+async def backtest_config(
+    repository: TemporalRepository,
+    config: BacktestConfig,
+    cursors: list[datetime],
+    *,
+    horizon_days: int = 30,
+) -> dict[str, Any]:
+    """Replay one recognizer configuration over ``cursors``."""
+    connection = repository.connection
+    if connection is None:
+        raise RuntimeError("Database not initialized")
+
+    # Retention only affects stored recommendations, which dry runs never write
+    recognizer = ArchitecturalPatternRecognizer(
+        repository,
+        minimum_confidence=config.minimum_confidence,
+        max_recommendations=config.max_recommendations,
+        scoring_model=config.scoring_model(),
+        use_cache=False,
+    )
+
+    steps = []
+    for as_of in cursors:
+        with QueryCounter(connection) as counter:
+            start = time.perf_counter()
+            result = await recognizer.generate_recommendations(
+                lookback_days=config.lookback_days, dry_run=True, as_of=as_of
+            )
+            wall_ms = (time.perf_counter() - start) * 1000
+
+        steps.append(
+            {
+                "as_of": as_of.isoformat(),
+                "wall_ms": round(wall_ms, 4),
+                "queries": counter.count,
+                "recommendations": len(result.recommendations),
+                "decision_points": sorted({rec.decision_point for rec in result.recommendations}),
+                **_score_outcomes(connection, result.recommendations, as_of, horizon_days),
+            }
+        )
+
+    return {"config": asdict(config), "summary": _summarize(steps), "steps": steps}
+
+
+async def run_backtest(
+    repository: TemporalRepository,
+    configs: list[BacktestConfig],
+    *,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    step_days: float = 7.0,
+    horizon_days: int = 30,
+) -> dict[str, Any]:
+    """Backtest every configuration over the same cursor positions.
+
+    ``start`` and ``end`` default to the first and last recorded decision.
+    """
+    if repository.connection is None:
+        raise RuntimeError("Database not initialized")
+    if not configs:
+        raise ValueError("At least one backtest config is required")
+
+    bounds = history_bounds(repository.connection)
+    if bounds is None and (start is None or end is None):
+        raise ValueError("The database holds no decisions to replay")
+    start = start or bounds[0]
+    end = end or bounds[1]
+    if end < start:
+        raise ValueError("Backtest end precedes its start")
+
+    cursors = time_cursors(start, end, timedelta(days=step_days))
+    results = {}
+    for config in configs:
+        if config.name in results:
+            raise ValueError(f"Duplicate backtest config name: {config.name}")
+        results[config.name] = await backtest_config(
+            repository, config, cursors, horizon_days=horizon_days
+        )
+
+    return {
+        "schema_version": RESULT_SCHEMA_VERSION,
+        "generated_at": datetime.now(UTC).isoformat(),
+        "window": {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "step_days": step_days,
+            "horizon_days": horizon_days,
+            "steps": len(cursors),
+        },
+        "configs": results,
+    }
+
+
+def _parse_datetime(value: str) -> datetime:
+    moment = datetime.fromisoformat(value)
+    return moment if moment.tzinfo else moment.replace(tzinfo=UTC)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Replay decision history through the pattern recognizer"
+    )
+    parser.add_argument(
+        "--db-path", default="temporal_db/project_specs", help="Database path (no suffix)"
+    )
+    parser.add_argument(
+        "--config",
+        action="append",
+        type=BacktestConfig.parse,
+        help="Recognizer config as name[:key=value,...] (repeatable)",
+    )
+    parser.add_argument("--start", type=_parse_datetime, help="First cursor (ISO 8601)")
+    parser.add_argument("--end", type=_parse_datetime, help="Last cursor (ISO 8601)")
+    parser.add_argument("--step-days", type=float, default=7.0, help="Cursor step in days")
+    parser.add_argument(
+        "--horizon-days", type=int, default=30, help="Days after each step used for scoring"
+    )
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    return parser
+
+
+def _table_columns(connection: sqlite3.Connection) -> set[tuple[str, str]]:
+    tables = [
+        row[0]
+        for row in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        )
+    ]
+    return {
+        (table, row[0])
+        for table in tables
+        for row in connection.execute("SELECT name FROM pragma_table_info(?)", (table,))
+    }
+
+
+async def open_read_only(db_path: str) -> TemporalRepository:
+    """Open an existing temporal database without any write access.
+
+    Raises:
+        FileNotFoundError: If there is no database at ``db_path``.
+        ValueError: If the database lacks tables or columns of the current schema.
+    """
+    repository = TemporalRepository(db_path)
+    db_file = repository.db_file.resolve()
+    if not db_file.is_file():
+        raise FileNotFoundError(f"No temporal database at {db_file}")
+
+    connection = sqlite3.connect(f"{db_file.as_uri()}?mode=ro", uri=True)
+    connection.row_factory = sqlite3.Row
+    repository.connection = connection
+
+    reference = await initialize_temporal_database(":memory:")
+    try:
+        missing = _table_columns(reference.connection) - _table_columns(connection)
+    finally:
+        await reference.close()
+    if missing:
+        connection.close()
+        columns = ", ".join(f"{table}.{column}" for table, column in sorted(missing))
+        raise ValueError(
+            f"{db_file} uses an older schema (missing {columns}); "
+            "open it once with initialize_temporal_database to upgrade it"
+        )
+    return repository
+
+
+async def _main(args: argparse.Namespace) -> dict[str, Any]:
+    repository = await open_read_only(args.db_path)
+    try:
+        return await run_backtest(
+            repository,
+            args.config or [BacktestConfig("default")],
+            start=args.start,
+            end=args.end,
+            step_days=args.step_days,
+            horizon_days=args.horizon_days,
+        )
+    finally:
+        await repository.close()
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+
+    try:
+        payload = asyncio.run(_main(args))
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    else:
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    for name, result in payload["configs"].items():
+        summary = result["summary"]
+        print(
+            f"{name:<20} steps={summary['steps']} wall={summary['total_wall_ms']:.1f}ms "
+            f"queries={summary['total_queries']} acceptance={summary['acceptance_rate']}",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
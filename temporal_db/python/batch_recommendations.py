@@ -0,0 +1,172 @@
+# mypy: ignore-errors
+"""Generate pattern recommendations for many temporal databases in parallel.
+
+Each database is processed by ``export_recommendations`` in a worker process, and one
+NDJSON line is written per database as soon as it finishes::
+
+    {"db": "...", "ok": true, "elapsed_ms": 41.2, "result": {...}}
+    {"db": "...", "ok": false, "elapsed_ms": 0.3, "error": "Database not found: ..."}
+
+A failing database never aborts the batch; the exit status is 1 if any failed::
+
+    python -m temporal_db.python.batch_recommendations --dry-run \\
+        --glob 'projects/*/temporal_db/project_specs.sqlite' --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import glob
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import IO, Any
+
+from .export_recommendations import (
+    add_generation_arguments,
+    export_recommendations,
+    generation_options,
+)
+
+
+def resolve_databases(paths: list[str], patterns: list[str]) -> list[str]:
+    """Expand globs and de-duplicate database paths, keeping first-seen order."""
+    candidates = list(paths)
+    for pattern in patterns:
+        candidates.extend(sorted(glob.glob(pattern, recursive=True)))
+
+    seen: set[Path] = set()
+    databases = []
+    for candidate in candidates:
+        key = Path(candidate).with_suffix(".sqlite").resolve()
+        if key not in seen:
+            seen.add(key)
+            databases.append(candidate)
+    return databases
+
+
+def export_one(db_path: str, options: dict[str, Any]) -> dict[str, Any]:
+    """Run the recommendation export for one database, capturing any failure.
+
+    ``options`` are keyword arguments of
+    :func:`~.export_recommendations.export_recommendations`.
+    """
+    start = time.perf_counter()
+    record: dict[str, Any] = {"db": db_path}
+    try:
+        # Opening a missing path would silently create an empty database
+        if not Path(db_path).with_suffix(".sqlite").exists():
+            raise FileNotFoundError(f"Database not found: {db_path}")
+
+        record["result"] = asyncio.run(export_recommendations(db_path, **options))
+        record["ok"] = True
+    except Exception as e:
+        record["ok"] = False
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return record
+
+
+def run_batch(
+    databases: list[str],
+    options: dict[str, Any],
+    *,
+    workers: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield one result record per database, in completion order.
+
+    ``workers=1`` runs in-process, which is easier to debug.
+    """
+    if workers == 1:
+        for db_path in databases:
+            yield export_one(db_path, options)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(export_one, db_path, options): db_path for db_path in databases}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # The worker process itself died (e.g. BrokenProcessPool)
+                yield {
+                    "db": futures[future],
+                    "ok": False,
+                    "error": f"{type(e).__name__}: {e}",
+                    "elapsed_ms": None,
+                }
+
+
+def write_batch(
+    databases: list[str],
+    options: dict[str, Any],
+    stream: IO[str],
+    *,
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """Stream NDJSON records to ``stream`` and return aggregate statistics."""
+    start = time.perf_counter()
+    succeeded = failed = 0
+    for record in run_batch(databases, options, workers=workers):
+        stream.write(json.dumps(record) + "\n")
+        stream.flush()
+        if record["ok"]:
+            succeeded += 1
+        else:
+            failed += 1
+
+    return {
+        "databases": len(databases),
+        "succeeded": succeeded,
+        "failed": failed,
+        "wall_ms": round((time.perf_counter() - start) * 1000, 3),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Export pattern recommendations for many temporal databases"
+    )
+    parser.add_argument("--db", action="append", default=[], help="Database base path (repeatable)")
+    parser.add_argument(
+        "--glob",
+        action="append",
+        default=[],
+        help="Glob matching database files, e.g. 'projects/*/temporal_db/*.sqlite'",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count(), help="Worker processes (1 = in-process)"
+    )
+    parser.add_argument("--output", help="Write NDJSON to this file instead of stdout")
+    add_generation_arguments(parser)
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+
+    databases = resolve_databases(args.db, args.glob)
+    if not databases:
+        print("Error: no databases given (use --db or --glob)", file=sys.stderr)
+        sys.exit(1)
+
+    options = generation_options(args)
+    workers = max(1, min(args.workers or 1, len(databases)))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as stream:
+            summary = write_batch(databases, options, stream, workers=workers)
+    else:
+        summary = write_batch(databases, options, sys.stdout, workers=workers)
+
+    print(json.dumps(summary), file=sys.stderr)
+    sys.exit(1 if summary["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,900 @@
+# mypy: ignore-errors
+"""Offline benchmark harness for the temporal database Python package.
+
+Builds a synthetic temporal database (specifications, patterns, decisions and
+recommendation feedback), times every public ``TemporalRepository`` operation plus
+``ArchitecturalPatternRecognizer.generate_recommendations``, and emits JSON whose
+scenario names are stable so results can be compared across commits::
+
+    python -m temporal_db.python.benchmark --scale medium --output bench.json
+    python -m temporal_db.python.benchmark --scale medium --compare bench.json
+
+Only the standard library is required.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import gc
+import io
+import json
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from . import serialization
+from .dump import dump_database, load_database
+from .patterns import ArchitecturalPatternRecognizer
+from .repository import TemporalRepository, initialize_temporal_database
+from .types import (
+    ArchitecturalPattern,
+    ChangeType,
+    DecisionPoint,
+    PatternRecommendation,
+    PatternType,
+    SpecificationChange,
+    SpecificationRecord,
+    SpecificationType,
+)
+
+RESULT_SCHEMA_VERSION = 1
+
+SCALES: dict[str, dict[str, int]] = {
+    "small": {"specs": 200, "patterns": 50, "decisions": 10_000, "recommendations": 100},
+    "medium": {"specs": 2_000, "patterns": 200, "decisions": 200_000, "recommendations": 1_000},
+    "large": {
+        "specs": 20_000,
+        "patterns": 1_000,
+        "decisions": 2_000_000,
+        "recommendations": 10_000,
+    },
+}
+
+_DECISION_POINTS_PER_PATTERN = 2
+_FEEDBACK_PER_RECOMMENDATION = 3
+_HISTORY_DAYS = 120
+_INSERT_BATCH = 50_000
+
+
+@dataclass
+class DatasetSize:
+    """Row counts for a synthetic dataset."""
+
+    specs: int
+    patterns: int
+    decisions: int
+    recommendations: int
+
+    @property
+    def decision_points(self) -> int:
+        return max(1, self.patterns * _DECISION_POINTS_PER_PATTERN)
+
+
+@dataclass
+class BenchmarkContext:
+    """Shared state handed to every scenario."""
+
+    repository: TemporalRepository
+    size: DatasetSize
+    rng: random.Random
+    spec_identifiers: list[str]
+    recommendation_ids: list[str]
+
+
+@dataclass
+class BenchmarkScenario:
+    """A named, repeatable timed operation."""
+
+    name: str
+    run: Callable[[BenchmarkContext], Awaitable[object]]
+    iterations: int = 20
+
+
+def _decision_point(index: int) -> str:
+    return f"decision_point_{index:05d}"
+
+
+def _sqlite_timestamp(moment: datetime) -> str:
+    """Format like SQLite's CURRENT_TIMESTAMP so ``datetime()`` filters still apply."""
+    return moment.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def generate_synthetic_data(
+    connection: sqlite3.Connection,
+    size: DatasetSize,
+    *,
+    seed: int = 1337,
+) -> tuple[list[str], list[str]]:
+    """Bulk-load a synthetic dataset into an initialized temporal database.
+
+    Rows are written with ``executemany`` in large transactions rather than through
+    the repository API, so multi-million row datasets build in seconds.
+
+    Returns:
+        The generated specification identifiers and recommendation ids.
+    """
+    rng = random.Random(seed)  # noqa: S311 - reproducible synthetic data, not security
+    now = datetime.now(UTC)
+    spec_types = [spec_type.value for spec_type in SpecificationType]
+    pattern_types = [pattern_type.value for pattern_type in PatternType]
+
+    identifiers: list[str] = []
+    spec_rows = []
+    for index in range(size.specs):
+        spec_type = spec_types[index % len(spec_types)]
+        identifier = f"{spec_type}-BENCH-{index:06d}"
+        identifiers.append(identifier)
+        timestamp = now - timedelta(seconds=rng.randint(0, _HISTORY_DAYS * 86_400))
+        content = f"# {identifier}\n\n" + "Synthetic specification body. " * rng.randint(5, 60)
+        spec_rows.append(
+            (
+                str(uuid.UUID(int=rng.getrandbits(128))),
+                spec_type,
+                identifier,
+                f"Benchmark specification {index}",
+                content,
+                json.dumps({"project": f"project-{index % 50}"}),
+                timestamp.isoformat(),
+                1 + index % 3,
+                f"author-{index % 25}",
+                json.dumps([f"MATRIX-{index % 400:04d}"]),
+                json.dumps({"source": "benchmark"}),
+                uuid.UUID(int=rng.getrandbits(128)).hex,
+            )
+        )
+
+    pattern_rows = []
+    for index in range(size.patterns):
+        pattern_rows.append(
+            (
+                str(uuid.UUID(int=rng.getrandbits(128))),
+                f"Benchmark Pattern {index}",
+                pattern_types[index % len(pattern_types)],
+                round(rng.random(), 3),
+                rng.randint(0, 500),
+                round(rng.random(), 3),
+                (now - timedelta(days=rng.randint(0, _HISTORY_DAYS))).isoformat(),
+                json.dumps({"summary": f"decision_point_{index:05d} synthetic pattern"}),
+                json.dumps([]),
+                json.dumps({"canonical_decision_point": _decision_point(index)}),
+            )
+        )
+
+    recommendation_ids: list[str] = []
+    recommendation_rows = []
+    feedback_rows = []
+    for index in range(size.recommendations):
+        recommendation_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        recommendation_ids.append(recommendation_id)
+        created_at = now - timedelta(days=rng.randint(0, _HISTORY_DAYS))
+        recommendation_rows.append(
+            (
+                recommendation_id,
+                f"Benchmark Pattern {index % max(1, size.patterns)}",
+                _decision_point(index % size.decision_points),
+                round(rng.random(), 3),
+                spec_types[index % len(spec_types)],
+                "Synthetic recommendation rationale.",
+                created_at.isoformat(),
+                (created_at + timedelta(days=90)).isoformat(),
+                json.dumps({"tags": ["benchmark", f"group-{index % 10}"]}),
+            )
+        )
+        for _ in range(_FEEDBACK_PER_RECOMMENDATION):
+            feedback_rows.append(
+                (
+                    recommendation_id,
+                    rng.choice(("accept", "dismiss")),
+                    None,
+                    _sqlite_timestamp(created_at + timedelta(hours=rng.randint(1, 72))),
+                )
+            )
+
+    with connection:
+        connection.executemany(
+            """
+            INSERT INTO specifications
+            (id, spec_type, identifier, title, content, template_variables,
+             timestamp, version, author, matrix_ids, metadata, hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            spec_rows,
+        )
+        connection.executemany(
+            """
+            INSERT INTO patterns
+            (id, pattern_name, pattern_type, context_similarity, usage_frequency,
+             success_rate, last_used, pattern_definition, examples, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            pattern_rows,
+        )
+        connection.executemany(
+            """
+            INSERT INTO pattern_recommendations
+            (id, pattern_name, decision_point, confidence, provenance, rationale,
+             created_at, expires_at, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            recommendation_rows,
+        )
+        connection.executemany(
+            """
+            INSERT INTO recommendation_feedback (recommendation_id, action, reason, created_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            feedback_rows,
+        )
+
+    remaining = size.decisions
+    while remaining > 0:
+        batch = min(remaining, _INSERT_BATCH)
+        rows = []
+        for _ in range(batch):
+            spec_id = identifiers[rng.randrange(len(identifiers))] if identifiers else "ADR-0"
+            rows.append(
+                (
+                    spec_id,
+                    ChangeType.DECISION.value,
+                    _decision_point(rng.randrange(size.decision_points)),
+                    f"option-{rng.randrange(4)}",
+                    f"author-{rng.randrange(25)}",
+                    f"context-{rng.randrange(40)}",
+                    round(rng.random(), 3),
+                    _sqlite_timestamp(
+                        now - timedelta(seconds=rng.randint(0, _HISTORY_DAYS * 86_400))
+                    ),
+                )
+            )
+        with connection:
+            connection.executemany(
+                """
+                INSERT INTO changes
+                (spec_id, change_type, field, new_value, author, context, confidence, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+        remaining -= batch
+
+    return identifiers, recommendation_ids
+
+
+async def _store_specification(ctx: BenchmarkContext) -> None:
+    identifier = f"ADR-BENCH-NEW-{ctx.rng.getrandbits(32):08x}"
+    await ctx.repository.store_specification(
+        SpecificationRecord.create(
+            spec_type=SpecificationType.ADR,
+            identifier=identifier,
+            title="Benchmark write",
+            content="Synthetic specification written during benchmarking.",
+            author="benchmark",
+        )
+    )
+
+
+async def _get_latest_specification(ctx: BenchmarkContext) -> object:
+    identifier = ctx.rng.choice(ctx.spec_identifiers)
+    return await ctx.repository.get_latest_specification(identifier.split("-", 1)[0], identifier)
+
+
+async def _store_architectural_pattern(ctx: BenchmarkContext) -> None:
+    pattern = ArchitecturalPattern.create(
+        pattern_name=f"Benchmark Write Pattern {ctx.rng.getrandbits(32):08x}",
+        pattern_type=PatternType.DOMAIN,
+        pattern_definition={"summary": "benchmark"},
+    )
+    await ctx.repository.store_architectural_pattern(pattern)
+
+
+async def _record_decision(ctx: BenchmarkContext) -> None:
+    await ctx.repository.record_decision(
+        spec_id=ctx.rng.choice(ctx.spec_identifiers),
+        decision_point=_decision_point(ctx.rng.randrange(ctx.size.decision_points)),
+        selected_option="benchmark",
+        context="benchmark write",
+        author="benchmark",
+        confidence=0.8,
+    )
+
+
+async def _store_pattern_recommendation(ctx: BenchmarkContext) -> None:
+    await ctx.repository.store_pattern_recommendation(
+        PatternRecommendation.create(
+            pattern_name="Benchmark Pattern 0",
+            decision_point=_decision_point(0),
+            confidence=0.7,
+            provenance="ADR",
+            rationale="benchmark",
+            ttl_days=90,
+        )
+    )
+
+
+async def _replace_recommendations(ctx: BenchmarkContext) -> int:
+    return await ctx.repository.replace_recommendations(
+        [
+            PatternRecommendation.create(
+                pattern_name="Benchmark Pattern 0",
+                decision_point=_decision_point(index),
+                confidence=0.7,
+                provenance="ADR",
+                rationale="benchmark",
+                ttl_days=90,
+            )
+            for index in range(5)
+        ],
+        retention_days=60,
+    )
+
+
+async def _record_recommendation_feedback(ctx: BenchmarkContext) -> object:
+    return await ctx.repository.record_recommendation_feedback(
+        ctx.rng.choice(ctx.recommendation_ids), ctx.rng.choice(("accept", "dismiss"))
+    )
+
+
+async def _generate_recommendations(ctx: BenchmarkContext) -> object:
+    recognizer = ArchitecturalPatternRecognizer(ctx.repository, use_cache=False)
+    return await recognizer.generate_recommendations(lookback_days=45, dry_run=True)
+
+
+async def _generate_recommendations_cached(ctx: BenchmarkContext) -> object:
+    # Every iteration after the first is a cache hit
+    recognizer = ArchitecturalPatternRecognizer(ctx.repository)
+    return await recognizer.generate_recommendations(lookback_days=45, dry_run=True)
+
+
+def default_scenarios() -> list[BenchmarkScenario]:
+    """Return the standard scenario list: read-only scenarios first, then writes."""
+    return [
+        BenchmarkScenario("get_latest_specification", _get_latest_specification, 200),
+        BenchmarkScenario(
+            "get_recent_specifications",
+            lambda ctx: ctx.repository.get_recent_specifications(limit=20),
+        ),
+        BenchmarkScenario(
+            "get_recent_specifications.by_type",
+            lambda ctx: ctx.repository.get_recent_specifications(
+                limit=20, spec_type=SpecificationType.ADR
+            ),
+        ),
+        BenchmarkScenario(
+            "get_recent_specification_summaries",
+            lambda ctx: ctx.repository.get_recent_specification_summaries(limit=20),
+        ),
+        BenchmarkScenario(
+            "find_specifications_by_matrix_id",
+            lambda ctx: ctx.repository.find_specifications_by_matrix_id(
+                f"MATRIX-{ctx.rng.randrange(400):04d}"
+            ),
+            100,
+        ),
+        BenchmarkScenario(
+            "matrix_coverage",
+            lambda ctx: ctx.repository.matrix_coverage(
+                [f"MATRIX-{index:04d}" for index in range(400)]
+            ),
+        ),
+        BenchmarkScenario(
+            "get_similar_patterns.text",
+            lambda ctx: ctx.repository.get_similar_patterns("decision_point_0001", 0.1, 45),
+        ),
+        BenchmarkScenario(
+            "get_similar_patterns.threshold",
+            lambda ctx: ctx.repository.get_similar_patterns("", 0.5, 45),
+        ),
+        BenchmarkScenario(
+            "get_pattern_recommendations",
+            lambda ctx: ctx.repository.get_pattern_recommendations(limit=10),
+        ),
+        BenchmarkScenario(
+            "get_pattern_recommendations.include_expired",
+            lambda ctx: ctx.repository.get_pattern_recommendations(limit=10, include_expired=True),
+        ),
+        BenchmarkScenario(
+            "find_patterns_by_metadata",
+            lambda ctx: ctx.repository.find_patterns_by_metadata(
+                "canonical_decision_point",
+                [_decision_point(ctx.rng.randrange(ctx.size.decision_points)) for _ in range(20)],
+            ),
+        ),
+        BenchmarkScenario(
+            "find_recommendations_by_metadata",
+            lambda ctx: ctx.repository.find_recommendations_by_metadata(
+                "tags", [f"group-{ctx.rng.randrange(10)}"], limit=10
+            ),
+        ),
+        BenchmarkScenario(
+            "analyze_decision_patterns",
+            lambda ctx: ctx.repository.analyze_decision_patterns(45),
+            5,
+        ),
+        BenchmarkScenario(
+            "get_changes_since",
+            lambda ctx: ctx.repository.get_changes_since(
+                max(0, ctx.size.decisions - 500), limit=500
+            ),
+        ),
+        BenchmarkScenario("recognizer.generate_recommendations", _generate_recommendations, 5),
+        BenchmarkScenario(
+            "recognizer.generate_recommendations.cached", _generate_recommendations_cached, 20
+        ),
+        BenchmarkScenario("store_specification", _store_specification, 100),
+        BenchmarkScenario("store_architectural_pattern", _store_architectural_pattern, 100),
+        BenchmarkScenario("record_decision", _record_decision, 200),
+        BenchmarkScenario("store_pattern_recommendation", _store_pattern_recommendation, 100),
+        BenchmarkScenario("replace_recommendations", _replace_recommendations, 20),
+        BenchmarkScenario("record_recommendation_feedback", _record_recommendation_feedback, 100),
+        BenchmarkScenario(
+            "purge_stale_recommendations",
+            lambda ctx: ctx.repository.purge_stale_recommendations(60),
+            5,
+        ),
+    ]
+
+
+def _summarize(samples_ms: list[float]) -> dict[str, float | int]:
+    ordered = sorted(samples_ms)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "iterations": len(ordered),
+        "min_ms": round(ordered[0], 4),
+        "median_ms": round(statistics.median(ordered), 4),
+        "mean_ms": round(statistics.fmean(ordered), 4),
+        "p95_ms": round(ordered[p95_index], 4),
+        "max_ms": round(ordered[-1], 4),
+    }
+
+
+async def run_scenarios(
+    ctx: BenchmarkContext,
+    scenarios: list[BenchmarkScenario],
+    *,
+    iteration_scale: float = 1.0,
+    only: set[str] | None = None,
+) -> dict[str, dict[str, float | int]]:
+    """Time each scenario and return per-scenario latency summaries."""
+    results: dict[str, dict[str, float | int]] = {}
+    for scenario in scenarios:
+        if only and scenario.name not in only:
+            continue
+        iterations = max(1, int(scenario.iterations * iteration_scale))
+        samples: list[float] = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await scenario.run(ctx)
+            samples.append((time.perf_counter() - start) * 1000)
+        results[scenario.name] = _summarize(samples)
+    return results
+
+
+def _record_factories() -> dict[str, tuple[type, Callable[[int], dict[str, Any]]]]:
+    now = datetime.now(UTC)
+    return {
+        "SpecificationRecord": (
+            SpecificationRecord,
+            lambda index: {
+                "id": str(index),
+                "spec_type": SpecificationType.ADR,
+                "identifier": "ADR-MEM-001",
+                "title": "title",
+                "content": "content",
+                "template_variables": {},
+                "timestamp": now,
+                "version": 1,
+                "author": None,
+                "matrix_ids": [],
+                "metadata": {},
+                "hash": "hash",
+            },
+        ),
+        "SpecificationChange": (
+            SpecificationChange,
+            lambda index: {
+                "spec_id": str(index),
+                "change_type": ChangeType.DECISION,
+                "field": "decision_point",
+                "old_value": None,
+                "new_value": "option",
+                "author": "author",
+                "context": "context",
+                "confidence": 0.9,
+            },
+        ),
+        "DecisionPoint": (
+            DecisionPoint,
+            lambda index: {
+                "id": str(index),
+                "specification_id": "ADR-MEM-001",
+                "decision_point": "decision_point",
+                "context": "context",
+                "timestamp": now,
+                "metadata": {},
+            },
+        ),
+        "ArchitecturalPattern": (
+            ArchitecturalPattern,
+            lambda index: {
+                "id": str(index),
+                "pattern_name": "pattern",
+                "pattern_type": PatternType.DOMAIN,
+                "context_similarity": 0.5,
+                "usage_frequency": 1,
+                "success_rate": None,
+                "last_used": None,
+                "pattern_definition": {},
+                "examples": [],
+                "metadata": {},
+            },
+        ),
+        "PatternRecommendation": (
+            PatternRecommendation,
+            lambda index: {
+                "id": str(index),
+                "pattern_name": "pattern",
+                "decision_point": "decision_point",
+                "confidence": 0.5,
+                "provenance": "ADR",
+                "rationale": "rationale",
+                "created_at": now,
+                "expires_at": now,
+                "metadata": {},
+            },
+        ),
+    }
+
+
+def measure_record_memory(count: int = 100_000) -> dict[str, dict[str, float]]:
+    """Measure memory per record of the slotted types against ``__dict__`` equivalents.
+
+    Field values are shared between records except for ids and empty containers, so
+    the figures reflect per-instance layout overhead plus one fresh container per JSON
+    column, as after hydration from SQLite.
+    """
+    results: dict[str, dict[str, float]] = {}
+    for name, (cls, make_fields) in _record_factories().items():
+        unslotted = dataclasses.make_dataclass(
+            f"{name}WithDict", [(field.name, field.type) for field in dataclasses.fields(cls)]
+        )
+        sizes = {}
+        for label, record_cls in (("slotted", cls), ("dict", unslotted)):
+            gc.collect()
+            tracemalloc.start()
+            records = [record_cls(**make_fields(index)) for index in range(count)]
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del records
+            sizes[label] = current / count
+
+        results[name] = {
+            "slotted_bytes_per_record": round(sizes["slotted"], 1),
+            "dict_bytes_per_record": round(sizes["dict"], 1),
+            "slotted_mb_per_million": round(sizes["slotted"] * 1_000_000 / 2**20, 1),
+            "dict_mb_per_million": round(sizes["dict"] * 1_000_000 / 2**20, 1),
+        }
+    return results
+
+
+def _hydration_fixture(index: int, now: datetime) -> SpecificationRecord:
+    return SpecificationRecord(
+        id=str(uuid.uuid4()),
+        spec_type=SpecificationType.ADR,
+        identifier=f"ADR-HYD-{index:05d}",
+        title=f"Hydration fixture {index}",
+        content="Decision: use the repository pattern. " * 20,
+        template_variables={f"var_{n}": f"value {n}" for n in range(12)},
+        timestamp=now,
+        version=1,
+        author="bench",
+        matrix_ids=[f"M-{n}" for n in range(4)],
+        metadata={"tags": ["bench", "hydration"], "links": {"adr": index, "pr": index * 7}},
+        hash=f"{index:032x}",
+    )
+
+
+def _rows_per_second(count: int, run: Callable[[], Any], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return round(count / best, 1)
+
+
+async def measure_hydration(rows: int = 20_000) -> dict[str, Any]:
+    """Measure record hydration throughput in rows per second.
+
+    Compares the hand-written ``from_dict`` with stdlib ``json`` against the generated
+    decoder on every installed backend, and repository row hydration with eager
+    against lazy JSON columns.
+    """
+    now = datetime.now(UTC)
+    records = [_hydration_fixture(index, now) for index in range(rows)]
+    encoded = [json.dumps(record.to_dict()) for record in records]
+    decode = serialization.record_decoder(SpecificationRecord)
+
+    results: dict[str, Any] = {
+        "rows": rows,
+        "backend": serialization.get_backend(),
+        "from_dict_json": _rows_per_second(
+            rows, lambda: [SpecificationRecord.from_dict(json.loads(text)) for text in encoded]
+        ),
+    }
+
+    active = serialization.get_backend()
+    try:
+        for backend in serialization.BACKENDS:
+            try:
+                serialization.set_backend(backend)
+            except ImportError:
+                continue
+            loads = serialization.loads
+            results[f"generated_{backend}"] = _rows_per_second(
+                rows, lambda: [decode(loads(text)) for text in encoded]
+            )
+    finally:
+        serialization.set_backend(active)
+
+    # Full row hydration through the repository, eager vs lazy JSON columns
+    repository = await initialize_temporal_database(":memory:")
+    try:
+        for record in records:
+            await repository.store_specification(record)
+        for label, lazy in (("repository_eager", False), ("repository_lazy", True)):
+            repository.lazy_json = lazy
+            best = float("inf")
+            for _ in range(3):
+                start = time.perf_counter()
+                await repository.get_recent_specifications(limit=rows)
+                best = min(best, time.perf_counter() - start)
+            results[label] = round(rows / best, 1)
+    finally:
+        await repository.close()
+    return results
+
+
+async def measure_load_scaling(
+    rows: int = 20_000,
+    *,
+    seed: int = 1337,
+    workdir: Path | None = None,
+) -> dict[str, Any]:
+    """Measure how dump load time grows with the dataset.
+
+    Loads dumps of synthetic datasets with a quarter, half and all of ``rows``
+    specifications, patterns, decisions and recommendations into fresh file
+    databases. ``per_row_cost_ratio`` divides the per-row load time at the largest
+    size by the one at the smallest: a linear load stays near 1, while per-row work
+    that scans a whole table shows up as a ratio near 4.
+    """
+    sizes = [max(1, rows // 4), max(1, rows // 2), max(1, rows)]
+    results: dict[str, Any] = {"sizes": {}}
+    with tempfile.TemporaryDirectory(prefix="temporal-load-", dir=workdir) as tmp:
+        for count in sizes:
+            source = await initialize_temporal_database(":memory:")
+            try:
+                generate_synthetic_data(
+                    source.connection, DatasetSize(count, count, count, count), seed=seed
+                )
+                dump = io.StringIO()
+                dump_database(source.connection, dump)
+            finally:
+                await source.close()
+
+            target = await initialize_temporal_database(str(Path(tmp) / f"load-{count}"))
+            try:
+                dump.seek(0)
+                start = time.perf_counter()
+                load_database(target.connection, dump)
+                seconds = time.perf_counter() - start
+            finally:
+                await target.close()
+            results["sizes"][str(count)] = {
+                "seconds": round(seconds, 4),
+                "rows_per_second": round(count / seconds, 1),
+            }
+
+    smallest = results["sizes"][str(sizes[0])]["seconds"] / sizes[0]
+    largest = results["sizes"][str(sizes[-1])]["seconds"] / sizes[-1]
+    results["per_row_cost_ratio"] = round(largest / smallest, 2) if smallest else 0.0
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+async def run_benchmark(
+    size: DatasetSize,
+    *,
+    seed: int = 1337,
+    iteration_scale: float = 1.0,
+    only: set[str] | None = None,
+    workdir: Path | None = None,
+    memory_records: int = 0,
+    hydration_rows: int = 0,
+    load_rows: int = 0,
+) -> dict[str, Any]:
+    """Build a synthetic database, run every scenario and return the JSON payload.
+
+    With ``memory_records`` > 0 the payload also reports per-record memory of the
+    record types (see :func:`measure_record_memory`), with ``hydration_rows`` > 0
+    record hydration throughput (see :func:`measure_hydration`), and with
+    ``load_rows`` > 0 dump load scaling (see :func:`measure_load_scaling`).
+    """
+    with tempfile.TemporaryDirectory(prefix="temporal-bench-", dir=workdir) as tmp:
+        repository = await initialize_temporal_database(str(Path(tmp) / "bench"))
+        try:
+            build_start = time.perf_counter()
+            identifiers, recommendation_ids = generate_synthetic_data(
+                repository.connection, size, seed=seed
+            )
+            build_seconds = time.perf_counter() - build_start
+
+            ctx = BenchmarkContext(
+                repository=repository,
+                size=size,
+                rng=random.Random(seed),  # noqa: S311 - reproducible synthetic data, not security
+                spec_identifiers=identifiers,
+                recommendation_ids=recommendation_ids,
+            )
+            scenarios = await run_scenarios(
+                ctx, default_scenarios(), iteration_scale=iteration_scale, only=only
+            )
+        finally:
+            await repository.close()
+
+    payload = {
+        "schema_version": RESULT_SCHEMA_VERSION,
+        "generated_at": datetime.now(UTC).isoformat(),
+        "git_commit": _git_commit(),
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "dataset": {
+            "seed": seed,
+            "specs": size.specs,
+            "patterns": size.patterns,
+            "decisions": size.decisions,
+            "decision_points": size.decision_points,
+            "recommendations": size.recommendations,
+            "feedback": size.recommendations * _FEEDBACK_PER_RECOMMENDATION,
+            "build_seconds": round(build_seconds, 3),
+        },
+        "scenarios": scenarios,
+    }
+    if memory_records > 0:
+        payload["memory"] = measure_record_memory(memory_records)
+    if hydration_rows > 0:
+        payload["hydration"] = await measure_hydration(hydration_rows)
+    if load_rows > 0:
+        payload["load_scaling"] = await measure_load_scaling(load_rows, seed=seed, workdir=workdir)
+    return payload
+
+
+def compare_results(current: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """Return human-readable median ratios of ``current`` against ``baseline``."""
+    lines = [f"{'scenario':<45} {'baseline':>12} {'current':>12} {'ratio':>8}"]
+    for name, stats in current["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            lines.append(f"{name:<45} {'-':>12} {stats['median_ms']:>10.3f}ms {'new':>8}")
+            continue
+        ratio = stats["median_ms"] / previous["median_ms"] if previous["median_ms"] else 0.0
+        lines.append(
+            f"{name:<45} {previous['median_ms']:>10.3f}ms {stats['median_ms']:>10.3f}ms "
+            f"{ratio:>7.2f}x"
+        )
+    return lines
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark the temporal database package")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small", help="Dataset size")
+    parser.add_argument("--specs", type=int, help="Override number of specifications")
+    parser.add_argument("--patterns", type=int, help="Override number of patterns")
+    parser.add_argument("--decisions", type=int, help="Override number of decisions")
+    parser.add_argument("--recommendations", type=int, help="Override number of recommendations")
+    parser.add_argument("--seed", type=int, default=1337, help="Random seed for data generation")
+    parser.add_argument(
+        "--iteration-scale",
+        type=float,
+        default=1.0,
+        help="Multiplier applied to each scenario's iteration count",
+    )
+    parser.add_argument(
+        "--scenario", action="append", help="Run only the named scenario (repeatable)"
+    )
+    parser.add_argument(
+        "--memory-records",
+        type=int,
+        default=0,
+        help="Also measure record type memory over this many instances",
+    )
+    parser.add_argument(
+        "--hydration-rows",
+        type=int,
+        default=0,
+        help="Also measure record hydration throughput over this many rows",
+    )
+    parser.add_argument(
+        "--load-rows",
+        type=int,
+        default=0,
+        help="Also measure dump load scaling at a quarter, half and all of this many rows",
+    )
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    parser.add_argument("--compare", help="Baseline JSON results to compare against")
+    return parser
+
+
+def main() -> None:
+    parser = build_parser()
+    args = parser.parse_args()
+
+    preset = SCALES[args.scale]
+    size = DatasetSize(
+        specs=args.specs if args.specs is not None else preset["specs"],
+        patterns=args.patterns if args.patterns is not None else preset["patterns"],
+        decisions=args.decisions if args.decisions is not None else preset["decisions"],
+        recommendations=(
+            args.recommendations if args.recommendations is not None else preset["recommendations"]
+        ),
+    )
+
+    try:
+        payload = asyncio.run(
+            run_benchmark(
+                size,
+                seed=args.seed,
+                iteration_scale=args.iteration_scale,
+                only=set(args.scenario) if args.scenario else None,
+                memory_records=args.memory_records,
+                hydration_rows=args.hydration_rows,
+                load_rows=args.load_rows,
+            )
+        )
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    else:
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        print("\n".join(compare_results(payload, baseline)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
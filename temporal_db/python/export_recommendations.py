@@ -8,7 +8,7 @@ import asyncio
 import json
 import sys
 from pathlib import Path
-from typing import TypedDict, cast
+from typing import Any, TypedDict, cast
 
 from .patterns import ArchitecturalPatternRecognizer
 from .repository import initialize_temporal_database
@@ -32,41 +32,53 @@ class RecommendationPayload(TypedDict):
     feedback: dict[str, str] | None
 
 
-async def _run_async(args: argparse.Namespace) -> RecommendationPayload:
-    repository = await initialize_temporal_database(args.db)
+async def export_recommendations(
+    db_path: str,
+    *,
+    lookback_days: int = 45,
+    limit: int = 10,
+    retention_days: int = 90,
+    min_confidence: float = 0.55,
+    dry_run: bool = False,
+    use_cache: bool = True,
+    feedback_action: str | None = None,
+    feedback_id: str | None = None,
+    feedback_reason: str | None = None,
+) -> RecommendationPayload:
+    """Generate recommendations for one database and return the JSON payload.
+
+    Feedback is recorded first when both ``feedback_action`` and ``feedback_id`` are
+    given, so it is reflected in the generated recommendations.
+    """
+    repository = await initialize_temporal_database(db_path)
     try:
         recognizer = ArchitecturalPatternRecognizer(
             repository,
-            retention_days=args.retention,
-            minimum_confidence=args.min_confidence,
-            max_recommendations=args.limit,
+            retention_days=retention_days,
+            minimum_confidence=min_confidence,
+            max_recommendations=limit,
+            use_cache=use_cache,
         )
 
         feedback_result: dict[str, str] | None = None
-        if args.feedback_action and args.feedback_id:
-            # Validate that both feedback flags are provided together
-            if not (args.feedback_action and args.feedback_id):
-                raise ValueError(
-                    "Both --feedback-action and --feedback-id must be provided together"
-                )
-
+        if feedback_action and feedback_id:
             updated_raw = await repository.record_recommendation_feedback(
-                args.feedback_id,
-                args.feedback_action,
-                args.feedback_reason,
+                feedback_id,
+                feedback_action,
+                feedback_reason,
             )
             if updated_raw:
                 updated = cast(dict[str, str], updated_raw)
                 feedback_result = {
                     "id": updated["id"],
-                    "action": args.feedback_action,
+                    "action": feedback_action,
                 }
 
         result = await recognizer.generate_recommendations(
-            lookback_days=args.lookback,
-            dry_run=args.dry_run,
+            lookback_days=lookback_days,
+            dry_run=dry_run,
         )
-        existing = await recognizer.hydrate_existing(limit=args.limit)
+        existing = await recognizer.hydrate_existing(limit=limit)
 
         return {
             "generated": [
@@ -83,9 +95,8 @@ async def _run_async(args: argparse.Namespace) -> RecommendationPayload:
         await repository.close()
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Export pattern recommendations")
-    parser.add_argument("--db", required=True, help="Path to the temporal database base filename")
+def add_generation_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the recommendation generation options shared with the batch runner."""
     parser.add_argument("--lookback", type=int, default=45, help="Number of days to analyse")
     parser.add_argument("--limit", type=int, default=10, help="Maximum recommendations to return")
     parser.add_argument(
@@ -97,6 +108,29 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--dry-run", action="store_true", help="Skip persistence while generating recommendations"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute dry-run recommendations even when a cached result is current",
+    )
+
+
+def generation_options(args: argparse.Namespace) -> dict[str, Any]:
+    """Return :func:`export_recommendations` keyword arguments for the parsed options."""
+    return {
+        "lookback_days": args.lookback,
+        "limit": args.limit,
+        "retention_days": args.retention,
+        "min_confidence": args.min_confidence,
+        "dry_run": args.dry_run,
+        "use_cache": not args.no_cache,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Export pattern recommendations")
+    parser.add_argument("--db", required=True, help="Path to the temporal database base filename")
+    add_generation_arguments(parser)
     parser.add_argument(
         "--feedback-action",
         choices=["accept", "dismiss"],
@@ -113,7 +147,15 @@ def main() -> None:
     args.db = str(Path(args.db))
 
     try:
-        payload = asyncio.run(_run_async(args))
+        payload = asyncio.run(
+            export_recommendations(
+                args.db,
+                **generation_options(args),
+                feedback_action=args.feedback_action,
+                feedback_id=args.feedback_id,
+                feedback_reason=args.feedback_reason,
+            )
+        )
         json.dump(payload, sys.stdout)
         sys.stdout.write("\n")
     except Exception as e:
@@ -4,18 +4,26 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 from collections import Counter
 from collections.abc import Sequence
-from dataclasses import dataclass
-from typing import TypedDict, cast
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, TypedDict, cast
 
+from . import serialization
 from .repository import TemporalRepository
+from .scoring import ScoringModel, default_scorer
 from .types import (
     ArchitecturalPattern,
     PatternRecommendation,
     PatternType,
 )
 
+# Pattern metadata key naming the decision point a pattern is the canonical answer to
+_CANONICAL_KEY = "canonical_decision_point"
+
 
 class DecisionStat(TypedDict):
     decision_point: str
@@ -32,6 +40,29 @@ class PatternRecommendationResult:
     recommendations: list[PatternRecommendation]
     regenerated: bool
     retention_deleted: int
+    cached: bool = False
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to a JSON-serializable dictionary."""
+        encode = serialization.record_encoder(PatternRecommendation)
+        return {
+            "recommendations": [encode(item) for item in self.recommendations],
+            "regenerated": self.regenerated,
+            "retention_deleted": self.retention_deleted,
+        }
+
+    @classmethod
+    def from_dict(
+        cls, data: dict[str, Any], *, cached: bool = False
+    ) -> PatternRecommendationResult:
+        """Create from a dictionary produced by :meth:`to_dict`."""
+        decode = serialization.record_decoder(PatternRecommendation)
+        return cls(
+            recommendations=[decode(item) for item in data["recommendations"]],
+            regenerated=data["regenerated"],
+            retention_deleted=data["retention_deleted"],
+            cached=cached,
+        )
 
 
 class ArchitecturalPatternRecognizer:
@@ -44,46 +75,149 @@ class ArchitecturalPatternRecognizer:
         retention_days: int = 90,
         minimum_confidence: float = 0.55,
         max_recommendations: int = 5,
+        scoring_model: ScoringModel | None = None,
+        use_cache: bool = True,
+        cache_ttl_seconds: float = 3600.0,
     ) -> None:
         self._repository = repository
+        self._use_cache = use_cache
+        self._cache_ttl_seconds = cache_ttl_seconds
         self._retention_days = max(1, retention_days)
         self._minimum_confidence = min(0.95, max(0.3, minimum_confidence))
         self._max_recommendations = max(1, max_recommendations)
+        # Without NumPy only the default model is available, scored per statistic
+        self._scorer = default_scorer(scoring_model)
+        if self._scorer is None and scoring_model not in (None, ScoringModel()):
+            raise RuntimeError("Custom scoring models require NumPy")
 
     async def generate_recommendations(
         self,
         *,
         lookback_days: int = 45,
         dry_run: bool = False,
+        as_of: datetime | None = None,
     ) -> PatternRecommendationResult:
         """Generate recommendations from temporal history.
 
+        Dry runs are cached in the repository, keyed by the recognizer settings and
+        the data versions of the tables they read. A cached result is served while no
+        decision, pattern, recommendation or feedback has been written since; results
+        relative to "now" additionally expire after ``cache_ttl_seconds`` because
+        decisions age out of the lookback window. A cached result gets fresh
+        recommendation ids and timestamps, as a new run would.
+
+        Caching means a dry run still writes its result to the ``recommendation_cache``
+        table; construct the recognizer with ``use_cache=False`` for a dry run that
+        leaves the database untouched.
+
         Args:
             lookback_days: Window for historical analysis.
-            dry_run: When True, skip persistence while still returning results.
+            dry_run: When True, skip persisting recommendations while still returning
+                them.
+            as_of: Analyze decisions visible at this time instead of now.
         """
+        if not (dry_run and self._use_cache):
+            return await self._generate(lookback_days, dry_run, as_of)
+
+        cache_key = self._cache_key(lookback_days, as_of)
+        data_version = json.dumps(await self._repository.get_data_versions(), sort_keys=True)
+        cached = await self._repository.get_cached_recommendations(
+            cache_key,
+            data_version,
+            max_age_seconds=None if as_of is not None else self._cache_ttl_seconds,
+        )
+        if cached is not None:
+            result = PatternRecommendationResult.from_dict(cached, cached=True)
+            result.recommendations = [self._restamp(rec) for rec in result.recommendations]
+            return result
+
+        result = await self._generate(lookback_days, dry_run, as_of)
+        await self._repository.store_cached_recommendations(
+            cache_key, data_version, result.to_dict()
+        )
+        return result
+
+    def _restamp(self, recommendation: PatternRecommendation) -> PatternRecommendation:
+        """Copy a cached recommendation with a new id and creation time."""
+        return PatternRecommendation.create(
+            pattern_name=recommendation.pattern_name,
+            decision_point=recommendation.decision_point,
+            confidence=recommendation.confidence,
+            provenance=recommendation.provenance,
+            rationale=recommendation.rationale,
+            ttl_days=self._retention_days,
+            metadata=recommendation.metadata,
+        )
+
+    def _cache_key(self, lookback_days: int, as_of: datetime | None) -> str:
+        settings = {
+            "lookback_days": lookback_days,
+            "as_of": as_of.isoformat() if as_of else None,
+            "retention_days": self._retention_days,
+            "minimum_confidence": self._minimum_confidence,
+            "max_recommendations": self._max_recommendations,
+            "scoring_model": asdict(self._scorer.model) if self._scorer else None,
+        }
+        return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()
 
-        decision_stats_raw = await self._repository.analyze_decision_patterns(lookback_days)
+    async def _generate(
+        self,
+        lookback_days: int,
+        dry_run: bool,
+        as_of: datetime | None,
+    ) -> PatternRecommendationResult:
+        decision_stats_raw = await self._repository.analyze_decision_patterns(
+            lookback_days, as_of=as_of
+        )
         if not decision_stats_raw:
             return PatternRecommendationResult([], regenerated=False, retention_deleted=0)
 
         decision_stats = cast(list[DecisionStat], decision_stats_raw)
 
-        all_patterns = await self._repository.get_similar_patterns("", 0.0, lookback_days)
         pattern_tasks = [
             self._repository.get_similar_patterns(stat["decision_point"], 0.1, lookback_days)
             for stat in decision_stats
         ]
         pattern_candidates = await asyncio.gather(*pattern_tasks)
 
+        decision_points = [stat["decision_point"] for stat in decision_stats]
+        all_patterns: list[ArchitecturalPattern] | None = None
+        if _CANONICAL_KEY in self._repository.indexed_metadata_keys.get("patterns", ()):
+            # One indexed lookup resolves canonical patterns for every decision point
+            canonical_candidates = await self._repository.find_patterns_by_metadata(
+                _CANONICAL_KEY, decision_points
+            )
+        else:
+            # Without the index, scan the full pattern list in Python
+            all_patterns = await self._repository.get_similar_patterns("", 0.0, lookback_days)
+            wanted = set(decision_points)
+            canonical_candidates = [
+                pattern
+                for pattern in all_patterns
+                if isinstance(pattern.metadata.get(_CANONICAL_KEY), str)
+                and pattern.metadata[_CANONICAL_KEY] in wanted
+            ]
+        canonical_patterns: dict[str, ArchitecturalPattern] = {}
+        for pattern in canonical_candidates:
+            canonical_patterns.setdefault(pattern.metadata[_CANONICAL_KEY], pattern)
+
+        confidences = await self._score(decision_stats, lookback_days, as_of)
+
         generated: list[PatternRecommendation] = []
-        for stat, candidates in zip(decision_stats, pattern_candidates):
-            confidence = self._calculate_confidence(stat)
+        for stat, candidates, confidence in zip(decision_stats, pattern_candidates, confidences):
             if confidence < self._minimum_confidence:
                 continue
 
+            decision_point = stat["decision_point"]
+            if not candidates and decision_point not in canonical_patterns and all_patterns is None:
+                # Name matching needs the full pattern list; load it only when reached
+                all_patterns = await self._repository.get_similar_patterns("", 0.0, lookback_days)
+
             best_pattern = self._select_best_pattern(
-                candidates, stat["decision_point"], all_patterns
+                candidates,
+                decision_point,
+                all_patterns or [],
+                canonical_patterns.get(decision_point),
             )
             metadata = self._build_metadata(stat, best_pattern)
             rationale = self._compose_rationale(stat, best_pattern, confidence)
@@ -104,10 +238,8 @@ class ArchitecturalPatternRecognizer:
 
         retention_deleted = 0
         if not dry_run:
-            for recommendation in generated:
-                await self._repository.store_pattern_recommendation(recommendation)
-            retention_deleted = await self._repository.purge_stale_recommendations(
-                self._retention_days
+            retention_deleted = await self._repository.replace_recommendations(
+                generated, self._retention_days
             )
 
         return PatternRecommendationResult(
@@ -121,6 +253,24 @@ class ArchitecturalPatternRecognizer:
 
         return await self._repository.get_pattern_recommendations(limit=limit)
 
+    async def _score(
+        self,
+        decision_stats: list[DecisionStat],
+        lookback_days: int,
+        as_of: datetime | None,
+    ) -> list[float]:
+        if self._scorer is None:
+            return [self._calculate_confidence(stat) for stat in decision_stats]
+
+        model = self._scorer.model
+        decisions = None
+        if model.uses_decay:
+            decisions = await self._repository.get_decision_outcomes(lookback_days, as_of=as_of)
+        feedback = None
+        if model.uses_feedback:
+            feedback = await self._repository.get_feedback_counts(as_of=as_of)
+        return self._scorer.score_stats(decision_stats, decisions=decisions, feedback=feedback)
+
     def _calculate_confidence(self, stat: DecisionStat) -> float:
         total = stat["total_decisions"]
         selected = stat["selected_count"]
@@ -134,6 +284,7 @@ class ArchitecturalPatternRecognizer:
         candidates: Sequence[ArchitecturalPattern],
         decision_point: str,
         all_patterns: Sequence[ArchitecturalPattern],
+        canonical_match: ArchitecturalPattern | None = None,
     ) -> ArchitecturalPattern:
         if candidates:
             sorted_candidates = sorted(
@@ -147,9 +298,9 @@ class ArchitecturalPatternRecognizer:
             )
             top = sorted_candidates[0]
             # Create a copy of the pattern with updated metadata to avoid mutation
-            if not top.metadata.get("canonical_decision_point"):
+            if not top.metadata.get(_CANONICAL_KEY):
                 updated_metadata = top.metadata.copy()
-                updated_metadata["canonical_decision_point"] = decision_point
+                updated_metadata[_CANONICAL_KEY] = decision_point
                 return ArchitecturalPattern(
                     id=top.id,
                     pattern_name=top.pattern_name,
@@ -164,14 +315,6 @@ class ArchitecturalPatternRecognizer:
                 )
             return top
 
-        canonical_match = next(
-            (
-                pattern
-                for pattern in all_patterns
-                if pattern.metadata.get("canonical_decision_point") == decision_point
-            ),
-            None,
-        )
         if canonical_match:
             return canonical_match
 
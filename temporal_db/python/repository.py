@@ -8,31 +8,143 @@ For now, it creates a JSON file-based implementation that mirrors the Rust inter
 In the future, this could be replaced with PyO3 bindings to the Rust implementation.
 """
 
-import json
+import asyncio
 import sqlite3
+import threading
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from . import serialization
+from .serialization import LazyJSON
 from .types import (
     ArchitecturalPattern,
+    ChangeEvent,
     ChangeType,
     PatternRecommendation,
-    PatternType,
     SpecificationChange,
     SpecificationRecord,
+    SpecificationSummary,
     SpecificationType,
 )
 
+MEMORY_DB_PATH = ":memory:"
+
+_INSERT_RECOMMENDATION_SQL = """
+    INSERT OR REPLACE INTO pattern_recommendations
+    (id, pattern_name, decision_point, confidence, provenance, rationale,
+     created_at, expires_at, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Columns read by ``get_recent_specification_summaries``, in SpecificationSummary order
+SPECIFICATION_SUMMARY_COLUMNS = "id, spec_type, identifier, title, timestamp, version, author, hash"
+
+# Generated row hydrators; JSON object columns that may be decoded lazily are passed
+# through ``TemporalRepository._decode_object``
+_decode_specification_row = serialization.row_decoder(
+    SpecificationRecord,
+    json_fields=("matrix_ids",),
+    object_fields=("template_variables", "metadata"),
+)
+_decode_summary_row = serialization.row_decoder(SpecificationSummary)
+_decode_pattern_row = serialization.row_decoder(
+    ArchitecturalPattern,
+    json_fields=("examples", "metadata"),
+    object_fields=("pattern_definition",),
+)
+_decode_recommendation_row = serialization.row_decoder(
+    PatternRecommendation, json_fields=("metadata",)
+)
+
+# Tables whose writes bump their counter in ``data_versions``
+VERSIONED_TABLES = (
+    "changes",
+    "patterns",
+    "pattern_recommendations",
+    "recommendation_feedback",
+)
+
+# Metadata keys mirrored into ``metadata_index`` per table, unless configured otherwise
+DEFAULT_INDEXED_METADATA_KEYS: dict[str, tuple[str, ...]] = {
+    "patterns": ("canonical_decision_point",),
+    "pattern_recommendations": ("tags", "last_feedback"),
+}
+
+
+def rebuild_spec_matrix(cursor: sqlite3.Cursor) -> None:
+    """Recompute ``spec_matrix`` from every ``specifications.matrix_ids`` at once."""
+    cursor.execute("DELETE FROM spec_matrix")
+    cursor.execute("""
+        INSERT OR IGNORE INTO spec_matrix (matrix_id, spec_id)
+        SELECT j.value, s.id
+        FROM specifications AS s, json_each(s.matrix_ids) AS j
+    """)
+
+
+def _backfill_metadata_key(cursor: sqlite3.Cursor, table: str, key: str) -> None:
+    cursor.execute(
+        f"""
+        INSERT OR IGNORE INTO metadata_index (entity, key, value, entity_id)
+        SELECT ?, ?, j.value, t.id
+        FROM {table} AS t, json_each(t.metadata, ?) AS j
+        WHERE j.type NOT IN ('object', 'array')
+        """,  # noqa: S608 - table is a DEFAULT_INDEXED_METADATA_KEYS name
+        (table, key, f'$."{key}"'),
+    )
+
+
+def rebuild_metadata_index(cursor: sqlite3.Cursor) -> None:
+    """Recompute ``metadata_index`` for every key listed in ``metadata_index_keys``."""
+    cursor.execute("DELETE FROM metadata_index")
+    keys = cursor.execute("SELECT entity, key FROM metadata_index_keys").fetchall()
+    for table, key in keys:
+        if table in DEFAULT_INDEXED_METADATA_KEYS:
+            _backfill_metadata_key(cursor, table, key)
+
+
+def bump_data_versions(cursor: sqlite3.Cursor) -> None:
+    """Increment every ``data_versions`` counter once, as after a bulk write."""
+    cursor.execute("UPDATE data_versions SET version = version + 1")
+
 
 class TemporalRepository:
     """Python interface to the temporal database."""
 
-    def __init__(self, db_path: str):
-        """Initialize the temporal repository."""
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        indexed_metadata_keys: Mapping[str, Sequence[str]] | None = None,
+        lazy_json: bool = False,
+    ):
+        """Initialize the temporal repository.
+
+        Args:
+            db_path: Base path of the database file.
+            indexed_metadata_keys: Metadata keys to index per table (``patterns`` and
+                ``pattern_recommendations``). Defaults to
+                ``DEFAULT_INDEXED_METADATA_KEYS``.
+            lazy_json: Hydrate rarely used JSON object columns (specification
+                ``template_variables``/``metadata``, pattern ``pattern_definition``)
+                as :class:`LazyJSON`, decoded on first access.
+        """
         self.db_path = db_path
+        self.lazy_json = lazy_json
         self.db_file = Path(db_path).with_suffix(".sqlite")
         self.connection: sqlite3.Connection | None = None
+        keys = (
+            DEFAULT_INDEXED_METADATA_KEYS
+            if indexed_metadata_keys is None
+            else indexed_metadata_keys
+        )
+        unknown = set(keys) - set(DEFAULT_INDEXED_METADATA_KEYS)
+        if unknown:
+            raise ValueError(f"Metadata indexing is not supported for: {sorted(unknown)}")
+        self.indexed_metadata_keys = {table: tuple(keys.get(table, ())) for table in keys}
+        # Wakeup events for in-process change feed consumers (see ``tail``)
+        self._change_waiters: set[asyncio.Event] = set()
 
     async def initialize(self) -> None:
         """Initialize the temporal database."""
@@ -142,8 +254,190 @@ class TemporalRepository:
             ON recommendation_feedback (recommendation_id)
         """)
 
+        await self._create_spec_matrix(cursor)
+        await self._create_metadata_index(cursor)
+        await self._sync_indexed_metadata_keys(cursor)
+        await self._create_data_versions(cursor)
+        await self._create_recommendation_cache(cursor)
+
         self.connection.commit()
 
+    async def _create_spec_matrix(self, cursor: sqlite3.Cursor) -> None:
+        """Create the traceability join table and the triggers that maintain it.
+
+        ``specifications.matrix_ids`` stays the source of truth; triggers mirror it into
+        ``spec_matrix`` on every insert, update and delete, whichever code path writes.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'spec_matrix'")
+        needs_backfill = cursor.fetchone() is None
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS spec_matrix (
+                matrix_id TEXT NOT NULL,
+                spec_id TEXT NOT NULL,
+                PRIMARY KEY (matrix_id, spec_id)
+            ) WITHOUT ROWID
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_spec_matrix_spec_id
+            ON spec_matrix (spec_id)
+        """)
+
+        # INSERT OR REPLACE does not fire delete triggers, so clear stale links first
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_specifications_matrix_insert
+            AFTER INSERT ON specifications
+            BEGIN
+                DELETE FROM spec_matrix WHERE spec_id = NEW.id;
+                INSERT OR IGNORE INTO spec_matrix (matrix_id, spec_id)
+                SELECT value, NEW.id FROM json_each(NEW.matrix_ids);
+            END
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_specifications_matrix_update
+            AFTER UPDATE OF id, matrix_ids ON specifications
+            BEGIN
+                DELETE FROM spec_matrix WHERE spec_id = OLD.id;
+                INSERT OR IGNORE INTO spec_matrix (matrix_id, spec_id)
+                SELECT value, NEW.id FROM json_each(NEW.matrix_ids);
+            END
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_specifications_matrix_delete
+            AFTER DELETE ON specifications
+            BEGIN
+                DELETE FROM spec_matrix WHERE spec_id = OLD.id;
+            END
+        """)
+
+        if needs_backfill:
+            rebuild_spec_matrix(cursor)
+
+    async def _create_metadata_index(self, cursor: sqlite3.Cursor) -> None:
+        """Create the metadata side index and the triggers that maintain it.
+
+        ``metadata_index_keys`` lists which keys are indexed per table, so the triggers
+        stay generic. Array values (such as ``tags``) produce one row per element.
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS metadata_index_keys (
+                entity TEXT NOT NULL,
+                key TEXT NOT NULL,
+                PRIMARY KEY (entity, key)
+            ) WITHOUT ROWID
+        """)
+
+        # ``value`` is untyped so JSON numbers and strings keep their storage class
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS metadata_index (
+                entity TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value,
+                entity_id TEXT NOT NULL,
+                PRIMARY KEY (entity, key, value, entity_id)
+            ) WITHOUT ROWID
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_metadata_index_entity_id
+            ON metadata_index (entity, entity_id)
+        """)
+
+        for table in DEFAULT_INDEXED_METADATA_KEYS:
+            populate = f"""
+                INSERT OR IGNORE INTO metadata_index (entity, key, value, entity_id)
+                SELECT '{table}', k.key, j.value, NEW.id
+                FROM metadata_index_keys AS k,
+                     json_each(NEW.metadata, '$."' || k.key || '"') AS j
+                WHERE k.entity = '{table}' AND j.type NOT IN ('object', 'array');
+            """  # noqa: S608 - table is a DEFAULT_INDEXED_METADATA_KEYS name
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_metadata_insert
+                AFTER INSERT ON {table}
+                BEGIN
+                    DELETE FROM metadata_index WHERE entity = '{table}' AND entity_id = NEW.id;
+                    {populate}
+                END
+            """)  # noqa: S608 - table is a DEFAULT_INDEXED_METADATA_KEYS name
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_metadata_update
+                AFTER UPDATE OF id, metadata ON {table}
+                BEGIN
+                    DELETE FROM metadata_index WHERE entity = '{table}' AND entity_id = OLD.id;
+                    {populate}
+                END
+            """)  # noqa: S608 - table is a DEFAULT_INDEXED_METADATA_KEYS name
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_metadata_delete
+                AFTER DELETE ON {table}
+                BEGIN
+                    DELETE FROM metadata_index WHERE entity = '{table}' AND entity_id = OLD.id;
+                END
+            """)  # noqa: S608 - table is a DEFAULT_INDEXED_METADATA_KEYS name
+
+    async def _create_data_versions(self, cursor: sqlite3.Cursor) -> None:
+        """Create per-table write counters maintained by triggers.
+
+        Every insert, update or delete on a versioned table increments its counter, so
+        callers can tell cheaply whether derived results are still current.
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS data_versions (
+                name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+        """)
+
+        for table in VERSIONED_TABLES:
+            cursor.execute("INSERT OR IGNORE INTO data_versions (name) VALUES (?)", (table,))
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS trg_{table}_version_{event.lower()}
+                    AFTER {event} ON {table}
+                    BEGIN
+                        UPDATE data_versions SET version = version + 1 WHERE name = '{table}';
+                    END
+                """)  # noqa: S608 - table is a VERSIONED_TABLES name
+
+    async def _create_recommendation_cache(self, cursor: sqlite3.Cursor) -> None:
+        """Create the side table holding cached recommendation results."""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS recommendation_cache (
+                cache_key TEXT PRIMARY KEY,
+                data_version TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                result TEXT NOT NULL
+            )
+        """)
+
+    async def _sync_indexed_metadata_keys(self, cursor: sqlite3.Cursor) -> None:
+        """Make ``metadata_index_keys`` match the configured keys, backfilling new ones."""
+        for table in DEFAULT_INDEXED_METADATA_KEYS:
+            wanted = set(self.indexed_metadata_keys.get(table, ()))
+            cursor.execute("SELECT key FROM metadata_index_keys WHERE entity = ?", (table,))
+            current = {row[0] for row in cursor.fetchall()}
+
+            for key in current - wanted:
+                cursor.execute(
+                    "DELETE FROM metadata_index_keys WHERE entity = ? AND key = ?", (table, key)
+                )
+                cursor.execute(
+                    "DELETE FROM metadata_index WHERE entity = ? AND key = ?", (table, key)
+                )
+
+            for key in sorted(wanted - current):
+                cursor.execute(
+                    "INSERT INTO metadata_index_keys (entity, key) VALUES (?, ?)", (table, key)
+                )
+                _backfill_metadata_key(cursor, table, key)
+
+    def _require_indexed_key(self, table: str, key: str) -> None:
+        if key not in self.indexed_metadata_keys.get(table, ()):
+            raise ValueError(f"Metadata key '{key}' is not indexed for {table}")
+
     async def store_specification(self, spec: SpecificationRecord) -> None:
         """Store a specification record."""
         if not self.connection:
@@ -168,12 +462,12 @@ class TemporalRepository:
                 spec.identifier,
                 spec.title,
                 spec.content,
-                json.dumps(spec.template_variables),
+                serialization.dumps(spec.template_variables),
                 spec.timestamp.isoformat(),
                 spec.version,
                 spec.author,
-                json.dumps(spec.matrix_ids),
-                json.dumps(spec.metadata),
+                serialization.dumps(spec.matrix_ids),
+                serialization.dumps(spec.metadata),
                 spec.hash,
             ),
         )
@@ -209,6 +503,7 @@ class TemporalRepository:
         )
 
         self.connection.commit()
+        self._notify_change_waiters()
 
     async def get_latest_specification(
         self, spec_type: str, identifier: str
@@ -232,21 +527,83 @@ class TemporalRepository:
         if not row:
             return None
 
-        return SpecificationRecord(
-            id=row["id"],
-            spec_type=SpecificationType(row["spec_type"]),
-            identifier=row["identifier"],
-            title=row["title"],
-            content=row["content"],
-            template_variables=json.loads(row["template_variables"]),
-            timestamp=datetime.fromisoformat(row["timestamp"]),
-            version=row["version"],
-            author=row["author"],
-            matrix_ids=json.loads(row["matrix_ids"]),
-            metadata=json.loads(row["metadata"]),
-            hash=row["hash"],
+        return self._row_to_specification(row)
+
+    async def find_specifications_by_matrix_id(
+        self,
+        matrix_id: str,
+        latest_only: bool = True,
+    ) -> list[SpecificationRecord]:
+        """Return specifications linked to a traceability matrix ID.
+
+        Uses the ``spec_matrix`` index instead of decoding every ``matrix_ids`` column.
+        With ``latest_only`` only the newest version of each identifier is returned.
+        """
+        if not self.connection:
+            raise RuntimeError("Database not initialized")
+
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+            SELECT s.* FROM spec_matrix AS m
+            JOIN specifications AS s ON s.id = m.spec_id
+            WHERE m.matrix_id = ?
+            ORDER BY s.identifier, s.timestamp DESC
+            """,
+            (matrix_id,),
         )
 
+        records: list[SpecificationRecord] = []
+        seen: set[str] = set()
+        for row in cursor.fetchall():
+            if latest_only:
+                if row["identifier"] in seen:
+                    continue
+                seen.add(row["identifier"])
+            records.append(self._row_to_specification(row))
+
+        return records
+
+    async def matrix_coverage(self, matrix_ids: list[str] | None = None) -> dict[str, int]:
+        """Count distinct specification identifiers linked to each matrix ID.
+
+        Args:
+            matrix_ids: IDs to report on; requested IDs without links map to 0.
+                When omitted, every linked matrix ID is reported.
+        """
+        if not self.connection:
+            raise RuntimeError("Database not initialized")
+
+        cursor = self.connection.cursor()
+        if matrix_ids is None:
+            cursor.execute(
+                """
+                SELECT m.matrix_id, COUNT(DISTINCT s.identifier) AS spec_count
+                FROM spec_matrix AS m
+                JOIN specifications AS s ON s.id = m.spec_id
+                GROUP BY m.matrix_id
+                """
+            )
+            coverage: dict[str, int] = {}
+        else:
+            # json_each avoids SQLite's bound-parameter limit for large ID lists
+            cursor.execute(
+                """
+                SELECT m.matrix_id, COUNT(DISTINCT s.identifier) AS spec_count
+                FROM spec_matrix AS m
+                JOIN specifications AS s ON s.id = m.spec_id
+                WHERE m.matrix_id IN (SELECT value FROM json_each(?))
+                GROUP BY m.matrix_id
+                """,
+                (serialization.dumps(matrix_ids),),
+            )
+            coverage = dict.fromkeys(matrix_ids, 0)
+
+        for row in cursor.fetchall():
+            coverage[row["matrix_id"]] = row["spec_count"]
+
+        return coverage
+
     async def store_architectural_pattern(self, pattern: ArchitecturalPattern) -> None:
         """Store an architectural pattern."""
         if not self.connection:
@@ -268,9 +625,9 @@ class TemporalRepository:
                 pattern.usage_frequency,
                 pattern.success_rate,
                 pattern.last_used.isoformat() if pattern.last_used else None,
-                json.dumps(pattern.pattern_definition),
-                json.dumps(pattern.examples),
-                json.dumps(pattern.metadata),
+                serialization.dumps(pattern.pattern_definition),
+                serialization.dumps(pattern.examples),
+                serialization.dumps(pattern.metadata),
             ),
         )
 
@@ -311,23 +668,39 @@ class TemporalRepository:
                 (similarity_threshold,),
             )
 
-        patterns = []
-        for row in cursor.fetchall():
-            pattern = ArchitecturalPattern(
-                id=row["id"],
-                pattern_name=row["pattern_name"],
-                pattern_type=PatternType(row["pattern_type"]),
-                context_similarity=row["context_similarity"],
-                usage_frequency=row["usage_frequency"],
-                success_rate=row["success_rate"],
-                last_used=datetime.fromisoformat(row["last_used"]) if row["last_used"] else None,
-                pattern_definition=json.loads(row["pattern_definition"]),
-                examples=json.loads(row["examples"]),
-                metadata=json.loads(row["metadata"]),
+        return [self._row_to_pattern(row) for row in cursor.fetchall()]
+
+    async def find_patterns_by_metadata(
+        self,
+        key: str,
+        values: Iterable[object],
+    ) -> list[ArchitecturalPattern]:
+        """Return patterns whose indexed metadata ``key`` equals any of ``values``.
+
+        Results are ordered by usage frequency, most used first.
+
+        Raises:
+            ValueError: If ``key`` is not an indexed metadata key for patterns.
+        """
+        if not self.connection:
+            raise RuntimeError("Database not initialized")
+        self._require_indexed_key("patterns", key)
+
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+            SELECT * FROM patterns
+            WHERE id IN (
+                SELECT entity_id FROM metadata_index
+                WHERE entity = 'patterns' AND key = ?
+                  AND value IN (SELECT value FROM json_each(?))
             )
-            patterns.append(pattern)
+            ORDER BY usage_frequency DESC
+            """,
+            (key, serialization.dumps(list(values))),
+        )
 
-        return patterns
+        return [self._row_to_pattern(row) for row in cursor.fetchall()]
 
     async def record_decision(
         self,
@@ -361,6 +734,7 @@ class TemporalRepository:
         )
 
         self.connection.commit()
+        self._notify_change_waiters()
 
     async def store_pattern_recommendation(
         self,
@@ -371,43 +745,33 @@ class TemporalRepository:
         if not self.connection:
             raise RuntimeError("Database not initialized")
 
-        # Validate that datetime objects are timezone-aware
-        self._validate_datetime_timezone(recommendation.created_at, "created_at")
-        self._validate_datetime_timezone(recommendation.expires_at, "expires_at")
-
         cursor = self.connection.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO pattern_recommendations
-            (id, pattern_name, decision_point, confidence, provenance, rationale,
-             created_at, expires_at, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                recommendation.id,
-                recommendation.pattern_name,
-                recommendation.decision_point,
-                recommendation.confidence,
-                recommendation.provenance,
-                recommendation.rationale,
-                # created_at (ensure UTC isoformat)
-                (
-                    recommendation.created_at.astimezone(UTC).isoformat()
-                    if recommendation.created_at.tzinfo
-                    else recommendation.created_at.replace(tzinfo=UTC).isoformat()
-                ),
-                # expires_at (ensure UTC isoformat)
-                (
-                    recommendation.expires_at.astimezone(UTC).isoformat()
-                    if recommendation.expires_at.tzinfo
-                    else recommendation.expires_at.replace(tzinfo=UTC).isoformat()
-                ),
-                json.dumps(recommendation.metadata),
-            ),
-        )
+        cursor.execute(_INSERT_RECOMMENDATION_SQL, self._recommendation_params(recommendation))
 
         self.connection.commit()
 
+    async def replace_recommendations(
+        self,
+        generated: Sequence[PatternRecommendation],
+        retention_days: int,
+    ) -> int:
+        """Persist freshly generated recommendations and purge stale ones atomically.
+
+        Both steps share one transaction and one commit, so concurrent readers see either
+        the previous set or the new one.
+
+        Returns:
+            Number of stale recommendations deleted.
+        """
+        if not self.connection:
+            raise RuntimeError("Database not initialized")
+
+        params = [self._recommendation_params(item) for item in generated]
+        with self.connection:
+            cursor = self.connection.cursor()
+            cursor.executemany(_INSERT_RECOMMENDATION_SQL, params)
+            return self._purge_stale_recommendations(cursor, retention_days)
+
     async def get_pattern_recommendations(
         self,
         limit: int = 10,
@@ -439,25 +803,45 @@ class TemporalRepository:
                 (limit,),
             )
 
-        recommendations: list[PatternRecommendation] = []
-        for row in cursor.fetchall():
-            recommendations.append(
-                PatternRecommendation.from_dict(
-                    {
-                        "id": row["id"],
-                        "pattern_name": row["pattern_name"],
-                        "decision_point": row["decision_point"],
-                        "confidence": row["confidence"],
-                        "provenance": row["provenance"],
-                        "rationale": row["rationale"],
-                        "created_at": row["created_at"],
-                        "expires_at": row["expires_at"],
-                        "metadata": json.loads(row["metadata"]),
-                    }
-                )
+        return [self._row_to_recommendation(row) for row in cursor.fetchall()]
+
+    async def find_recommendations_by_metadata(
+        self,
+        key: str,
+        values: Iterable[object],
+        limit: int = 10,
+        include_expired: bool = False,
+    ) -> list[PatternRecommendation]:
+        """Return recommendations whose indexed metadata ``key`` equals any of ``values``.
+
+        For list-valued keys such as ``tags`` a recommendation matches when any element
+        matches. Results are ordered by recency.
+
+        Raises:
+            ValueError: If ``key`` is not an indexed metadata key for recommendations.
+        """
+        if not self.connection:
+            raise RuntimeError("Database not initialized")
+        self._require_indexed_key("pattern_recommendations", key)
+
+        expiry_clause = "" if include_expired else "AND datetime(expires_at) > datetime('now')"
+        cursor = self.connection.cursor()
+        cursor.execute(
+            f"""
+            SELECT * FROM pattern_recommendations
+            WHERE id IN (
+                SELECT entity_id FROM metadata_index
+                WHERE entity = 'pattern_recommendations' AND key = ?
+                  AND value IN (SELECT value FROM json_each(?))
             )
+            {expiry_clause}
+            ORDER BY datetime(created_at) DESC
+            LIMIT ?
+            """,  # noqa: S608 - expiry_clause is a fixed SQL fragment
+            (key, serialization.dumps(list(values)), limit),
+        )
 
-        return recommendations
+        return [self._row_to_recommendation(row) for row in cursor.fetchall()]
 
     async def purge_stale_recommendations(self, retention_days: int) -> int:
         """Remove recommendations older than retention window."""
@@ -465,10 +849,15 @@ class TemporalRepository:
         if not self.connection:
             raise RuntimeError("Database not initialized")
 
+        cursor = self.connection.cursor()
+        deleted = self._purge_stale_recommendations(cursor, retention_days)
+        self.connection.commit()
+        return deleted
+
+    def _purge_stale_recommendations(self, cursor: sqlite3.Cursor, retention_days: int) -> int:
         if retention_days <= 0:
             return 0
 
-        cursor = self.connection.cursor()
         cutoff = datetime.now(UTC) - timedelta(days=retention_days)
         cursor.execute(
             """
@@ -477,9 +866,7 @@ class TemporalRepository:
             """,
             (cutoff.isoformat(),),
         )
-        deleted = cursor.rowcount
-        self.connection.commit()
-        return deleted
+        return cursor.rowcount
 
     async def record_recommendation_feedback(
         self,
@@ -520,19 +907,7 @@ class TemporalRepository:
             self.connection.commit()
             return None
 
-        recommendation = PatternRecommendation.from_dict(
-            {
-                "id": row["id"],
-                "pattern_name": row["pattern_name"],
-                "decision_point": row["decision_point"],
-                "confidence": row["confidence"],
-                "provenance": row["provenance"],
-                "rationale": row["rationale"],
-                "created_at": row["created_at"],
-                "expires_at": row["expires_at"],
-                "metadata": json.loads(row["metadata"]),
-            }
-        )
+        recommendation = self._row_to_recommendation(row)
 
         updated = recommendation.with_adjusted_confidence(delta)
         cursor.execute(
@@ -543,7 +918,7 @@ class TemporalRepository:
             """,
             (
                 updated.confidence,
-                json.dumps(
+                serialization.dumps(
                     {
                         **updated.metadata,
                         "last_feedback": action,
@@ -565,70 +940,92 @@ class TemporalRepository:
     ) -> list[SpecificationRecord]:
         """Return the most recent specification entries."""
 
+        cursor = self._select_recent_specifications("*", limit, spec_type)
+        return [self._row_to_specification(row) for row in cursor.fetchall()]
+
+    async def get_recent_specification_summaries(
+        self,
+        limit: int = 20,
+        spec_type: SpecificationType | None = None,
+    ) -> list[SpecificationSummary]:
+        """Return the most recent specifications without their content or JSON columns.
+
+        Same ordering as :meth:`get_recent_specifications`, for list views that only
+        show identifiers, titles and timestamps.
+        """
+        cursor = self._select_recent_specifications(SPECIFICATION_SUMMARY_COLUMNS, limit, spec_type)
+        return [_decode_summary_row(row) for row in cursor.fetchall()]
+
+    def _select_recent_specifications(
+        self, columns: str, limit: int, spec_type: SpecificationType | None
+    ) -> sqlite3.Cursor:
         if not self.connection:
             raise RuntimeError("Database not initialized")
 
         cursor = self.connection.cursor()
         if spec_type is None:
             cursor.execute(
-                """
-                SELECT * FROM specifications
+                f"""
+                SELECT {columns} FROM specifications
                 ORDER BY datetime(timestamp) DESC
                 LIMIT ?
-                """,
+                """,  # noqa: S608 - columns is "*" or SPECIFICATION_SUMMARY_COLUMNS
                 (limit,),
             )
         else:
             cursor.execute(
-                """
-                SELECT * FROM specifications
+                f"""
+                SELECT {columns} FROM specifications
                 WHERE spec_type = ?
                 ORDER BY datetime(timestamp) DESC
                 LIMIT ?
-                """,
+                """,  # noqa: S608 - columns is "*" or SPECIFICATION_SUMMARY_COLUMNS
                 (spec_type.value, limit),
             )
+        return cursor
 
-        records: list[SpecificationRecord] = []
-        for row in cursor.fetchall():
-            records.append(
-                SpecificationRecord(
-                    id=row["id"],
-                    spec_type=SpecificationType(row["spec_type"]),
-                    identifier=row["identifier"],
-                    title=row["title"],
-                    content=row["content"],
-                    template_variables=json.loads(row["template_variables"]),
-                    timestamp=datetime.fromisoformat(row["timestamp"]),
-                    version=row["version"],
-                    author=row["author"],
-                    matrix_ids=json.loads(row["matrix_ids"]),
-                    metadata=json.loads(row["metadata"]),
-                    hash=row["hash"],
-                )
-            )
-
-        return records
-
-    async def analyze_decision_patterns(self, lookback_days: int) -> list[dict[str, Any]]:
-        """Analyze decision patterns."""
+    async def analyze_decision_patterns(
+        self,
+        lookback_days: int,
+        *,
+        as_of: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Analyze decision patterns.
+
+        Args:
+            lookback_days: Size of the analysis window in days.
+            as_of: End of the window. Defaults to now; when given, decisions recorded
+                after ``as_of`` are ignored, which lets history be replayed.
+        """
         if not self.connection:
             raise RuntimeError("Database not initialized")
 
+        reference = "now"
+        upper_bound = ""
+        if as_of is not None:
+            self._validate_datetime_timezone(as_of, "as_of")
+            reference = as_of.astimezone(UTC).strftime("%Y-%m-%d %H:%M:%S")
+            upper_bound = "AND datetime(timestamp) <= datetime(:reference)"
+
         cursor = self.connection.cursor()
         cursor.execute(
-            """
+            f"""
             SELECT field as decision_point,
                    COUNT(*) as total_decisions,
                    SUM(CASE WHEN confidence > 0.7 THEN 1 ELSE 0 END) as selected_count,
                    GROUP_CONCAT(DISTINCT substr(spec_id, 1, 3)) as spec_types,
                    GROUP_CONCAT(context) as contexts
             FROM changes
-            WHERE change_type = ?
-              AND datetime(timestamp) > datetime('now', '-' || ? || ' days')
+            WHERE change_type = :change_type
+              AND datetime(timestamp) > datetime(:reference, '-' || :lookback_days || ' days')
+              {upper_bound}
             GROUP BY field
-        """,
-            (ChangeType.DECISION.value, lookback_days),
+        """,  # noqa: S608 - upper_bound is a fixed SQL fragment
+            {
+                "change_type": ChangeType.DECISION.value,
+                "reference": reference,
+                "lookback_days": lookback_days,
+            },
         )
 
         patterns = []
@@ -644,6 +1041,283 @@ class TemporalRepository:
 
         return patterns
 
+    async def get_decision_outcomes(
+        self,
+        lookback_days: int,
+        *,
+        as_of: datetime | None = None,
+    ) -> list[tuple[str, float, bool]]:
+        """Return ``(decision_point, age_days, selected)`` for decisions in the window.
+
+        Ages are measured from ``as_of`` (default now). ``selected`` uses the same
+        confidence threshold as ``analyze_decision_patterns``.
+        """
+        if not self.connection:
+            raise RuntimeError("Database not initialized")
+
+        reference = "now"
+        upper_bound = ""
+        if as_of is not None:
+            self._validate_datetime_timezone(as_of, "as_of")
+            reference = as_of.astimezone(UTC).strftime("%Y-%m-%d %H:%M:%S")
+            upper_bound = "AND datetime(timestamp) <= datetime(:reference)"
+
+        cursor = self.connection.cursor()
+        cursor.row_factory = None
+        cursor.execute(
+            f"""
+            SELECT field,
+                   julianday(:reference) - julianday(timestamp),
+                   COALESCE(confidence > 0.7, 0)
+            FROM changes
+            WHERE change_type = :change_type
+              AND datetime(timestamp) > datetime(:reference, '-' || :lookback_days || ' days')
+              {upper_bound}
+            """,  # noqa: S608 - upper_bound is a fixed SQL fragment
+            {
+                "change_type": ChangeType.DECISION.value,
+                "reference": reference,
+                "lookback_days": lookback_days,
+            },
+        )
+        return [(field, age, bool(selected)) for field, age, selected in cursor.fetchall()]
+
+    async def get_data_versions(self) -> dict[str, int]:
+        """Return the write counter of every versioned table."""
+        if not self.connection:
+            raise RuntimeError("Database not initialized")
+
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT name, version FROM data_versions ORDER BY name")
+        return {row["name"]: row["version"] for row in cursor.fetchall()}
+
+    async def get_cached_recommendations(
+        self,
+        cache_key: str,
+        data_version: str,
+        max_age_seconds: float | None = None,
+    ) -> dict[str, Any] | None:
+        """Return a cached recommendation result for ``cache_key``.
+
+        Entries recorded for another ``data_version``, or older than
+        ``max_age_seconds``, are treated as misses.
+        """
+        if not self.connection:
+            raise RuntimeError("Database not initialized")
+
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+            SELECT created_at, result FROM recommendation_cache
+            WHERE cache_key = ? AND data_version = ?
+            """,
+            (cache_key, data_version),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+
+        if max_age_seconds is not None:
+            age = datetime.now(UTC) - datetime.fromisoformat(row["created_at"])
+            if age.total_seconds() > max_age_seconds:
+                return None
+        return serialization.loads(row["result"])
+
+    async def store_cached_recommendations(
+        self,
+        cache_key: str,
+        data_version: str,
+        result: dict[str, Any],
+    ) -> None:
+        """Cache a recommendation result, dropping entries for other data versions."""
+        if not self.connection:
+            raise RuntimeError("Database not initialized")
+
+        cursor = self.connection.cursor()
+        cursor.execute("DELETE FROM recommendation_cache WHERE data_version != ?", (data_version,))
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO recommendation_cache
+            (cache_key, data_version, created_at, result)
+            VALUES (?, ?, ?, ?)
+            """,
+            (cache_key, data_version, datetime.now(UTC).isoformat(), serialization.dumps(result)),
+        )
+        self.connection.commit()
+
+    async def get_feedback_counts(
+        self,
+        *,
+        as_of: datetime | None = None,
+    ) -> dict[str, dict[str, int]]:
+        """Count recommendation feedback actions per decision point.
+
+        Only feedback recorded up to ``as_of`` (default now) is counted.
+        """
+        if not self.connection:
+            raise RuntimeError("Database not initialized")
+
+        reference = "now"
+        if as_of is not None:
+            self._validate_datetime_timezone(as_of, "as_of")
+            reference = as_of.astimezone(UTC).strftime("%Y-%m-%d %H:%M:%S")
+
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+            SELECT r.decision_point, f.action, COUNT(*) AS count
+            FROM recommendation_feedback AS f
+            JOIN pattern_recommendations AS r ON r.id = f.recommendation_id
+            WHERE datetime(f.created_at) <= datetime(?)
+            GROUP BY r.decision_point, f.action
+            """,
+            (reference,),
+        )
+
+        counts: dict[str, dict[str, int]] = {}
+        for row in cursor.fetchall():
+            counts.setdefault(row["decision_point"], {})[row["action"]] = row["count"]
+        return counts
+
+    async def get_changes_since(self, since_id: int = 0, limit: int = 500) -> list[ChangeEvent]:
+        """Return committed change rows with an id greater than ``since_id``.
+
+        The autoincrement primary key doubles as a monotonic cursor, so this is a
+        bounded range scan rather than a rescan of the whole table.
+        """
+        if not self.connection:
+            raise RuntimeError("Database not initialized")
+
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+            SELECT * FROM changes
+            WHERE id > ?
+            ORDER BY id
+            LIMIT ?
+            """,
+            (since_id, limit),
+        )
+
+        events: list[ChangeEvent] = []
+        for row in cursor.fetchall():
+            timestamp = datetime.fromisoformat(row["timestamp"])
+            if timestamp.tzinfo is None:
+                # CURRENT_TIMESTAMP is stored as naive UTC
+                timestamp = timestamp.replace(tzinfo=UTC)
+            events.append(
+                ChangeEvent(
+                    id=row["id"],
+                    timestamp=timestamp,
+                    change=SpecificationChange(
+                        spec_id=row["spec_id"],
+                        change_type=ChangeType(row["change_type"]),
+                        field=row["field"],
+                        old_value=row["old_value"],
+                        new_value=row["new_value"],
+                        author=row["author"],
+                        context=row["context"],
+                        confidence=row["confidence"],
+                    ),
+                )
+            )
+
+        return events
+
+    async def tail(
+        self,
+        since_id: int = 0,
+        *,
+        batch_size: int = 500,
+        min_poll_interval: float = 0.05,
+        max_poll_interval: float = 2.0,
+    ) -> AsyncIterator[ChangeEvent]:
+        """Yield new change rows as they are committed, starting after ``since_id``.
+
+        Writes made through this repository wake consumers immediately. Writes from
+        other connections or processes are detected by polling ``PRAGMA data_version``
+        with exponential backoff between ``min_poll_interval`` and ``max_poll_interval``
+        seconds. The generator runs until the consumer stops iterating.
+        """
+        if not self.connection:
+            raise RuntimeError("Database not initialized")
+
+        last_id = since_id
+        interval = min_poll_interval
+        data_version = self._data_version()
+
+        while True:
+            # Register before reading so a write landing mid-fetch still wakes us
+            waiter = asyncio.Event()
+            self._change_waiters.add(waiter)
+            try:
+                events = await self.get_changes_since(last_id, batch_size)
+                if events:
+                    interval = min_poll_interval
+                    for event in events:
+                        last_id = event.id
+                        yield event
+                    continue
+
+                try:
+                    await asyncio.wait_for(waiter.wait(), timeout=interval)
+                    interval = min_poll_interval
+                except TimeoutError:
+                    current_version = self._data_version()
+                    if current_version != data_version:
+                        data_version = current_version
+                        interval = min_poll_interval
+                    else:
+                        interval = min(interval * 2, max_poll_interval)
+            finally:
+                self._change_waiters.discard(waiter)
+
+    def _data_version(self) -> int:
+        """Return SQLite's data version, which changes on commits from other connections."""
+        if not self.connection:
+            raise RuntimeError("Database not initialized")
+
+        return int(self.connection.execute("PRAGMA data_version").fetchone()[0])
+
+    def _notify_change_waiters(self) -> None:
+        """Wake in-process change feed consumers after a write to ``changes``."""
+        for waiter in self._change_waiters:
+            waiter.set()
+
+    def _decode_object(self, raw: str) -> dict[str, Any]:
+        """Decode a JSON object column, lazily when ``lazy_json`` is enabled."""
+        return LazyJSON(raw) if self.lazy_json else serialization.loads(raw)
+
+    def _row_to_specification(self, row: sqlite3.Row) -> SpecificationRecord:
+        """Hydrate a ``specifications`` row."""
+        return _decode_specification_row(row, self._decode_object)
+
+    def _recommendation_params(self, recommendation: PatternRecommendation) -> tuple[Any, ...]:
+        """Validate a recommendation and return its ``pattern_recommendations`` row."""
+        # Validate that datetime objects are timezone-aware
+        self._validate_datetime_timezone(recommendation.created_at, "created_at")
+        self._validate_datetime_timezone(recommendation.expires_at, "expires_at")
+
+        return (
+            recommendation.id,
+            recommendation.pattern_name,
+            recommendation.decision_point,
+            recommendation.confidence,
+            recommendation.provenance,
+            recommendation.rationale,
+            recommendation.created_at.astimezone(UTC).isoformat(),
+            recommendation.expires_at.astimezone(UTC).isoformat(),
+            serialization.dumps(recommendation.metadata),
+        )
+
+    def _row_to_pattern(self, row: sqlite3.Row) -> ArchitecturalPattern:
+        """Hydrate a ``patterns`` row."""
+        return _decode_pattern_row(row, self._decode_object)
+
+    def _row_to_recommendation(self, row: sqlite3.Row) -> PatternRecommendation:
+        """Hydrate a ``pattern_recommendations`` row."""
+        return _decode_recommendation_row(row)
+
     def _validate_datetime_timezone(self, dt: datetime, field_name: str) -> None:
         """Validate that a datetime object is timezone-aware."""
         if dt.tzinfo is None:
@@ -672,9 +1346,75 @@ class TemporalRepository:
             self.connection = None
 
 
+class InMemoryTemporalRepository(TemporalRepository):
+    """Temporal repository backed by a private in-memory SQLite database.
+
+    The schema is built once per process into a template database and cloned into
+    each new instance with SQLite's backup API, so construction skips both disk I/O
+    and DDL. Every instance is isolated; data is discarded on ``close``.
+    """
+
+    _schema_template: sqlite3.Connection | None = None
+    _template_lock = threading.Lock()
+
+    def __init__(
+        self,
+        db_path: str = MEMORY_DB_PATH,
+        *,
+        indexed_metadata_keys: Mapping[str, Sequence[str]] | None = None,
+        lazy_json: bool = False,
+    ):
+        """Initialize the in-memory repository."""
+        super().__init__(db_path, indexed_metadata_keys=indexed_metadata_keys, lazy_json=lazy_json)
+        self.db_file = None
+
+    async def initialize(self) -> None:
+        """Clone the schema template into a fresh in-memory database."""
+        template = await self._get_schema_template()
+        self.connection = sqlite3.connect(MEMORY_DB_PATH)
+        with self._template_lock:
+            template.backup(self.connection)
+        self.connection.row_factory = sqlite3.Row
+
+        # The template carries the default key set; apply this instance's configuration
+        if self.indexed_metadata_keys != DEFAULT_INDEXED_METADATA_KEYS:
+            await self._sync_indexed_metadata_keys(self.connection.cursor())
+            self.connection.commit()
+
+    @classmethod
+    async def _get_schema_template(cls) -> sqlite3.Connection:
+        """Return the process-wide schema template, creating it on first use."""
+        with cls._template_lock:
+            if cls._schema_template is not None:
+                return cls._schema_template
+
+        builder = TemporalRepository(MEMORY_DB_PATH)
+        builder.connection = sqlite3.connect(MEMORY_DB_PATH, check_same_thread=False)
+        await builder._create_tables()
+
+        with cls._template_lock:
+            if cls._schema_template is None:
+                cls._schema_template = builder.connection
+            else:
+                builder.connection.close()
+            return cls._schema_template
+
+
 # Convenience function for easy initialization
-async def initialize_temporal_database(db_path: str) -> TemporalRepository:
-    """Initialize a temporal database repository."""
-    repo = TemporalRepository(db_path)
+async def initialize_temporal_database(
+    db_path: str,
+    *,
+    indexed_metadata_keys: Mapping[str, Sequence[str]] | None = None,
+    lazy_json: bool = False,
+) -> TemporalRepository:
+    """Initialize a temporal database repository.
+
+    Pass ``":memory:"`` to get an isolated :class:`InMemoryTemporalRepository`.
+    """
+    options = {"indexed_metadata_keys": indexed_metadata_keys, "lazy_json": lazy_json}
+    if db_path == MEMORY_DB_PATH:
+        repo: TemporalRepository = InMemoryTemporalRepository(**options)
+    else:
+        repo = TemporalRepository(db_path, **options)
     await repo.initialize()
     return repo
@@ -0,0 +1,205 @@
+# mypy: ignore-errors
+"""Vectorized confidence scoring for decision statistics.
+
+``ConfidenceScorer`` scores every decision point in one NumPy pass instead of calling a
+Python function per statistic. Confidence is the posterior mean of a beta model::
+
+    (selected + alpha) / (total + alpha + beta)
+
+where ``alpha``/``beta`` combine a configurable prior with accept/dismiss feedback on
+earlier recommendations, and ``selected``/``total`` may be time-decayed so recent
+decisions weigh more. With the default :class:`ScoringModel` (no prior, no feedback,
+no decay) the result equals the plain ``selected / total`` ratio clamped to
+``[floor, ceiling]``.
+
+NumPy is an optional dependency; :func:`default_scorer` returns ``None`` without it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+def _require_numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise RuntimeError(
+            "Confidence scoring requires NumPy; install it with 'pip install numpy'"
+        ) from exc
+    return np
+
+
+@dataclass(frozen=True)
+class ScoringModel:
+    """Parameters of the confidence model.
+
+    Attributes:
+        half_life_days: Age at which a decision counts half. ``None`` disables decay.
+        prior_confidence: Prior mean confidence for decision points.
+        prior_strength: Pseudo-decision count given to the prior (0 disables it).
+        feedback_weight: Pseudo-decisions added per accept (to ``selected``) or
+            dismiss (to the misses) of earlier recommendations (0 ignores feedback).
+        floor: Lowest confidence reported for a decision point with evidence.
+        ceiling: Highest confidence reported.
+    """
+
+    half_life_days: float | None = None
+    prior_confidence: float = 0.5
+    prior_strength: float = 0.0
+    feedback_weight: float = 0.0
+    floor: float = 0.1
+    ceiling: float = 0.98
+
+    def __post_init__(self) -> None:
+        if self.half_life_days is not None and self.half_life_days <= 0:
+            raise ValueError("half_life_days must be positive")
+        if not 0.0 <= self.prior_confidence <= 1.0:
+            raise ValueError("prior_confidence must be between 0 and 1")
+        if self.prior_strength < 0 or self.feedback_weight < 0:
+            raise ValueError("prior_strength and feedback_weight cannot be negative")
+        if self.floor > self.ceiling:
+            raise ValueError("floor cannot exceed ceiling")
+
+    @property
+    def uses_decay(self) -> bool:
+        return self.half_life_days is not None
+
+    @property
+    def uses_feedback(self) -> bool:
+        return self.feedback_weight > 0
+
+
+class ConfidenceScorer:
+    """Score decision points from count arrays or raw decision arrays."""
+
+    def __init__(self, model: ScoringModel | None = None):
+        self._np = _require_numpy()
+        self.model = model or ScoringModel()
+
+    def decay_weights(self, age_days: Any) -> Any:
+        """Return per-decision weights ``0.5 ** (age / half_life)`` (ones without decay)."""
+        np = self._np
+        ages = np.maximum(np.asarray(age_days, dtype=np.float64), 0.0)
+        if not self.model.uses_decay:
+            return np.ones_like(ages)
+        return np.exp2(-ages / self.model.half_life_days)
+
+    def aggregate(
+        self,
+        point_codes: Any,
+        selected: Any,
+        size: int,
+        age_days: Any | None = None,
+    ) -> tuple[Any, Any]:
+        """Sum (optionally decayed) totals and selections per decision point code."""
+        np = self._np
+        codes = np.asarray(point_codes, dtype=np.intp)
+        weights = (
+            self.decay_weights(age_days)
+            if age_days is not None
+            else np.ones(codes.shape, dtype=np.float64)
+        )
+        totals = np.bincount(codes, weights=weights, minlength=size)
+        chosen = np.bincount(
+            codes, weights=weights * np.asarray(selected, dtype=bool), minlength=size
+        )
+        return totals, chosen
+
+    def score(
+        self,
+        total: Any,
+        selected: Any,
+        accepted: Any | None = None,
+        dismissed: Any | None = None,
+    ) -> Any:
+        """Return confidences for parallel arrays of (weighted) counts.
+
+        Decision points without any evidence (no decisions, prior or feedback) score 0.
+        """
+        np = self._np
+        model = self.model
+        total = np.asarray(total, dtype=np.float64)
+        selected = np.asarray(selected, dtype=np.float64)
+
+        alpha = np.full_like(total, model.prior_confidence * model.prior_strength)
+        beta = np.full_like(total, (1.0 - model.prior_confidence) * model.prior_strength)
+        if model.uses_feedback:
+            if accepted is not None:
+                alpha += model.feedback_weight * np.asarray(accepted, dtype=np.float64)
+            if dismissed is not None:
+                beta += model.feedback_weight * np.asarray(dismissed, dtype=np.float64)
+
+        denominator = total + alpha + beta
+        with np.errstate(divide="ignore", invalid="ignore"):
+            raw = (selected + alpha) / denominator
+        scores = np.clip(raw, model.floor, model.ceiling)
+        return np.where(denominator > 0, scores, 0.0)
+
+    def score_stats(
+        self,
+        stats: Sequence[Mapping[str, Any]],
+        *,
+        decisions: Sequence[tuple[str, float, bool]] | None = None,
+        feedback: Mapping[str, Mapping[str, int]] | None = None,
+    ) -> list[float]:
+        """Score ``analyze_decision_patterns`` results in one pass.
+
+        Args:
+            stats: Decision statistics; their raw counts are used unless ``decisions``
+                is given.
+            decisions: ``(decision_point, age_days, selected)`` rows used for decayed
+                counts, as returned by ``get_decision_outcomes``.
+            feedback: Accept/dismiss counts per decision point, as returned by
+                ``get_feedback_counts``.
+
+        Returns:
+            Confidences in the order of ``stats``.
+        """
+        np = self._np
+        index = {stat["decision_point"]: position for position, stat in enumerate(stats)}
+
+        if decisions is not None and self.model.uses_decay:
+            rows = [row for row in decisions if row[0] in index]
+            codes = np.fromiter((index[row[0]] for row in rows), dtype=np.intp, count=len(rows))
+            ages = np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows))
+            chosen = np.fromiter((row[2] for row in rows), dtype=bool, count=len(rows))
+            total, selected = self.aggregate(codes, chosen, len(stats), ages)
+        else:
+            total = np.fromiter(
+                (stat["total_decisions"] for stat in stats), dtype=np.float64, count=len(stats)
+            )
+            selected = np.fromiter(
+                (stat["selected_count"] or 0 for stat in stats),
+                dtype=np.float64,
+                count=len(stats),
+            )
+
+        accepted = dismissed = None
+        if feedback and self.model.uses_feedback:
+            accepted = np.zeros(len(stats))
+            dismissed = np.zeros(len(stats))
+            for point, counts in feedback.items():
+                position = index.get(point)
+                if position is not None:
+                    accepted[position] = counts.get("accept", 0)
+                    dismissed[position] = counts.get("dismiss", 0)
+
+        return self.score(total, selected, accepted, dismissed).tolist()
+
+
+def default_scorer(model: ScoringModel | None = None) -> ConfidenceScorer | None:
+    """Return a scorer, or ``None`` when NumPy is not installed."""
+    try:
+        return ConfidenceScorer(model)
+    except RuntimeError:
+        return None
+
+
+__all__ = [
+    "ConfidenceScorer",
+    "ScoringModel",
+    "default_scorer",
+]
@@ -0,0 +1,322 @@
+# mypy: ignore-errors
+"""JSON serialization layer for the temporal database.
+
+* :func:`dumps` / :func:`loads` use the fastest installed backend: ``orjson``, then
+  ``msgspec``, then the standard library ``json`` module. ``TEMPORAL_DB_JSON`` selects
+  one explicitly (falling back to automatic selection with a warning when it is not
+  installed), and :func:`set_backend` switches at runtime.
+* :func:`record_encoder` / :func:`record_decoder` generate straight-line conversion
+  functions for the dataclasses in :mod:`.types` from their type hints, producing the
+  same dictionaries as the hand-written ``to_dict``/``from_dict`` methods without
+  per-field dispatch. :func:`row_decoder` does the same for database rows and backs
+  the repository's record hydration.
+* :class:`LazyJSON` defers decoding of rarely used JSON object columns until first
+  access; :func:`dumps` writes it back verbatim when it was never decoded.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import types
+import warnings
+from collections.abc import Callable, Iterator, MutableMapping
+from datetime import datetime
+from enum import Enum
+from functools import cache
+from typing import Any, Union, get_args, get_origin, get_type_hints
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _load_backend(name: str) -> tuple[Callable[[Any], str], Callable[[str | bytes], Any]]:
+    if name == "orjson":
+        import orjson
+
+        options = orjson.OPT_NON_STR_KEYS
+
+        def orjson_dumps(obj: Any) -> str:
+            return orjson.dumps(obj, default=_default, option=options).decode()
+
+        return orjson_dumps, orjson.loads
+
+    if name == "msgspec":
+        import msgspec
+
+        encoder = msgspec.json.Encoder(enc_hook=_default)
+        decoder = msgspec.json.Decoder()
+
+        def msgspec_dumps(obj: Any) -> str:
+            return encoder.encode(obj).decode()
+
+        return msgspec_dumps, decoder.decode
+
+    if name == "json":
+        encoder = json.JSONEncoder(default=_default)
+        return encoder.encode, json.loads
+
+    raise ValueError(f"Unknown JSON backend '{name}'; expected one of {BACKENDS}")
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, LazyJSON):
+        return obj.materialize()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class LazyJSON(MutableMapping):
+    """A JSON object column decoded on first access.
+
+    Behaves like the ``dict`` it wraps (including equality with plain dicts).
+    """
+
+    __slots__ = ("_raw", "_value")
+
+    def __init__(self, raw: str):
+        self._raw = raw
+        self._value: dict[str, Any] | None = None
+
+    @property
+    def decoded(self) -> bool:
+        """Whether the underlying JSON has been parsed."""
+        return self._value is not None
+
+    @property
+    def raw(self) -> str | None:
+        """The original JSON text while undecoded; None afterwards (it may be stale)."""
+        return self._raw
+
+    def materialize(self) -> dict[str, Any]:
+        """Decode (once) and return the underlying dictionary."""
+        if self._value is None:
+            self._value = loads(self._raw)
+            self._raw = None
+        return self._value
+
+    def __getitem__(self, key: str) -> Any:
+        return self.materialize()[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.materialize()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.materialize()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.materialize())
+
+    def __len__(self) -> int:
+        return len(self.materialize())
+
+    def __repr__(self) -> str:
+        return repr(self.materialize()) if self.decoded else f"LazyJSON({self._raw!r})"
+
+    def copy(self) -> dict[str, Any]:
+        return dict(self.materialize())
+
+
+_dumps: Callable[[Any], str]
+_loads: Callable[[str | bytes], Any]
+_backend = ""
+
+
+def set_backend(name: str | None = None) -> str:
+    """Select the JSON backend, or the fastest installed one when ``name`` is None.
+
+    Returns:
+        The name of the active backend.
+    """
+    global _dumps, _loads, _backend
+
+    if name is not None:
+        _dumps, _loads = _load_backend(name)
+        _backend = name
+        return name
+
+    for candidate in BACKENDS:
+        try:
+            _dumps, _loads = _load_backend(candidate)
+        except ImportError:
+            continue
+        _backend = candidate
+        return candidate
+    raise RuntimeError("No JSON backend available")  # pragma: no cover - json is stdlib
+
+
+def get_backend() -> str:
+    """Return the name of the active JSON backend."""
+    return _backend
+
+
+def dumps(obj: Any) -> str:
+    """Serialize ``obj`` to JSON text with the active backend."""
+    if type(obj) is LazyJSON and not obj.decoded:
+        # Untouched lazy columns are written back verbatim
+        return obj.raw
+    return _dumps(obj)
+
+
+def loads(text: str | bytes) -> Any:
+    """Parse JSON text with the active backend."""
+    return _loads(text)
+
+
+def _optional_inner(hint: Any) -> Any | None:
+    """Return ``X`` for ``X | None`` hints, otherwise None."""
+    if get_origin(hint) in (Union, types.UnionType):
+        args = [arg for arg in get_args(hint) if arg is not type(None)]
+        if len(args) == 1 and len(get_args(hint)) == 2:
+            return args[0]
+    return None
+
+
+def _field_plan(cls: type) -> list[tuple[str, Any, bool]]:
+    hints = get_type_hints(cls)
+    plan = []
+    for field in dataclasses.fields(cls):
+        hint = hints[field.name]
+        inner = _optional_inner(hint)
+        plan.append((field.name, inner if inner is not None else hint, inner is not None))
+    return plan
+
+
+@cache
+def record_encoder(cls: type) -> Callable[[Any], dict[str, Any]]:
+    """Generate a function converting a ``cls`` instance to a JSON-ready dict."""
+    namespace: dict[str, Any] = {}
+    entries = []
+    for name, hint, optional in _field_plan(cls):
+        value = f"obj.{name}"
+        if hint is datetime:
+            expression = f"{value}.isoformat()"
+        elif isinstance(hint, type) and issubclass(hint, Enum):
+            expression = f"{value}.value"
+        elif dataclasses.is_dataclass(hint):
+            namespace[f"_encode_{name}"] = record_encoder(hint)
+            expression = f"_encode_{name}({value})"
+        else:
+            entries.append(f"{name!r}: {value}")
+            continue
+        if optional:
+            expression = f"({expression} if {value} else None)"
+        entries.append(f"{name!r}: {expression}")
+
+    source = "def encode(obj):\n    return {" + ", ".join(entries) + "}\n"
+    exec(compile(source, f"<encoder {cls.__name__}>", "exec"), namespace)  # noqa: S102
+    return namespace["encode"]
+
+
+def _compile_decoder(
+    cls: type,
+    *,
+    row: bool,
+    json_fields: tuple[str, ...] = (),
+    object_fields: tuple[str, ...] = (),
+) -> Callable[..., Any]:
+    plan = _field_plan(cls)
+    unknown = set(json_fields + object_fields) - {name for name, _, _ in plan}
+    if unknown:
+        raise ValueError(f"{cls.__name__} has no fields {sorted(unknown)}")
+
+    namespace: dict[str, Any] = {
+        "_cls": cls,
+        "_fromisoformat": datetime.fromisoformat,
+        "_json_loads": loads,
+    }
+    arguments = []
+    for name, hint, optional in plan:
+        # Row columns always exist (NULL for missing values); dict keys may be absent
+        value = f"data[{name!r}]" if row or not optional else f"data.get({name!r})"
+        if name in json_fields:
+            expression = f"_json_loads({value})"
+        elif name in object_fields:
+            expression = f"decode_object({value})"
+        elif hint is datetime:
+            expression = f"_fromisoformat({value})"
+        elif isinstance(hint, type) and issubclass(hint, Enum):
+            namespace[f"_enum_{name}"] = hint
+            expression = f"_enum_{name}({value})"
+        elif dataclasses.is_dataclass(hint):
+            namespace[f"_decode_{name}"] = record_decoder(hint)
+            expression = f"_decode_{name}({value})"
+        else:
+            arguments.append(f"{name}={value}")
+            continue
+        if optional:
+            expression = f"({expression} if {value} else None)"
+        arguments.append(f"{name}={expression}")
+
+    signature = "data, decode_object=_json_loads" if row else "data"
+    source = f"def decode({signature}):\n    return _cls(" + ", ".join(arguments) + ")\n"
+    exec(compile(source, f"<decoder {cls.__name__}>", "exec"), namespace)  # noqa: S102
+    return namespace["decode"]
+
+
+@cache
+def record_decoder(cls: type) -> Callable[[dict[str, Any]], Any]:
+    """Generate a function building a ``cls`` instance from an encoded dict.
+
+    Optional fields may be absent from the input.
+    """
+    return _compile_decoder(cls, row=False)
+
+
+@cache
+def row_decoder(
+    cls: type,
+    json_fields: tuple[str, ...] = (),
+    object_fields: tuple[str, ...] = (),
+) -> Callable[..., Any]:
+    """Generate a function building a ``cls`` instance from a database row.
+
+    The row is read by column name (e.g. a ``sqlite3.Row``). Datetimes are stored as
+    ISO text and enums by value; ``json_fields`` hold JSON text decoded with
+    :func:`loads`. ``object_fields`` hold JSON objects decoded by the
+    ``decode_object`` callable passed as the decoder's second argument, which lets
+    the caller choose between :func:`loads` and :class:`LazyJSON` per call.
+    """
+    return _compile_decoder(cls, row=True, json_fields=json_fields, object_fields=object_fields)
+
+
+def encode_record(obj: Any) -> str:
+    """Serialize a record dataclass to JSON text."""
+    return dumps(record_encoder(type(obj))(obj))
+
+
+def decode_record(cls: type, text: str | bytes) -> Any:
+    """Parse JSON text produced by :func:`encode_record` into a ``cls`` instance."""
+    return record_decoder(cls)(loads(text))
+
+
+def _select_initial_backend() -> None:
+    requested = os.environ.get("TEMPORAL_DB_JSON") or None
+    try:
+        set_backend(requested)
+    except (ImportError, ValueError) as exc:
+        # A misconfigured environment must not make the package unimportable
+        warnings.warn(
+            f"TEMPORAL_DB_JSON={requested!r} is unavailable ({exc}); "
+            "selecting a JSON backend automatically",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        set_backend()
+
+
+_select_initial_backend()
+
+
+__all__ = [
+    "BACKENDS",
+    "LazyJSON",
+    "decode_record",
+    "dumps",
+    "encode_record",
+    "get_backend",
+    "loads",
+    "record_decoder",
+    "record_encoder",
+    "row_decoder",
+    "set_backend",
+]
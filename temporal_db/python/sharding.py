@@ -0,0 +1,561 @@
+# mypy: ignore-errors
+"""Multi-file sharding for the temporal database.
+
+Specification history (``specifications`` and ``changes`` rows) is routed to one of
+several SQLite files by specification identifier, so independent projects or spec
+types no longer contend for a single write lock. Architectural patterns and pattern
+recommendations are global reference data and live on the primary shard.
+
+Reads that span shards run concurrently, one worker thread per shard, each on a
+read-only connection of its own (SQLite releases the GIL while a query runs), and are
+merged in Python. In-memory shards have a single connection and are read in turn.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from .repository import TemporalRepository, initialize_temporal_database
+from .types import (
+    ArchitecturalPattern,
+    PatternRecommendation,
+    SpecificationRecord,
+    SpecificationSummary,
+    SpecificationType,
+)
+
+ShardRouter = Callable[[str], str]
+"""Maps a specification identifier (or decision ``spec_id``) to a shard name."""
+
+# Rows per copy-and-delete transaction during ``rebalance``
+REBALANCE_BATCH_SIZE = 500
+
+# Sharded tables and the column holding the identifier they are routed by
+_ROUTED_TABLES = {"specifications": "identifier", "changes": "spec_id"}
+
+# Columns copied to the destination shard; change rows get new (higher) ids there
+_MOVED_COLUMNS = {
+    "specifications": (
+        "id, spec_type, identifier, title, content, template_variables, timestamp, "
+        "version, author, matrix_ids, metadata, hash"
+    ),
+    "changes": (
+        "spec_id, change_type, field, old_value, new_value, author, context, confidence, timestamp"
+    ),
+}
+
+
+def spec_type_router(
+    default_shard: str,
+    shard_names: Iterable[str] | None = None,
+) -> ShardRouter:
+    """Route by spec type, taken from the identifier prefix (``ADR-001`` -> ``ADR``).
+
+    Identifiers without a recognised spec type prefix go to ``default_shard``. When
+    ``shard_names`` is given, spec types without a shard of their own go there too.
+    """
+    known = {spec_type.value for spec_type in SpecificationType}
+    if shard_names is not None:
+        known &= set(shard_names)
+
+    def route(identifier: str) -> str:
+        prefix = identifier.split("-", 1)[0].upper()
+        return prefix if prefix in known else default_shard
+
+    return route
+
+
+def hash_router(
+    shard_names: list[str],
+    key: Callable[[str], str] | None = None,
+) -> ShardRouter:
+    """Route by a stable hash of ``key(identifier)`` across ``shard_names``.
+
+    Use ``key`` to extract the project from identifiers, e.g.
+    ``key=lambda ident: ident.split("/", 1)[0]`` for ``project/ADR-001`` style ids, so
+    that every record of a project lands on the same shard.
+    """
+    if not shard_names:
+        raise ValueError("hash_router requires at least one shard")
+    names = list(shard_names)
+
+    def route(identifier: str) -> str:
+        routing_key = key(identifier) if key else identifier
+        digest = hashlib.md5(routing_key.encode()).digest()
+        return names[int.from_bytes(digest[:8], "big") % len(names)]
+
+    return route
+
+
+def project_router(shard_names: list[str], separator: str = "/") -> ShardRouter:
+    """Route every record of a project to the same shard.
+
+    The project is the identifier part before ``separator`` (``billing/ADR-001`` ->
+    ``billing``); identifiers without one are hashed whole.
+    """
+    return hash_router(shard_names, key=lambda identifier: identifier.split(separator, 1)[0])
+
+
+def _move_rows(
+    connection: sqlite3.Connection,
+    table: str,
+    route_column: str,
+    target: str,
+    batch_size: int,
+) -> int:
+    """Move rows routed to ``target`` into the attached ``target`` database.
+
+    Rows are visited in rowid order, one batch per transaction.
+    """
+    columns = _MOVED_COLUMNS[table]
+    moved = 0
+    last_rowid = -1
+    while True:
+        rowids = [
+            row[0]
+            for row in connection.execute(
+                f"""
+                SELECT rowid FROM main.{table}
+                WHERE rowid > ? AND shard_route({route_column}) = ?
+                ORDER BY rowid
+                LIMIT ?
+                """,  # noqa: S608 - table and column come from _ROUTED_TABLES
+                (last_rowid, target, batch_size),
+            )
+        ]
+        if not rowids:
+            return moved
+
+        placeholders = ", ".join("?" * len(rowids))
+        with connection:
+            connection.execute(
+                f"""
+                INSERT OR REPLACE INTO target.{table} ({columns})
+                SELECT {columns} FROM main.{table} WHERE rowid IN ({placeholders})
+                """,  # noqa: S608 - identifiers come from _ROUTED_TABLES and _MOVED_COLUMNS
+                rowids,
+            )
+            # The table name comes from _ROUTED_TABLES
+            connection.execute(
+                f"DELETE FROM main.{table} WHERE rowid IN ({placeholders})",  # noqa: S608
+                rowids,
+            )
+        moved += len(rowids)
+        last_rowid = rowids[-1]
+
+
+class ShardedTemporalRepository:
+    """Temporal repository spread over several SQLite files."""
+
+    def __init__(
+        self,
+        shard_paths: Mapping[str, str],
+        router: ShardRouter | None = None,
+        *,
+        primary_shard: str | None = None,
+    ):
+        """Initialize the sharded repository.
+
+        Args:
+            shard_paths: Shard name to database base path.
+            router: Identifier to shard name routing function. Defaults to
+                :func:`hash_router` over all shards.
+            primary_shard: Shard holding patterns and recommendations. Defaults to the
+                first shard.
+        """
+        if not shard_paths:
+            raise ValueError("At least one shard is required")
+
+        self.shard_paths = dict(shard_paths)
+        self.router = router or hash_router(list(self.shard_paths))
+        self.primary_shard = primary_shard or next(iter(self.shard_paths))
+        if self.primary_shard not in self.shard_paths:
+            raise ValueError(f"Unknown primary shard: {self.primary_shard}")
+        self.shards: dict[str, TemporalRepository] = {}
+        # Read-only connections used by cross-shard reads on worker threads
+        self._readers: dict[str, tuple[TemporalRepository, threading.Lock]] = {}
+
+    async def initialize(self) -> None:
+        """Open every shard, creating missing files and schema."""
+        for name, path in self.shard_paths.items():
+            shard = await initialize_temporal_database(path)
+            self.shards[name] = shard
+            if shard.db_file is not None:
+                reader = TemporalRepository(path, lazy_json=shard.lazy_json)
+                reader.connection = sqlite3.connect(
+                    f"{shard.db_file.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+                )
+                reader.connection.row_factory = sqlite3.Row
+                self._readers[name] = (reader, threading.Lock())
+
+    async def _fan_out[T](
+        self, read: Callable[[TemporalRepository], Coroutine[Any, Any, T]]
+    ) -> list[T]:
+        """Run ``read`` against every shard concurrently, in shard order."""
+        return await asyncio.gather(*(self._read_shard(name, read) for name in self.shards))
+
+    async def _read_shard[T](
+        self, name: str, read: Callable[[TemporalRepository], Coroutine[Any, Any, T]]
+    ) -> T:
+        if name not in self._readers:
+            return await read(self.shards[name])
+        reader, lock = self._readers[name]
+
+        def run() -> T:
+            # A private event loop per call; the reader connection is not shared meanwhile
+            with lock:
+                return asyncio.run(read(reader))
+
+        return await asyncio.to_thread(run)
+
+    def shard_for(self, identifier: str) -> TemporalRepository:
+        """Return the shard that owns ``identifier``."""
+        if not self.shards:
+            raise RuntimeError("Database not initialized")
+
+        name = self.router(identifier)
+        if name not in self.shards:
+            raise ValueError(f"Router returned unknown shard '{name}' for '{identifier}'")
+        return self.shards[name]
+
+    @property
+    def primary(self) -> TemporalRepository:
+        """Return the shard holding global pattern data."""
+        if not self.shards:
+            raise RuntimeError("Database not initialized")
+        return self.shards[self.primary_shard]
+
+    async def store_specification(self, spec: SpecificationRecord) -> None:
+        """Store a specification record on its routed shard."""
+        await self.shard_for(spec.identifier).store_specification(spec)
+
+    async def get_latest_specification(
+        self, spec_type: str, identifier: str
+    ) -> SpecificationRecord | None:
+        """Get the latest version of a specification from its routed shard."""
+        return await self.shard_for(identifier).get_latest_specification(spec_type, identifier)
+
+    async def record_decision(
+        self,
+        spec_id: str,
+        decision_point: str,
+        selected_option: str,
+        context: str,
+        author: str,
+        confidence: float | None = None,
+    ) -> None:
+        """Record a decision on the shard that owns ``spec_id``."""
+        await self.shard_for(spec_id).record_decision(
+            spec_id, decision_point, selected_option, context, author, confidence
+        )
+
+    async def get_recent_specifications(
+        self,
+        limit: int = 20,
+        spec_type: SpecificationType | None = None,
+    ) -> list[SpecificationRecord]:
+        """Return the most recent specification entries across all shards."""
+        per_shard = await self._fan_out(
+            lambda shard: shard.get_recent_specifications(limit=limit, spec_type=spec_type)
+        )
+        merged = [record for records in per_shard for record in records]
+        merged.sort(key=lambda record: record.timestamp.astimezone(UTC), reverse=True)
+        return merged[:limit]
+
+    async def get_recent_specification_summaries(
+        self,
+        limit: int = 20,
+        spec_type: SpecificationType | None = None,
+    ) -> list[SpecificationSummary]:
+        """Return the most recent specification summaries across all shards."""
+        per_shard = await self._fan_out(
+            lambda shard: shard.get_recent_specification_summaries(limit=limit, spec_type=spec_type)
+        )
+        merged = [summary for summaries in per_shard for summary in summaries]
+        merged.sort(key=lambda summary: summary.timestamp.astimezone(UTC), reverse=True)
+        return merged[:limit]
+
+    async def analyze_decision_patterns(
+        self,
+        lookback_days: int,
+        *,
+        as_of: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Analyze decision patterns, combining per-shard aggregates."""
+        per_shard = await self._fan_out(
+            lambda shard: shard.analyze_decision_patterns(lookback_days, as_of=as_of)
+        )
+
+        merged: dict[str, dict[str, Any]] = {}
+        for stats in per_shard:
+            for stat in stats:
+                existing = merged.get(stat["decision_point"])
+                if existing is None:
+                    merged[stat["decision_point"]] = {**stat, "contexts": list(stat["contexts"])}
+                    continue
+                existing["total_decisions"] += stat["total_decisions"]
+                existing["selected_count"] += stat["selected_count"]
+                existing["contexts"].extend(stat["contexts"])
+                if existing["spec_type"] == "unknown":
+                    existing["spec_type"] = stat["spec_type"]
+
+        return list(merged.values())
+
+    async def get_decision_outcomes(
+        self,
+        lookback_days: int,
+        *,
+        as_of: datetime | None = None,
+    ) -> list[tuple[str, float, bool]]:
+        """Return per-decision outcomes from every shard."""
+        per_shard = await self._fan_out(
+            lambda shard: shard.get_decision_outcomes(lookback_days, as_of=as_of)
+        )
+        return [row for rows in per_shard for row in rows]
+
+    async def get_data_versions(self) -> dict[str, int]:
+        """Sum the per-table write counters of every shard.
+
+        Counters only grow, so the sum changes whenever any shard is written.
+        """
+        per_shard = await self._fan_out(lambda shard: shard.get_data_versions())
+        versions: dict[str, int] = {}
+        for counters in per_shard:
+            for name, version in counters.items():
+                versions[name] = versions.get(name, 0) + version
+        return versions
+
+    async def get_cached_recommendations(
+        self,
+        cache_key: str,
+        data_version: str,
+        max_age_seconds: float | None = None,
+    ) -> dict[str, Any] | None:
+        """Read a cached recommendation result from the primary shard."""
+        return await self.primary.get_cached_recommendations(
+            cache_key, data_version, max_age_seconds
+        )
+
+    async def store_cached_recommendations(
+        self,
+        cache_key: str,
+        data_version: str,
+        result: dict[str, Any],
+    ) -> None:
+        """Cache a recommendation result on the primary shard."""
+        await self.primary.store_cached_recommendations(cache_key, data_version, result)
+
+    async def get_feedback_counts(
+        self,
+        *,
+        as_of: datetime | None = None,
+    ) -> dict[str, dict[str, int]]:
+        """Count recommendation feedback on the primary shard."""
+        return await self.primary.get_feedback_counts(as_of=as_of)
+
+    async def find_specifications_by_matrix_id(
+        self,
+        matrix_id: str,
+        latest_only: bool = True,
+    ) -> list[SpecificationRecord]:
+        """Return specifications linked to a traceability matrix ID on any shard."""
+        per_shard = await self._fan_out(
+            lambda shard: shard.find_specifications_by_matrix_id(matrix_id, latest_only=latest_only)
+        )
+        merged = [record for records in per_shard for record in records]
+        merged.sort(key=lambda record: record.identifier)
+        return merged
+
+    async def matrix_coverage(self, matrix_ids: list[str] | None = None) -> dict[str, int]:
+        """Count linked specification identifiers per matrix ID across shards.
+
+        Identifiers are routed to exactly one shard, so per-shard counts add up.
+        """
+        per_shard = await self._fan_out(lambda shard: shard.matrix_coverage(matrix_ids))
+        coverage: dict[str, int] = dict.fromkeys(matrix_ids, 0) if matrix_ids else {}
+        for counts in per_shard:
+            for matrix_id, count in counts.items():
+                coverage[matrix_id] = coverage.get(matrix_id, 0) + count
+        return coverage
+
+    async def store_architectural_pattern(self, pattern: ArchitecturalPattern) -> None:
+        """Store an architectural pattern on the primary shard."""
+        await self.primary.store_architectural_pattern(pattern)
+
+    async def get_similar_patterns(
+        self,
+        context: str,
+        similarity_threshold: float,
+        lookback_days: int,
+    ) -> list[ArchitecturalPattern]:
+        """Get similar architectural patterns from the primary shard."""
+        return await self.primary.get_similar_patterns(context, similarity_threshold, lookback_days)
+
+    async def find_patterns_by_metadata(
+        self,
+        key: str,
+        values: Iterable[object],
+    ) -> list[ArchitecturalPattern]:
+        """Find patterns by indexed metadata on the primary shard."""
+        return await self.primary.find_patterns_by_metadata(key, values)
+
+    async def store_pattern_recommendation(self, recommendation: PatternRecommendation) -> None:
+        """Persist a pattern recommendation on the primary shard."""
+        await self.primary.store_pattern_recommendation(recommendation)
+
+    async def get_pattern_recommendations(
+        self,
+        limit: int = 10,
+        include_expired: bool = False,
+    ) -> list[PatternRecommendation]:
+        """Fetch stored pattern recommendations from the primary shard."""
+        return await self.primary.get_pattern_recommendations(
+            limit=limit, include_expired=include_expired
+        )
+
+    async def find_recommendations_by_metadata(
+        self,
+        key: str,
+        values: Iterable[object],
+        limit: int = 10,
+        include_expired: bool = False,
+    ) -> list[PatternRecommendation]:
+        """Find recommendations by indexed metadata on the primary shard."""
+        return await self.primary.find_recommendations_by_metadata(
+            key, values, limit=limit, include_expired=include_expired
+        )
+
+    async def replace_recommendations(
+        self,
+        generated: Sequence[PatternRecommendation],
+        retention_days: int,
+    ) -> int:
+        """Persist recommendations and purge stale ones on the primary shard."""
+        return await self.primary.replace_recommendations(generated, retention_days)
+
+    async def purge_stale_recommendations(self, retention_days: int) -> int:
+        """Remove stale recommendations from the primary shard."""
+        return await self.primary.purge_stale_recommendations(retention_days)
+
+    async def record_recommendation_feedback(
+        self,
+        recommendation_id: str,
+        action: str,
+        reason: str | None = None,
+    ) -> PatternRecommendation | None:
+        """Record recommendation feedback on the primary shard."""
+        return await self.primary.record_recommendation_feedback(recommendation_id, action, reason)
+
+    async def rebalance(
+        self,
+        router: ShardRouter,
+        *,
+        batch_size: int = REBALANCE_BATCH_SIZE,
+    ) -> dict[str, int]:
+        """Move specification history so that it matches ``router``.
+
+        Each source shard attaches one destination at a time and streams the rows the
+        router assigns to it in batches of ``batch_size``. A batch is copied and deleted
+        from the source in a single transaction spanning both files, so an interrupted
+        rebalance leaves no duplicates and can simply be run again. The repository uses
+        ``router`` for subsequent writes.
+
+        Change rows keep their timestamps but are appended to the destination's change
+        feed with new ids above its existing ones, so a ``tail``/``get_changes_since``
+        cursor on the destination is never skipped past them but delivers them again.
+        Change-feed consumers should pause writes, rebalance and then resume every shard
+        from :meth:`change_cursors` instead of their stored cursors.
+
+        Returns:
+            Counts of moved ``specifications`` and ``changes`` rows.
+        """
+        if not self.shards:
+            raise RuntimeError("Database not initialized")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        if any(shard.db_file is None for shard in self.shards.values()):
+            raise ValueError("Rebalancing requires file-backed shards")
+
+        for shard in self.shards.values():
+            shard.connection.create_function("shard_route", 1, router, deterministic=True)
+        try:
+            # Validate every destination before moving anything
+            for shard in self.shards.values():
+                for table, route_column in _ROUTED_TABLES.items():
+                    # Identifiers come from _ROUTED_TABLES
+                    for (target,) in shard.connection.execute(
+                        f"SELECT DISTINCT shard_route({route_column}) FROM {table}"  # noqa: S608
+                    ):
+                        if target not in self.shards:
+                            raise ValueError(f"Router returned unknown shard '{target}'")
+
+            moved = dict.fromkeys(_ROUTED_TABLES, 0)
+            for source_name, source in self.shards.items():
+                for target_name, target in self.shards.items():
+                    if target_name == source_name:
+                        continue
+                    source.connection.execute("ATTACH DATABASE ? AS target", (str(target.db_file),))
+                    try:
+                        for table, route_column in _ROUTED_TABLES.items():
+                            moved[table] += _move_rows(
+                                source.connection, table, route_column, target_name, batch_size
+                            )
+                    finally:
+                        source.connection.execute("DETACH DATABASE target")
+        finally:
+            for shard in self.shards.values():
+                shard.connection.create_function("shard_route", 1, None)
+
+        self.router = router
+        return moved
+
+    async def change_cursors(self) -> dict[str, int]:
+        """Return the latest change id of every shard.
+
+        Passing a shard's cursor to its ``tail``/``get_changes_since`` resumes its
+        change feed after everything committed so far, e.g. after :meth:`rebalance`.
+        """
+        if not self.shards:
+            raise RuntimeError("Database not initialized")
+        return {
+            name: shard.connection.execute("SELECT COALESCE(MAX(id), 0) FROM changes").fetchone()[0]
+            for name, shard in self.shards.items()
+        }
+
+    async def close(self) -> None:
+        """Close every shard connection."""
+        for reader, lock in self._readers.values():
+            with lock:
+                await reader.close()
+        self._readers = {}
+        for shard in self.shards.values():
+            await shard.close()
+        self.shards = {}
+
+
+async def initialize_sharded_temporal_database(
+    shard_paths: Mapping[str, str],
+    router: ShardRouter | None = None,
+    *,
+    primary_shard: str | None = None,
+) -> ShardedTemporalRepository:
+    """Initialize a sharded temporal database repository."""
+    repo = ShardedTemporalRepository(shard_paths, router, primary_shard=primary_shard)
+    await repo.initialize()
+    return repo
+
+
+__all__ = [
+    "ShardRouter",
+    "ShardedTemporalRepository",
+    "hash_router",
+    "initialize_sharded_temporal_database",
+    "project_router",
+    "spec_type_router",
+]
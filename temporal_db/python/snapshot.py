@@ -0,0 +1,230 @@
+# mypy: ignore-errors
+"""Columnar, memory-mapped snapshots of the decision history.
+
+``export_decision_snapshot`` streams the ``Decision`` rows of the ``changes`` table
+into a directory of NumPy ``.npy`` column files plus a JSON manifest. Low-cardinality
+text columns (decision point, selected option, author, context, spec type) are
+dictionary-encoded to integer codes, and timestamps are stored as epoch seconds.
+
+``DecisionSnapshot.open`` memory-maps the columns so analysis code can aggregate
+millions of decisions with vectorized NumPy operations instead of hydrating
+``sqlite3.Row`` objects one at a time. NumPy is an optional dependency; it is only
+imported when a snapshot is written or opened.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from .repository import TemporalRepository
+from .types import ChangeType
+
+SNAPSHOT_FORMAT = "temporal-decision-snapshot"
+# Version 2 stores confidence as float64; float32 snapshots disagree with SQL thresholds
+SNAPSHOT_VERSION = 2
+MANIFEST_FILE = "manifest.json"
+
+_SELECTED_CONFIDENCE = 0.7
+_ENCODED_COLUMNS = ("decision_point", "selected_option", "author", "context", "spec_type")
+_COLUMN_DTYPES = {
+    "id": "int64",
+    "timestamp": "int64",
+    "confidence": "float64",
+    **{name: "int32" for name in _ENCODED_COLUMNS},
+}
+
+
+def _require_numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise RuntimeError(
+            "Decision snapshots require NumPy; install it with 'pip install numpy'"
+        ) from exc
+    return np
+
+
+def export_decision_snapshot(
+    source: TemporalRepository | sqlite3.Connection,
+    output_dir: str | Path,
+    *,
+    batch_size: int = 100_000,
+) -> dict[str, Any]:
+    """Write the decision history into a columnar snapshot directory.
+
+    Rows are read in batches into preallocated column arrays, so peak memory is the
+    size of the encoded columns rather than of the hydrated rows.
+
+    Returns:
+        The snapshot manifest.
+    """
+    np = _require_numpy()
+    connection = source.connection if isinstance(source, TemporalRepository) else source
+    if connection is None:
+        raise RuntimeError("Database not initialized")
+
+    row_count = connection.execute(
+        "SELECT COUNT(*) FROM changes WHERE change_type = ?", (ChangeType.DECISION.value,)
+    ).fetchone()[0]
+
+    columns = {name: np.empty(row_count, dtype=dtype) for name, dtype in _COLUMN_DTYPES.items()}
+    dictionaries: dict[str, dict[str, int]] = {name: {} for name in _ENCODED_COLUMNS}
+
+    cursor = connection.execute(
+        """
+        SELECT id,
+               CAST(strftime('%s', timestamp) AS INTEGER),
+               confidence,
+               field,
+               new_value,
+               author,
+               context,
+               substr(spec_id, 1, 3)
+        FROM changes
+        WHERE change_type = ?
+        ORDER BY id
+        """,
+        (ChangeType.DECISION.value,),
+    )
+
+    offset = 0
+    while offset < row_count:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        end = offset + len(rows)
+        ids, timestamps, confidences, *encoded = zip(*rows)
+        columns["id"][offset:end] = ids
+        columns["timestamp"][offset:end] = timestamps
+        columns["confidence"][offset:end] = [
+            float("nan") if value is None else value for value in confidences
+        ]
+        for name, values in zip(_ENCODED_COLUMNS, encoded):
+            codes = dictionaries[name]
+            columns[name][offset:end] = [
+                codes.setdefault("" if value is None else value, len(codes)) for value in values
+            ]
+        offset = end
+
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    for name, array in columns.items():
+        np.save(output / f"{name}.npy", array[:offset])
+
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "rows": offset,
+        "high_water_id": int(columns["id"][offset - 1]) if offset else 0,
+        "columns": _COLUMN_DTYPES,
+        "dictionaries": {name: list(codes) for name, codes in dictionaries.items()},
+    }
+    (output / MANIFEST_FILE).write_text(json.dumps(manifest), encoding="utf-8")
+    return manifest
+
+
+@dataclass
+class DecisionSnapshot:
+    """Memory-mapped columnar view of the decision history."""
+
+    path: Path
+    manifest: dict[str, Any]
+    columns: dict[str, Any]
+
+    @classmethod
+    def open(cls, path: str | Path) -> DecisionSnapshot:
+        """Open a snapshot directory, memory-mapping every column."""
+        np = _require_numpy()
+        root = Path(path)
+        manifest = json.loads((root / MANIFEST_FILE).read_text(encoding="utf-8"))
+        if manifest.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"Not a decision snapshot: {root}")
+        if manifest.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {manifest.get('version')}")
+
+        # Zero-length files cannot be memory-mapped
+        mmap_mode = "r" if manifest["rows"] else None
+        columns = {
+            name: np.load(root / f"{name}.npy", mmap_mode=mmap_mode) for name in manifest["columns"]
+        }
+        return cls(path=root, manifest=manifest, columns=columns)
+
+    def __len__(self) -> int:
+        return int(self.manifest["rows"])
+
+    def dictionary(self, column: str) -> list[str]:
+        """Return the code-to-value table for a dictionary-encoded column."""
+        return self.manifest["dictionaries"][column]
+
+    def window_mask(self, lookback_days: int, now: datetime | None = None) -> Any:
+        """Return a boolean mask of decisions newer than ``lookback_days``."""
+        cutoff = (now or datetime.now(UTC)) - timedelta(days=lookback_days)
+        return self.columns["timestamp"] > int(cutoff.timestamp())
+
+    def decision_stats(
+        self,
+        lookback_days: int,
+        *,
+        now: datetime | None = None,
+        include_contexts: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Aggregate decisions per decision point, vectorized.
+
+        Produces the same shape as ``TemporalRepository.analyze_decision_patterns``.
+        """
+        np = _require_numpy()
+        names = self.dictionary("decision_point")
+        if not len(self) or not names:
+            return []
+
+        mask = self.window_mask(lookback_days, now)
+        points = self.columns["decision_point"][mask]
+        if not points.size:
+            return []
+
+        totals = np.bincount(points, minlength=len(names))
+        selected = np.bincount(
+            points,
+            weights=self.columns["confidence"][mask] > _SELECTED_CONFIDENCE,
+            minlength=len(names),
+        )
+        present, first_index = np.unique(points, return_index=True)
+        spec_type_codes = self.columns["spec_type"][mask][first_index]
+        spec_type_names = self.dictionary("spec_type")
+
+        contexts_by_point: dict[int, list[str]] = {}
+        if include_contexts:
+            context_names = self.dictionary("context")
+            order = np.argsort(points, kind="stable")
+            grouped = np.split(
+                self.columns["context"][mask][order], np.cumsum(totals[present])[:-1]
+            )
+            contexts_by_point = {
+                int(code): [context_names[value] for value in group]
+                for code, group in zip(present, grouped)
+            }
+
+        stats = [
+            {
+                "decision_point": names[code],
+                "spec_type": spec_type_names[spec_code] or "unknown",
+                "total_decisions": int(totals[code]),
+                "selected_count": int(selected[code]),
+                "contexts": contexts_by_point.get(int(code), []),
+            }
+            for code, spec_code in zip(present, spec_type_codes)
+        ]
+        stats.sort(key=lambda stat: stat["decision_point"])
+        return stats
+
+
+__all__ = [
+    "DecisionSnapshot",
+    "export_decision_snapshot",
+]
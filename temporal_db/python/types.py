@@ -41,7 +41,7 @@ class ChangeType(Enum):
     PATTERN = "Pattern"
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecificationRecord:
     """A specification record stored in the temporal database."""
 
@@ -125,7 +125,48 @@ class SpecificationRecord:
         )
 
 
-@dataclass
+@dataclass(slots=True)
+class SpecificationSummary:
+    """The list-view columns of a specification, without content or JSON columns."""
+
+    id: str
+    spec_type: SpecificationType
+    identifier: str
+    title: str
+    timestamp: datetime
+    version: int
+    author: str | None
+    hash: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "id": self.id,
+            "spec_type": self.spec_type.value,
+            "identifier": self.identifier,
+            "title": self.title,
+            "timestamp": self.timestamp.isoformat(),
+            "version": self.version,
+            "author": self.author,
+            "hash": self.hash,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SpecificationSummary":
+        """Create from dictionary."""
+        return cls(
+            id=data["id"],
+            spec_type=SpecificationType(data["spec_type"]),
+            identifier=data["identifier"],
+            title=data["title"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            version=data["version"],
+            author=data.get("author"),
+            hash=data["hash"],
+        )
+
+
+@dataclass(slots=True)
 class SpecificationChange:
     """A change record in the temporal database."""
 
@@ -166,7 +207,33 @@ class SpecificationChange:
         )
 
 
-@dataclass
+@dataclass(slots=True)
+class ChangeEvent:
+    """A committed row of the changes table, as emitted by the change feed."""
+
+    id: int
+    timestamp: datetime
+    change: SpecificationChange
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "id": self.id,
+            "timestamp": self.timestamp.isoformat(),
+            "change": self.change.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ChangeEvent":
+        """Create from dictionary."""
+        return cls(
+            id=data["id"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            change=SpecificationChange.from_dict(data["change"]),
+        )
+
+
+@dataclass(slots=True)
 class ArchitecturalPattern:
     """An architectural pattern stored in the temporal database."""
 
@@ -239,7 +306,7 @@ class ArchitecturalPattern:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionPoint:
     """A decision point in the specification process."""
 
@@ -274,7 +341,7 @@ class DecisionPoint:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionOption:
     """A decision option for a decision point."""
 
@@ -318,7 +385,7 @@ class DecisionOption:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PatternRecommendation:
     """A generated pattern recommendation entry."""
 
@@ -0,0 +1,155 @@
+from datetime import datetime
+
+import pytest
+
+from libs.prompt_optimizer.application.ports import (
+    MLFeatures,
+    OptimizationPattern,
+    TemporalDatabasePort,
+    TokenCounterPort,
+)
+from libs.prompt_optimizer.application.use_cases import (
+    AnalyzePromptCommand,
+    AnalyzePromptUseCase,
+    CachedAnalyzePromptUseCase,
+    analysis_cache_key,
+)
+from libs.prompt_optimizer.domain.entities import (
+    ModelType,
+    OptimizationGoal,
+    Prompt,
+    PromptOptimizationSession,
+    TokenCount,
+)
+from libs.prompt_optimizer.domain.services import PromptAnalyzer, PromptFeatureExtractor
+from libs.prompt_optimizer.infrastructure.adapters import InMemoryPromptRepository
+from libs.prompt_optimizer.infrastructure.analysis_cache import TieredAnalysisCache
+
+
+class CountingTokenCounter(TokenCounterPort):
+    def __init__(self, kind: str = "exact") -> None:
+        self.calls = 0
+        self.kind = kind
+
+    @property
+    def counter_kind(self) -> str:
+        return self.kind
+
+    async def count_tokens(self, content: str, model: ModelType) -> TokenCount:
+        self.calls += 1
+        total = len(content.split())
+        return TokenCount(
+            total_tokens=total,
+            model=model,
+            estimated_cost=await self.estimate_cost(total, model),
+            token_distribution={"words": total},
+        )
+
+    async def estimate_cost(self, token_count: int, model: ModelType) -> float:
+        return token_count * 0.001
+
+
+class RecordingTemporalDatabase(TemporalDatabasePort):
+    def __init__(self) -> None:
+        self.stored: list[Prompt] = []
+
+    async def store_prompt_analysis(self, prompt: Prompt, timestamp: datetime) -> None:
+        self.stored.append(prompt)
+
+    async def store_optimization_session(self, session: PromptOptimizationSession) -> None:
+        pass
+
+    async def get_similar_prompts(
+        self, features: MLFeatures, similarity_threshold: float = 0.7
+    ) -> list[Prompt]:
+        return []
+
+    async def get_optimization_patterns(
+        self, goal: OptimizationGoal, days_back: int = 90
+    ) -> list[OptimizationPattern]:
+        return []
+
+
+def _use_case(
+    cache: TieredAnalysisCache, counter_kind: str = "exact"
+) -> tuple[CachedAnalyzePromptUseCase, CountingTokenCounter, RecordingTemporalDatabase]:
+    extractor = PromptFeatureExtractor()
+    counter = CountingTokenCounter(counter_kind)
+    temporal_db = RecordingTemporalDatabase()
+    inner = AnalyzePromptUseCase(
+        counter, InMemoryPromptRepository(), temporal_db, extractor, PromptAnalyzer(extractor)
+    )
+    return CachedAnalyzePromptUseCase(inner, cache), counter, temporal_db
+
+
+@pytest.mark.asyncio
+async def test_repeated_content_is_served_from_cache() -> None:
+    use_case, counter, temporal_db = _use_case(TieredAnalysisCache())
+    command = AnalyzePromptCommand(content="You are an expert. Please summarize the text.")
+
+    first = await use_case.execute(command)
+    second = await use_case.execute(command)
+
+    assert counter.calls == 1
+    assert second.id != first.id
+    assert second.features == first.features
+    assert second.token_count == first.token_count
+    assert second.effectiveness_score == first.effectiveness_score
+    assert [prompt.id for prompt in temporal_db.stored] == [first.id, second.id]
+
+    turbo = AnalyzePromptCommand(content=command.content, model=ModelType.GPT_4_TURBO)
+    await use_case.execute(turbo)
+    assert counter.calls == 2
+    stats = use_case.stats()
+    assert (stats.memory_hits, stats.misses) == (1, 2)
+    assert stats.hit_rate == pytest.approx(1 / 3)
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_restart(tmp_path) -> None:
+    db_path = tmp_path / "analysis_cache.sqlite"
+    command = AnalyzePromptCommand(content="Summarize the report in exactly three bullets.")
+
+    cache = TieredAnalysisCache(db_path=db_path)
+    use_case, _, _ = _use_case(cache)
+    first = await use_case.execute(command)
+    cache.close()
+
+    cache = TieredAnalysisCache(db_path=db_path)
+    use_case, counter, _ = _use_case(cache)
+    second = await use_case.execute(command)
+    third = await use_case.execute(command)
+    cache.close()
+
+    assert counter.calls == 0
+    assert second.features == first.features == third.features
+    assert second.token_count == first.token_count
+    stats = use_case.stats()
+    assert (stats.disk_hits, stats.memory_hits, stats.misses) == (1, 1, 0)
+
+
+def test_cache_key_depends_on_exact_content_model_and_counter() -> None:
+    key = analysis_cache_key("Explain this.", ModelType.GPT_4, "tiktoken")
+    assert key == analysis_cache_key("Explain this.", ModelType.GPT_4, "tiktoken")
+    assert key != analysis_cache_key("explain this.", ModelType.GPT_4, "tiktoken")
+    assert key != analysis_cache_key("Explain this.", ModelType.GPT_4_TURBO, "tiktoken")
+    assert key != analysis_cache_key("Explain this.", ModelType.GPT_4, "estimate")
+
+
+@pytest.mark.asyncio
+async def test_estimated_counts_are_not_served_as_exact(tmp_path) -> None:
+    db_path = tmp_path / "analysis_cache.sqlite"
+    command = AnalyzePromptCommand(content="Summarize the report in exactly three bullets.")
+
+    cache = TieredAnalysisCache(db_path=db_path)
+    use_case, _, _ = _use_case(cache, counter_kind="estimate")
+    await use_case.execute(command)
+    cache.close()
+
+    cache = TieredAnalysisCache(db_path=db_path)
+    use_case, counter, _ = _use_case(cache, counter_kind="tiktoken")
+    await use_case.execute(command)
+    cache.close()
+
+    assert counter.calls == 1
+    assert use_case.stats().misses == 1
@@ -0,0 +1,27 @@
+"""Shared helpers for the scripts/measure_tokens_enhanced.py CLI tests."""
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "measure_tokens_enhanced.py"
+
+# Runs the CLI with tiktoken unavailable so token counting uses the offline estimate
+RUN_WITHOUT_TIKTOKEN = """
+import runpy, sys
+
+sys.modules["tiktoken"] = None
+sys.argv = sys.argv[1:]
+runpy.run_path(sys.argv[0], run_name="__main__")
+"""
+
+
+@pytest.fixture(scope="module")
+def cli() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("measure_tokens_enhanced", SCRIPT)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,170 @@
+import random
+import re
+from dataclasses import fields
+from datetime import UTC, datetime
+
+import pytest
+
+from libs.prompt_optimizer.benchmark import generate_prompt
+from libs.prompt_optimizer.domain.entities import (
+    EffectivenessScore,
+    Prompt,
+    PromptFeatures,
+    PromptId,
+)
+from libs.prompt_optimizer.domain.services import (
+    EFFECTIVENESS_COLUMNS,
+    FEATURE_COLUMNS,
+    LexicalScan,
+    PromptAnalyzer,
+    PromptFeatureExtractor,
+)
+
+E = PromptFeatureExtractor
+STRIP = ".,!?;:\"'"
+
+
+def reference_features(content: str) -> PromptFeatures:
+    """The original multi-pass feature extraction, kept as the behavioural reference."""
+    lower = content.lower()
+    words = content.split()
+    sentences = [s.strip() for s in re.split(r"[.!?]+", content) if s.strip()]
+    stripped = [word.strip(STRIP) for word in lower.split()]
+
+    syllables = 0
+    for word in words:
+        word = word.lower().strip(STRIP)
+        count, prev_vowel = 0, False
+        for char in word:
+            if char in "aeiouy" and not prev_vowel:
+                count += 1
+            prev_vowel = char in "aeiouy"
+        if word.endswith("e") and count > 1:
+            count -= 1
+        syllables += max(1, count)
+
+    def present(phrases: tuple[str, ...]) -> int:
+        return sum(1 for phrase in phrases if phrase in lower)
+
+    readability = 0.0
+    if words and sentences:
+        flesch = max(
+            0,
+            206.835 - 1.015 * (len(words) / len(sentences)) - 84.6 * (syllables / len(words)),
+        )
+        readability = min(flesch / 100, 1.0)
+    strong = sum(1 for word in stripped if word in E._STRONG_DIRECTIVES)
+    weak = sum(1 for word in stripped if word in E._WEAK_DIRECTIVES)
+
+    return PromptFeatures(
+        token_count=len(words),
+        sentence_count=len(sentences),
+        avg_sentence_length=(
+            sum(len(s.split()) for s in sentences) / len(sentences) if sentences else 0.0
+        ),
+        instruction_clarity=min(present(E._CLARITY_INDICATORS) / max(len(words) / 10, 1), 1.0),
+        context_completeness=min(
+            (present(E._CONTEXT_INDICATORS) + (2 if present(E._EXAMPLE_HINTS) else 0)) / 5, 1.0
+        ),
+        task_specificity=min((present(E._ACTION_WORDS) + present(E._TASK_CONSTRAINTS)) / 4, 1.0),
+        role_definition=bool(present(E._ROLE_INDICATORS)),
+        example_count=sum(lower.count(marker) for marker in E._EXAMPLE_MARKERS),
+        constraint_clarity=min(present(E._CONSTRAINT_MARKERS) / max(len(words) / 20, 1), 1.0),
+        readability_score=readability,
+        ambiguity_score=min(
+            sum(1 for word in stripped if word in E._AMBIGUOUS_WORDS) / max(len(words) / 10, 1),
+            1.0,
+        ),
+        directive_strength=strong / (strong + weak) if strong + weak else 0.5,
+    )
+
+
+def _prompt(content: str) -> Prompt:
+    return Prompt(id=PromptId(), content=content, created_at=datetime.now(UTC))
+
+
+def _fuzz_cases(count: int) -> list[str]:
+    rng = random.Random(7)  # noqa: S311 - reproducible fuzz inputs, not security
+    alphabet = list("abcdeiouy .!?,;:'\"\n\tEXAMPLEİΣ") + [
+        "must ",
+        "need to",
+        "for example",
+        "e.g.",
+        "such as",
+        " as a ",
+        "like this:",
+        " maybe",
+    ]
+    cases = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 80))) for _ in range(count)]
+    return [case for case in cases if case.strip()]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "Hello",
+        "...",
+        "You are a helpful assistant. Please explain step by step!",
+        "such asuch as e.g.e.g. example:example: LIKE THIS: like",
+        "ΟΔΟΣ. İstanbul? Maybe... 'maybe' \"MUST\"\tneed\nto need to",
+        "a.b!c?d e . f",
+        *_fuzz_cases(500),
+    ],
+)
+def test_extract_features_matches_reference(content: str) -> None:
+    assert PromptFeatureExtractor().extract_features(_prompt(content)) == reference_features(
+        content
+    )
+
+
+def test_extract_features_matches_reference_on_large_prompt() -> None:
+    content = generate_prompt(100 * 1024)
+    assert PromptFeatureExtractor().extract_features(_prompt(content)) == reference_features(
+        content
+    )
+
+
+def test_lexical_scan_phrase_lookups() -> None:
+    scan = LexicalScan("Need\tto know: need to  go. Such as such as")
+    assert scan.word_count == 10
+    assert scan.contains("need to")
+    assert not scan.contains("to know need")
+    assert scan.count("such as") == 2
+    assert scan.count("absent") == 0
+    assert scan.sentence_count == 2
+
+
+def test_extract_features_batch_matches_per_prompt_features() -> None:
+    np = pytest.importorskip("numpy")
+    contents = [generate_prompt(size, seed=size) for size in (40, 300, 2048)] + _fuzz_cases(50)
+    extractor = PromptFeatureExtractor()
+
+    matrix = extractor.extract_features_batch(contents)
+
+    assert matrix.dtype == np.float32
+    assert matrix.shape == (len(contents), len(FEATURE_COLUMNS))
+    assert list(FEATURE_COLUMNS) == list(reference_features("x").to_dict())
+    expected = [
+        list(extractor.extract_features(_prompt(content)).to_dict().values())
+        for content in contents
+    ]
+    np.testing.assert_allclose(matrix, np.asarray(expected, dtype=np.float32))
+
+
+def test_analyze_effectiveness_batch_matches_per_prompt_scores() -> None:
+    np = pytest.importorskip("numpy")
+    contents = [generate_prompt(size, seed=size) for size in (40, 300, 2048)] + _fuzz_cases(50)
+    extractor = PromptFeatureExtractor()
+    analyzer = PromptAnalyzer(extractor)
+
+    scores = analyzer.analyze_effectiveness_batch(extractor.extract_features_batch(contents))
+
+    assert scores.shape == (len(contents), len(EFFECTIVENESS_COLUMNS))
+    assert EFFECTIVENESS_COLUMNS == tuple(field.name for field in fields(EffectivenessScore))
+    for row, content in zip(scores, contents, strict=True):
+        score = analyzer.analyze_effectiveness(_prompt(content))
+        expected = [getattr(score, column) for column in EFFECTIVENESS_COLUMNS]
+        np.testing.assert_allclose(row, expected, rtol=1e-5, atol=1e-4)
+
+    with pytest.raises(ValueError, match="feature columns"):
+        analyzer.analyze_effectiveness_batch(np.zeros((2, 3)))
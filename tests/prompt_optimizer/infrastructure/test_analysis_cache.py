@@ -0,0 +1,79 @@
+import pytest
+
+from libs.prompt_optimizer.application.ports import CachedAnalysis
+from libs.prompt_optimizer.domain.entities import (
+    EffectivenessScore,
+    ModelType,
+    PromptFeatures,
+    TokenCount,
+)
+from libs.prompt_optimizer.infrastructure.analysis_cache import TieredAnalysisCache
+
+
+def _analysis(tokens: int) -> CachedAnalysis:
+    return CachedAnalysis(
+        features=PromptFeatures(
+            token_count=tokens,
+            sentence_count=1,
+            avg_sentence_length=float(tokens),
+            instruction_clarity=0.5,
+            context_completeness=0.2,
+            task_specificity=0.25,
+            role_definition=True,
+            example_count=0,
+            constraint_clarity=0.0,
+            readability_score=0.7,
+            ambiguity_score=0.0,
+            directive_strength=0.5,
+        ),
+        token_count=TokenCount(
+            total_tokens=tokens,
+            model=ModelType.GPT_4,
+            estimated_cost=tokens * 0.00003,
+            token_distribution={"words": tokens},
+        ),
+        effectiveness_score=EffectivenessScore(
+            overall_score=50.0, clarity_score=60.0, specificity_score=40.0, completeness_score=50.0
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_memory_budget_evicts_least_recently_used() -> None:
+    probe = TieredAnalysisCache()
+    await probe.put("probe", _analysis(0))
+    entry_size = probe.stats().memory_bytes
+
+    cache = TieredAnalysisCache(max_memory_bytes=3 * entry_size + entry_size // 2)
+    for index in range(3):
+        await cache.put(f"k{index}", _analysis(index))
+    assert await cache.get("k0") == _analysis(0)  # k1 becomes the least recently used
+    await cache.put("k3", _analysis(3))
+
+    stats = cache.stats()
+    assert (stats.evictions, stats.entries) == (1, 3)
+    assert stats.memory_bytes <= cache.max_memory_bytes
+    assert await cache.get("k1") is None
+    assert await cache.get("k0") == _analysis(0)
+    assert await cache.get("k3") == _analysis(3)
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_round_trips_and_promotes(tmp_path) -> None:
+    db_path = tmp_path / "cache" / "analysis.sqlite"
+    cache = TieredAnalysisCache(db_path=db_path)
+    await cache.put("key", _analysis(7))
+    cache.close()
+
+    reopened = TieredAnalysisCache(db_path=db_path)
+    assert await reopened.get("key") == _analysis(7)
+    assert await reopened.get("key") == _analysis(7)
+    assert await reopened.get("missing") is None
+    stats = reopened.stats()
+    assert (stats.disk_hits, stats.memory_hits, stats.misses, stats.entries) == (1, 1, 1, 1)
+    reopened.close()
+
+
+def test_rejects_non_positive_budget() -> None:
+    with pytest.raises(ValueError):
+        TieredAnalysisCache(max_memory_bytes=0)
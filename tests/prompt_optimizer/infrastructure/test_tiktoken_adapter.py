@@ -0,0 +1,270 @@
+import random
+import sys
+import threading
+import time
+
+import pytest
+
+from libs.prompt_optimizer.benchmark import generate_prompt
+from libs.prompt_optimizer.domain.entities import ModelType
+from libs.prompt_optimizer.infrastructure import adapters
+from libs.prompt_optimizer.infrastructure.adapters import (
+    IncrementalTiktokenAdapter,
+    TiktokenAdapter,
+    TokenPrefixCache,
+)
+
+tiktoken = pytest.importorskip("tiktoken")
+
+# cl100k_base's pre-tokenizer; the real encodings are downloaded on first use
+_PATTERN = (
+    r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}+|\p{N}{1,3}| ?[^\s\p{L}\p{N}]++[\r\n]*"""
+    r"""|\s*[\r\n]|\s+(?!\S)|\s+"""
+)
+_WORDS = ("you", "are", "an", "expert", "please", "analyze", "the", "context", "über", "!?")
+
+
+def _lines(count: int, width: int) -> str:
+    text = generate_prompt(count * width)
+    return "\n".join(text[start : start + width] for start in range(0, len(text), width))
+
+
+SAMPLES = [
+    generate_prompt(4096),
+    "You are an expert.\n\n  Please analyze (e.g. [this]) {context}!?",
+    "Über naïve café — 東京 🚀 tabs\tand\r\nnewlines   ",
+    "'\"(){}[].,;:",
+]
+
+
+def _synthetic_encoding() -> object:
+    """A small byte-level BPE encoding with word merges, unassigned ids and a special token."""
+    ranks = {bytes([i]): i for i in range(256)}
+    for word in _WORDS:
+        for variant in (word, " " + word):
+            encoded = variant.encode()
+            for end in range(2, len(encoded) + 1):
+                ranks.setdefault(encoded[:end], len(ranks))
+    return tiktoken.Encoding(
+        "synthetic",
+        pat_str=_PATTERN,
+        mergeable_ranks=ranks,
+        special_tokens={"<|endoftext|>": len(ranks) + 3},
+    )
+
+
+@pytest.fixture
+def encoding(monkeypatch: pytest.MonkeyPatch) -> object:
+    synthetic = _synthetic_encoding()
+    monkeypatch.setattr(adapters, "_encoding_for_model", lambda model_name: synthetic)
+    return synthetic
+
+
+def reference_distribution(encoding: object, content: str) -> dict[str, int]:
+    """The original per-token decoding classification."""
+    distribution = {"words": 0, "punctuation": 0, "special": 0, "whitespace": 0}
+    for token in [encoding.decode([token]) for token in encoding.encode(content)]:
+        if token.isalpha():
+            distribution["words"] += 1
+        elif token in ".,!?;:\"'()[]{}":
+            distribution["punctuation"] += 1
+        elif token.isspace():
+            distribution["whitespace"] += 1
+        else:
+            distribution["special"] += 1
+    return distribution
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content", SAMPLES)
+async def test_distribution_matches_per_token_decoding(encoding: object, content: str) -> None:
+    result = await TiktokenAdapter().count_tokens(content, ModelType.GPT_4)
+
+    assert result.total_tokens == len(encoding.encode(content))
+    assert result.token_distribution == reference_distribution(encoding, content)
+    assert list(result.token_distribution) == ["words", "punctuation", "special", "whitespace"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content", SAMPLES)
+async def test_pure_python_lookup_matches_numpy(
+    encoding: object, content: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with_numpy = await TiktokenAdapter().count_tokens(content, ModelType.GPT_4)
+    monkeypatch.setattr(adapters, "_token_category_array", lambda encoding: None)
+    without_numpy = await TiktokenAdapter().count_tokens(content, ModelType.GPT_4)
+
+    assert without_numpy == with_numpy
+
+
+def test_category_table_covers_unassigned_and_special_ids(encoding: object) -> None:
+    table = adapters._token_category_table(encoding)
+
+    assert len(table) == encoding.n_vocab
+    assert table[encoding.n_vocab - 2] == adapters._TOKEN_CATEGORIES.index("special")
+    assert table[ord("a")] == adapters._TOKEN_CATEGORIES.index("words")
+    assert table[ord("(")] == adapters._TOKEN_CATEGORIES.index("punctuation")
+    assert table[ord(" ")] == adapters._TOKEN_CATEGORIES.index("whitespace")
+
+
+def test_category_table_is_built_once_across_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    encoding = _synthetic_encoding()
+    classified: list[str] = []
+    classify = adapters._token_category
+
+    def slow_category(text: str) -> int:
+        classified.append(text)
+        time.sleep(0)
+        return classify(text)
+
+    monkeypatch.setattr(adapters, "_token_category", slow_category)
+    barrier = threading.Barrier(4)
+    tables: list[bytes] = []
+
+    def build() -> None:
+        barrier.wait()
+        tables.append(adapters._token_category_table(encoding))
+
+    threads = [threading.Thread(target=build) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(tables) == 4 and len({id(table) for table in tables}) == 1
+    assert len(classified) == encoding.n_vocab - 3
+
+
+def test_encodings_are_loaded_once_per_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    synthetic = _synthetic_encoding()
+    calls: list[str] = []
+
+    def encoding_for_model(model_name: str) -> object:
+        calls.append(model_name)
+        return synthetic
+
+    monkeypatch.setattr(tiktoken, "encoding_for_model", encoding_for_model)
+    adapters._encoding_for_model.cache_clear()
+    try:
+        for _ in range(3):
+            assert adapters._encoding_for_model("gpt-4") is synthetic
+        adapters._encoding_for_model("gpt-3.5-turbo")
+    finally:
+        adapters._encoding_for_model.cache_clear()
+
+    assert calls == ["gpt-4", "gpt-3.5-turbo"]
+
+
+@pytest.mark.asyncio
+async def test_count_tokens_many_matches_count_tokens_in_order(encoding: object) -> None:
+    text = generate_prompt(4096)
+    contents = [text[:size] for size in range(64, 4096, 97)]
+    adapter = TiktokenAdapter(max_workers=3)
+    try:
+        batch = await adapter.count_tokens_many(contents, ModelType.GPT_3_5_TURBO)
+        single = [await adapter.count_tokens(c, ModelType.GPT_3_5_TURBO) for c in contents]
+    finally:
+        adapter.close()
+
+    assert batch == single
+    assert await TiktokenAdapter().count_tokens_many([], ModelType.GPT_4) == []
+
+
+@pytest.mark.asyncio
+async def test_encoding_runs_off_the_event_loop_thread(
+    encoding: object, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    threads: set[str] = set()
+    encode = adapters._encode_with_distribution
+
+    def recording_encode(encoding: object, content: str) -> tuple[int, dict[str, int]]:
+        threads.add(threading.current_thread().name)
+        return encode(encoding, content)
+
+    monkeypatch.setattr(adapters, "_encode_with_distribution", recording_encode)
+    adapter = TiktokenAdapter(max_workers=2)
+    await adapter.count_tokens(SAMPLES[0], ModelType.GPT_4)
+    await adapter.count_tokens_many(SAMPLES, ModelType.GPT_4)
+    adapter.close()
+
+    assert threads and all(name.startswith("tiktoken") for name in threads)
+
+
+@pytest.mark.asyncio
+async def test_count_tokens_many_falls_back_without_tiktoken(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def missing_tiktoken(model_name: str) -> object:
+        raise ImportError("No module named 'tiktoken'")
+
+    monkeypatch.setattr(adapters, "_encoding_for_model", missing_tiktoken)
+    adapter = TiktokenAdapter()
+
+    counts = await adapter.count_tokens_many(["one two three", "four"], ModelType.GPT_4)
+
+    assert [count.total_tokens for count in counts] == [4, 1]
+    assert counts[0] == await adapter.count_tokens("one two three", ModelType.GPT_4)
+
+
+def test_counter_kind_reports_estimates_without_tiktoken(monkeypatch: pytest.MonkeyPatch) -> None:
+    adapter = TiktokenAdapter()
+    assert adapter.counter_kind == "tiktoken"
+
+    monkeypatch.setitem(sys.modules, "tiktoken", None)
+    assert adapter.counter_kind == "estimate"
+
+
+def _random_text(rng: random.Random, size: int) -> str:
+    pieces = ["\n", "\n\n", " \n", "\r\n", "\t", "  ", " ", ".", "!?", "'s", "'ll", "(", "12345"]
+    pieces += ["über", "東京", "🚀", "word", " Word", " you", "—", "\n- item", "\n1. step"]
+    return "".join(rng.choice(pieces) for _ in range(size))
+
+
+def test_prefix_cache_counts_match_full_encoding(encoding: object) -> None:
+    rng = random.Random(47)  # noqa: S311 - reproducible test inputs, not security
+    cache = TokenPrefixCache(chunk_chars=8)
+    preambles = [_random_text(rng, 400) for _ in range(3)]
+
+    for _ in range(300):
+        content = rng.choice(preambles)[: rng.randint(0, 2000)] + _random_text(rng, 40)
+        total_tokens, distribution = cache.count(encoding, content)
+
+        assert total_tokens == len(encoding.encode(content)), repr(content)
+        assert distribution == reference_distribution(encoding, content), repr(content)
+    assert cache.reused_chars > 0
+
+
+def test_prefix_cache_only_encodes_the_new_suffix(encoding: object) -> None:
+    preamble = _lines(100, 80)
+    cache = TokenPrefixCache(chunk_chars=512)
+
+    cache.count(encoding, preamble + "\nFirst request")
+    encoded_before = cache.encoded_chars
+    total_tokens, _ = cache.count(encoding, preamble + "\nSecond, longer request")
+
+    assert total_tokens == len(encoding.encode(preamble + "\nSecond, longer request"))
+    assert cache.encoded_chars - encoded_before < 2 * 512 + 100
+    assert cache.reused_chars > len(preamble) - 2 * 512
+
+
+def test_prefix_cache_evicts_least_recently_used_nodes(encoding: object) -> None:
+    cache = TokenPrefixCache(max_entries=5, chunk_chars=1)
+    content = "\n".join(f"line{index}" for index in range(20))
+
+    assert cache.count(encoding, content)[0] == len(encoding.encode(content))
+    assert len(cache) == 5
+    # Only the deepest prefixes survive, and they still give exact counts
+    assert cache.count(encoding, content + "\nmore")[0] == len(encoding.encode(content + "\nmore"))
+    assert cache.count(encoding, "line0")[0] == len(encoding.encode("line0"))
+
+
+@pytest.mark.asyncio
+async def test_incremental_adapter_matches_tiktoken_adapter(encoding: object) -> None:
+    preamble = _lines(40, 120)
+    variants = [f"{preamble}\n\nTask {index}: summarize {index} items." for index in range(5)]
+    incremental = IncrementalTiktokenAdapter()
+
+    counts = await incremental.count_tokens_many(variants, ModelType.GPT_4)
+
+    assert counts == await TiktokenAdapter().count_tokens_many(variants, ModelType.GPT_4)
+    assert incremental.prefix_cache.reused_chars > 0
@@ -0,0 +1,15 @@
+from libs.prompt_optimizer.benchmark import default_scenarios, generate_prompt, run_benchmark
+
+
+def test_generate_prompt_is_deterministic() -> None:
+    assert generate_prompt(2048, seed=3) == generate_prompt(2048, seed=3)
+    assert len(generate_prompt(2048)) == 2048
+
+
+def test_benchmark_emits_every_scenario() -> None:
+    payload = run_benchmark(size_kb=2, iteration_scale=0.05)
+
+    assert payload["dataset"]["size_kb"] == 2
+    assert set(payload["scenarios"]) == {scenario.name for scenario in default_scenarios()}
+    for stats in payload["scenarios"].values():
+        assert stats["iterations"] >= 1
@@ -0,0 +1,151 @@
+"""Directory/glob batch mode of scripts/measure_tokens_enhanced.py."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from conftest import RUN_WITHOUT_TIKTOKEN, SCRIPT
+
+
+@pytest.fixture
+def prompts(tmp_path: Path) -> Path:
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "review.md").write_text("You are an expert reviewer.\nPlease analyze the code.\n")
+    (tmp_path / "notes.txt").write_text("Summarize the meeting in three bullet points.\n")
+    (tmp_path / "nested" / "deep.prompt.md").write_text("Explain why the build failed.\n")
+    (tmp_path / "image.png").write_bytes(b"\x89PNG")
+    return tmp_path
+
+
+def test_is_batch_request(cli: ModuleType, prompts: Path) -> None:
+    assert not cli.is_batch_request([str(prompts / "review.md")])
+    assert not cli.is_batch_request(["missing.md"])
+    assert cli.is_batch_request([str(prompts)])
+    assert cli.is_batch_request([str(prompts / "*.md")])
+    assert cli.is_batch_request(["a.md", "b.md"])
+
+
+def test_resolve_prompt_files(cli: ModuleType, prompts: Path) -> None:
+    files = cli.resolve_prompt_files(
+        [str(prompts), str(prompts / "**" / "*.md"), str(prompts / "missing.md")]
+    )
+
+    assert files == [
+        str(prompts / "nested" / "deep.prompt.md"),
+        str(prompts / "notes.txt"),
+        str(prompts / "review.md"),
+        str(prompts / "missing.md"),
+    ]
+    assert cli.resolve_prompt_files([str(prompts)], ("*.txt",)) == [str(prompts / "notes.txt")]
+
+
+def test_summarize_batch(cli: ModuleType) -> None:
+    def analysis(total: int, overall: float) -> dict[str, object]:
+        scores = {"overall": overall, "clarity": 50.0, "specificity": 10.0, "completeness": 0.0}
+        return {
+            "ok": True,
+            "analysis": {
+                "token_count": {"total": total, "estimated_cost": total * 0.001},
+                "effectiveness": scores,
+            },
+        }
+
+    summary = cli.summarize_batch(
+        [analysis(10, 20.0), analysis(30, 40.0), {"ok": False, "error": "boom"}]
+    )
+
+    assert summary["total_tokens"] == 40
+    assert summary["estimated_cost"] == pytest.approx(0.04)
+    assert summary["effectiveness"]["overall"]["min"] == 20.0
+    assert summary["effectiveness"]["overall"]["max"] == 40.0
+    assert summary["effectiveness"]["overall"]["mean"] == 30.0
+    assert summary["effectiveness"]["clarity"]["median"] == 50.0
+    assert "token_savings" not in summary
+
+
+def test_batch_streams_ndjson_and_summary(prompts: Path) -> None:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            RUN_WITHOUT_TIKTOKEN,
+            str(SCRIPT),
+            "analyze",
+            str(prompts),
+            str(prompts / "missing.md"),
+            "--workers",
+            "2",
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    records = [json.loads(line) for line in completed.stdout.splitlines()]
+    summary = json.loads(completed.stderr)
+    assert completed.returncode == 1
+    assert len(records) == 4
+    assert {record["file"] for record in records if not record["ok"]} == {
+        str(prompts / "missing.md")
+    }
+    assert summary["files"] == 4
+    assert summary["succeeded"] == 3
+    assert summary["failed"] == 1
+    assert summary["total_tokens"] == sum(
+        record["analysis"]["token_count"]["total"] for record in records if record["ok"]
+    )
+    assert set(summary["effectiveness"]) == {"overall", "clarity", "specificity", "completeness"}
+
+
+def test_batch_optimize_in_process(prompts: Path) -> None:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            RUN_WITHOUT_TIKTOKEN,
+            str(SCRIPT),
+            "optimize",
+            str(prompts / "*.md"),
+            "--goal",
+            "conciseness",
+            "--workers",
+            "1",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    (record,) = [json.loads(line) for line in completed.stdout.splitlines()]
+    assert record["ok"] is True
+    assert record["optimization"]["goal"] == "conciseness"
+    assert json.loads(completed.stderr)["token_savings"] == record["optimization"]["token_savings"]
+
+
+def test_in_process_batch_closes_its_event_loop(
+    cli: ModuleType, prompts: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    closed: list[str] = []
+
+    class FakeCache:
+        def close(self) -> None:
+            closed.append("cache")
+
+    class FakeCLI:
+        def __init__(self, cache_db: str | None = None) -> None:
+            self.analysis_cache = FakeCache()
+
+        async def analyze_prompt_file(self, file_path: str, model: str) -> dict[str, str]:
+            return {"model": model}
+
+    monkeypatch.setattr(cli, "PromptOptimizerCLI", FakeCLI)
+    options = {"command": "analyze", "model": "gpt-4", "goal": None, "cache_db": None}
+    files = [str(prompts / "review.md"), str(prompts / "notes.txt")]
+
+    records = list(cli.run_batch(files, options, workers=1))
+
+    assert [record["ok"] for record in records] == [True, True]
+    assert cli._worker is None
+    assert closed == ["cache"]
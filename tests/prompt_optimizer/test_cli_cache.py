@@ -0,0 +1,53 @@
+"""Persistent analysis cache (--cache-db) of scripts/measure_tokens_enhanced.py."""
+
+import json
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+from conftest import RUN_WITHOUT_TIKTOKEN, SCRIPT
+
+
+def _analyze(prompt_file: Path, cache_db: Path) -> dict[str, object]:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            RUN_WITHOUT_TIKTOKEN,
+            str(SCRIPT),
+            "analyze",
+            str(prompt_file),
+            "--format",
+            "json",
+            "--cache-db",
+            str(cache_db),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout)["analysis"]
+
+
+def test_cache_db_serves_the_next_run_from_disk(tmp_path: Path) -> None:
+    prompt_file = tmp_path / "prompt.txt"
+    prompt_file.write_text("You are an expert reviewer.\nPlease analyze the code carefully.\n")
+    cache_db = tmp_path / "cache" / "analysis.sqlite"
+
+    first = _analyze(prompt_file, cache_db)
+    assert first["token_count"]["total"] == int(10 / 0.75)
+
+    # Mark the stored entry so the second run can only have read it from disk
+    with sqlite3.connect(cache_db) as connection:
+        ((key, payload),) = connection.execute("SELECT key, payload FROM analysis_cache")
+        data = json.loads(payload)
+        data["token_count"]["total_tokens"] = 999
+        connection.execute(
+            "UPDATE analysis_cache SET payload = ? WHERE key = ?", (json.dumps(data), key)
+        )
+    connection.close()
+
+    second = _analyze(prompt_file, cache_db)
+    assert second["token_count"]["total"] == 999
+    assert second["features"] == first["features"]
@@ -0,0 +1,100 @@
+"""Cold-start budget of scripts/measure_tokens_enhanced.py."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from conftest import RUN_WITHOUT_TIKTOKEN, SCRIPT
+
+# `--help` takes ~15ms; the bound only catches a regression to eager imports on a loaded runner
+HELP_WALL_CLOCK_BOUND_S = 2.0
+DEFERRED_MODULES = {"prompt_optimizer", "asyncio", "tiktoken", "numpy", "sqlite3"}
+
+_IMPORT_PROBE = """
+import importlib.util, json, sys
+
+before = set(sys.modules)
+spec = importlib.util.spec_from_file_location("measure_tokens_enhanced", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+_HELP_PROBE = """
+import contextlib, io, json, runpy, sys, time
+
+start = time.perf_counter()
+sys.argv = [sys.argv[1], "--help"]
+with contextlib.redirect_stdout(io.StringIO()), contextlib.suppress(SystemExit):
+    runpy.run_path(sys.argv[0], run_name="__main__")
+elapsed_s = time.perf_counter() - start
+print(json.dumps({"elapsed_s": elapsed_s, "modules": sorted(sys.modules)}))
+"""
+
+
+def _probe_import() -> list[str]:
+    completed = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE, str(SCRIPT)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def test_importing_the_script_defers_heavy_modules() -> None:
+    modules = _probe_import()
+
+    assert not [name for name in modules if name.split(".")[0] in DEFERRED_MODULES]
+
+
+def test_help_starts_without_the_heavy_stack() -> None:
+    completed = subprocess.run(
+        [sys.executable, "-c", _HELP_PROBE, str(SCRIPT)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    probe = json.loads(completed.stdout)
+
+    loaded = {name.split(".")[0] for name in probe["modules"]}
+    assert not loaded & {"prompt_optimizer", "tiktoken", "asyncio"}
+    assert probe["elapsed_s"] < HELP_WALL_CLOCK_BOUND_S, f"--help took {probe['elapsed_s']:.2f}s"
+
+
+def test_help_does_not_load_the_prompt_optimizer() -> None:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", str(SCRIPT), "analyze", "--help"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert "--cache-db" in completed.stdout
+    assert "prompt_optimizer" not in completed.stderr
+
+
+def test_analyze_loads_the_stack_on_demand(tmp_path: Path) -> None:
+    prompt_file = tmp_path / "prompt.txt"
+    prompt_file.write_text("You are an expert reviewer.\nPlease analyze the code carefully.\n")
+
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            RUN_WITHOUT_TIKTOKEN,
+            str(SCRIPT),
+            "analyze",
+            str(prompt_file),
+            "--format",
+            "json",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    analysis = json.loads(completed.stdout)["analysis"]
+    assert analysis["token_count"]["total"] == int(10 / 0.75)
+    assert analysis["features"]["role_definition"] == 1.0
@@ -0,0 +1,108 @@
+"""Watch mode of scripts/measure_tokens_enhanced.py."""
+
+import json
+import os
+import select
+import subprocess
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from conftest import RUN_WITHOUT_TIKTOKEN, SCRIPT
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_watcher_reports_only_content_changes(cli: ModuleType, tmp_path: Path) -> None:
+    prompt = tmp_path / "review.md"
+    prompt.write_text("Please analyze the code.\n")
+    watcher = cli.PromptWatcher([str(tmp_path)])
+
+    assert watcher.scan() == [(str(prompt), "added", "Please analyze the code.\n")]
+    assert watcher.scan() == []
+
+    _bump_mtime(prompt)
+    assert watcher.scan() == []
+
+    prompt.write_text("Please analyze the code carefully.\n")
+    _bump_mtime(prompt)
+    assert watcher.scan() == [(str(prompt), "changed", "Please analyze the code carefully.\n")]
+
+    prompt.unlink()
+    assert watcher.scan() == [(str(prompt), "removed", None)]
+
+
+def test_watcher_directories(cli: ModuleType, tmp_path: Path) -> None:
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "a.md").write_text("Explain.\n")
+    watcher = cli.PromptWatcher([str(tmp_path / "**" / "*.md"), str(tmp_path / "single.md")])
+    watcher.scan()
+
+    assert watcher.directories() == {str(tmp_path), str(tmp_path / "nested")}
+
+
+def test_inotify_wakeup(cli: ModuleType, tmp_path: Path) -> None:
+    wakeup = cli.InotifyWakeup.create()
+    if wakeup is None:
+        pytest.skip("inotify is not available")
+    try:
+        wakeup.watch({str(tmp_path)})
+        assert wakeup.wait(0.05) is False
+
+        (tmp_path / "prompt.md").write_text("Summarize.\n")
+        assert wakeup.wait(5) is True
+        assert wakeup.wait(0.05) is False
+    finally:
+        wakeup.close()
+
+
+def _read_record(process: subprocess.Popen[str], timeout: float = 10) -> dict[str, object]:
+    ready, _, _ = select.select([process.stdout], [], [], timeout)
+    assert ready, "no watch output"
+    return json.loads(process.stdout.readline())
+
+
+def test_watch_reanalyzes_changed_files(tmp_path: Path) -> None:
+    prompt = tmp_path / "review.md"
+    prompt.write_text("You are an expert.\nPlease analyze the code.\n")
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            RUN_WITHOUT_TIKTOKEN,
+            str(SCRIPT),
+            "watch",
+            str(tmp_path),
+            "--format",
+            "json",
+            "--interval",
+            "0.1",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        added = _read_record(process)
+        assert (added["file"], added["event"]) == (str(prompt), "added")
+
+        # Same content: no output; the next record is the real change
+        prompt.write_text("You are an expert.\nPlease analyze the code.\n")
+        _bump_mtime(prompt)
+        prompt.write_text("You are an expert.\nPlease analyze the code and its tests.\n")
+        _bump_mtime(prompt)
+        changed = _read_record(process)
+        assert (changed["file"], changed["event"]) == (str(prompt), "changed")
+        assert (
+            changed["analysis"]["token_count"]["total"] > added["analysis"]["token_count"]["total"]
+        )
+
+        prompt.unlink()
+        assert _read_record(process)["event"] == "removed"
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Tests for the historical recognizer backtest harness."""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "temporal_db"))
+
+from python.backtest import BacktestConfig, open_read_only, run_backtest  # noqa: E402
+from python.repository import initialize_temporal_database  # noqa: E402
+from python.types import ChangeType  # noqa: E402
+
+
+def _insert_decision(repo, days_ago: int, decision_point: str, confidence: float) -> None:
+    timestamp = (datetime.now(UTC) - timedelta(days=days_ago)).strftime("%Y-%m-%d %H:%M:%S")
+    repo.connection.execute(
+        """
+        INSERT INTO changes
+        (spec_id, change_type, field, new_value, author, context, confidence, timestamp)
+        VALUES (?, ?, ?, 'option', 'tester', 'context', ?, ?)
+        """,
+        (
+            f"ADR-BT-{days_ago:03d}",
+            ChangeType.DECISION.value,
+            decision_point,
+            confidence,
+            timestamp,
+        ),
+    )
+
+
+async def test_analysis_as_of_ignores_later_decisions() -> None:
+    """Decisions recorded after ``as_of`` must not be visible to the analysis."""
+    repo = await initialize_temporal_database(":memory:")
+    try:
+        _insert_decision(repo, 20, "queueing", 0.9)
+        _insert_decision(repo, 2, "queueing", 0.9)
+        repo.connection.commit()
+
+        as_of = datetime.now(UTC) - timedelta(days=10)
+        stats = await repo.analyze_decision_patterns(30, as_of=as_of)
+        assert stats[0]["total_decisions"] == 1
+        assert (await repo.analyze_decision_patterns(30))[0]["total_decisions"] == 2
+    finally:
+        await repo.close()
+
+
+async def test_backtest_reports_metrics_per_config() -> None:
+    """Each config gets per-step timings, query counts and acceptance metrics."""
+    repo = await initialize_temporal_database(":memory:")
+    try:
+        for days_ago in range(60, 0, -3):
+            _insert_decision(repo, days_ago, "queueing", 0.9)
+            _insert_decision(repo, days_ago, "caching", 0.9 if days_ago % 2 else 0.2)
+        repo.connection.commit()
+
+        now = datetime.now(UTC)
+        payload = await run_backtest(
+            repo,
+            [
+                BacktestConfig("strict", minimum_confidence=0.9),
+                BacktestConfig.parse("loose:minimum_confidence=0.3,lookback_days=30"),
+            ],
+            start=now - timedelta(days=50),
+            end=now - timedelta(days=10),
+            step_days=10,
+            horizon_days=10,
+        )
+
+        assert payload["window"]["steps"] == 5
+        strict = payload["configs"]["strict"]["summary"]
+        loose = payload["configs"]["loose"]["summary"]
+        assert strict["steps"] == loose["steps"] == 5
+        assert strict["total_queries"] > 0
+        assert loose["recommendations"] > strict["recommendations"] > 0
+        assert strict["acceptance_rate"] == 1.0
+        assert 0 < loose["acceptance_rate"] < 1
+        assert payload["configs"]["loose"]["config"]["lookback_days"] == 30
+
+        # Dry runs never persist recommendations
+        assert await repo.get_pattern_recommendations(include_expired=True) == []
+    finally:
+        await repo.close()
+
+
+def test_config_parse_rejects_unknown_options() -> None:
+    """Misspelled recognizer options should fail loudly."""
+    with pytest.raises(ValueError):
+        BacktestConfig.parse("broken:confidence=0.5")
+
+
+async def test_open_read_only_refuses_missing_and_outdated_databases(tmp_path: Path) -> None:
+    """The command line never creates, migrates or writes the database it replays."""
+    with pytest.raises(FileNotFoundError):
+        await open_read_only(str(tmp_path / "typo"))
+    assert not (tmp_path / "typo.sqlite").exists()
+
+    legacy = sqlite3.connect(tmp_path / "legacy.sqlite")
+    legacy.execute("CREATE TABLE changes (id INTEGER PRIMARY KEY, timestamp TEXT)")
+    legacy.close()
+    with pytest.raises(ValueError, match="older schema"):
+        await open_read_only(str(tmp_path / "legacy"))
+
+    current = await initialize_temporal_database(str(tmp_path / "current"))
+    _insert_decision(current, 5, "queueing", 0.9)
+    current.connection.commit()
+    await current.close()
+    before = (tmp_path / "current.sqlite").read_bytes()
+
+    repo = await open_read_only(str(tmp_path / "current"))
+    try:
+        payload = await run_backtest(repo, [BacktestConfig("default")], step_days=1)
+        assert payload["window"]["steps"] == 1
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            repo.connection.execute("DELETE FROM changes")
+    finally:
+        await repo.close()
+    assert (tmp_path / "current.sqlite").read_bytes() == before
+
+
+def test_config_rejects_retention_days() -> None:
+    """Dry runs never store recommendations, so retention is not a backtest option."""
+    with pytest.raises(ValueError, match="retention_days"):
+        BacktestConfig.parse("kept:retention_days=30")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Tests for the multi-database recommendation batch runner."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "temporal_db"))
+
+from python.batch_recommendations import resolve_databases, write_batch  # noqa: E402
+from python.repository import initialize_temporal_database  # noqa: E402
+
+_OPTIONS = {
+    "lookback_days": 30,
+    "limit": 5,
+    "retention_days": 90,
+    "min_confidence": 0.55,
+    "dry_run": True,
+    "use_cache": True,
+}
+
+
+async def _seed(db_path: str, decision_point: str) -> None:
+    repo = await initialize_temporal_database(db_path)
+    try:
+        for index in range(3):
+            await repo.record_decision(
+                f"ADR-BATCH-{index}", decision_point, "option", "context", "tester", 0.9
+            )
+    finally:
+        await repo.close()
+
+
+def test_batch_tags_results_and_isolates_failures() -> None:
+    """Every database yields one tagged record; a missing one fails alone."""
+    tmp_dir = Path(tempfile.mkdtemp(prefix="temporal-batch-"))
+    for name in ("alpha", "beta"):
+        (tmp_dir / name).mkdir()
+        asyncio.run(_seed(str(tmp_dir / name / "project_specs"), f"{name}_storage"))
+
+    databases = resolve_databases(
+        [str(tmp_dir / "missing" / "project_specs")],
+        [str(tmp_dir / "*" / "project_specs.sqlite")],
+    )
+    assert len(databases) == 3
+
+    stream = io.StringIO()
+    summary = write_batch(databases, _OPTIONS, stream, workers=2)
+    records = {record["db"]: record for record in map(json.loads, stream.getvalue().splitlines())}
+
+    assert summary["succeeded"] == 2 and summary["failed"] == 1
+    missing = records[str(tmp_dir / "missing" / "project_specs")]
+    assert not missing["ok"] and "not found" in missing["error"]
+    for name in ("alpha", "beta"):
+        record = records[str(tmp_dir / name / "project_specs.sqlite")]
+        assert record["ok"] and record["elapsed_ms"] >= 0
+        assert [item["decision_point"] for item in record["result"]["generated"]] == [
+            f"{name}_storage"
+        ]
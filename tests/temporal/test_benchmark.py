@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Smoke test for the temporal database benchmark harness."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "temporal_db"))
+
+from python.benchmark import (  # noqa: E402
+    DatasetSize,
+    default_scenarios,
+    measure_hydration,
+    measure_load_scaling,
+    measure_record_memory,
+    run_benchmark,
+)
+
+
+async def test_benchmark_emits_every_scenario() -> None:
+    """A tiny dataset run should report timings for every default scenario."""
+    payload = await run_benchmark(
+        DatasetSize(specs=20, patterns=5, decisions=500, recommendations=10),
+        iteration_scale=0.05,
+    )
+
+    assert payload["dataset"]["decisions"] == 500
+    assert set(payload["scenarios"]) == {scenario.name for scenario in default_scenarios()}
+    for stats in payload["scenarios"].values():
+        assert stats["iterations"] >= 1
+        assert stats["min_ms"] <= stats["median_ms"] <= stats["max_ms"]
+
+
+def test_record_memory_reports_slotted_savings() -> None:
+    """Slotted record types should never use more memory than __dict__ equivalents."""
+    report = measure_record_memory(2_000)
+
+    assert "SpecificationRecord" in report
+    for stats in report.values():
+        assert 0 < stats["slotted_bytes_per_record"] <= stats["dict_bytes_per_record"]
+
+
+async def test_hydration_reports_each_strategy() -> None:
+    """Hydration throughput is reported for from_dict, each backend and lazy columns."""
+    report = await measure_hydration(200)
+
+    assert report["rows"] == 200
+    assert report["from_dict_json"] > 0
+    assert report["generated_json"] > 0
+    assert report["repository_eager"] > 0 and report["repository_lazy"] > 0
+
+
+async def test_load_scaling_reports_each_size(tmp_path: Path) -> None:
+    """Load scaling is reported for a quarter, half and all of the requested rows."""
+    report = await measure_load_scaling(200, workdir=tmp_path)
+
+    assert list(report["sizes"]) == ["50", "100", "200"]
+    assert all(stats["rows_per_second"] > 0 for stats in report["sizes"].values())
+    assert report["per_row_cost_ratio"] > 0
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Tests for streaming NDJSON dump and load of the temporal database."""
+
+from __future__ import annotations
+
+import io
+import json
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "temporal_db"))
+
+from python.dump import dump_database, dump_to_path, load_database, load_from_path  # noqa: E402
+from python.repository import initialize_temporal_database  # noqa: E402
+from python.types import (  # noqa: E402
+    ArchitecturalPattern,
+    PatternRecommendation,
+    PatternType,
+    SpecificationRecord,
+    SpecificationType,
+)
+
+
+async def _seed(repo) -> SpecificationRecord:
+    spec = SpecificationRecord.create(
+        spec_type=SpecificationType.ADR,
+        identifier="ADR-DUMP-001",
+        title="Dump Test",
+        content="Testing dump and load",
+        author="dump_tester",
+    )
+    spec.matrix_ids = ["AI_ADR-DUMP"]
+    await repo.store_specification(spec)
+    await repo.record_decision("ADR-DUMP-001", "transport", "ndjson", "Portable", "dump_tester")
+    return spec
+
+
+async def test_dump_load_round_trip_preserves_rows_and_indexes() -> None:
+    """A compressed dump should rebuild an equivalent database."""
+    tmp_dir = Path(tempfile.mkdtemp(prefix="temporal-dump-"))
+    source = await initialize_temporal_database(":memory:")
+    target = await initialize_temporal_database(str(tmp_dir / "restored"))
+
+    try:
+        spec = await _seed(source)
+        counts = dump_to_path(source.connection, tmp_dir / "dump.ndjson.gz")
+        assert counts["specifications"] == 1
+        assert counts["changes"] == 2
+
+        loaded = load_from_path(target.connection, tmp_dir / "dump.ndjson.gz")
+        assert loaded == counts
+
+        restored = await target.get_latest_specification("ADR", "ADR-DUMP-001")
+        assert restored is not None
+        assert restored.id == spec.id
+        # The derived spec_matrix table is rebuilt by triggers rather than dumped
+        assert "spec_matrix" not in counts
+        assert await target.matrix_coverage(["AI_ADR-DUMP"]) == {"AI_ADR-DUMP": 1}
+        assert [event.id for event in await target.get_changes_since(0)] == [
+            event.id for event in await source.get_changes_since(0)
+        ]
+        # Triggers suspended during the load maintain it again afterwards
+        follow_up = SpecificationRecord.create(
+            spec_type=SpecificationType.ADR,
+            identifier="ADR-DUMP-002",
+            title="After load",
+            content="Written after the load",
+        )
+        follow_up.matrix_ids = ["AI_ADR-DUMP"]
+        await target.store_specification(follow_up)
+        assert await target.matrix_coverage(["AI_ADR-DUMP"]) == {"AI_ADR-DUMP": 2}
+
+        index_names = {
+            row[0]
+            for row in target.connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+            )
+        }
+        assert "idx_pattern_recommendations_created_at" in index_names
+    finally:
+        await source.close()
+        await target.close()
+
+
+async def test_load_ignores_columns_and_tables_missing_from_schema() -> None:
+    """Loading matches columns by name so older or newer dumps still apply."""
+    source = await initialize_temporal_database(":memory:")
+    target = await initialize_temporal_database(":memory:")
+
+    try:
+        await _seed(source)
+        buffer = io.StringIO()
+        dump_database(source.connection, buffer)
+
+        records = [json.loads(line) for line in buffer.getvalue().splitlines()]
+        for record in records:
+            if record["type"] == "table" and record["name"] == "changes":
+                record["columns"].append("legacy_column")
+            elif record["type"] == "row":
+                record["values"].append("legacy")
+        records.append({"type": "table", "name": "retired_table", "columns": ["id"]})
+        records.append({"type": "row", "values": [1]})
+        rewritten = "".join(json.dumps(record) + "\n" for record in records)
+
+        loaded = load_database(target.connection, io.StringIO(rewritten))
+        assert loaded["changes"] == 2
+        assert loaded["retired_table"] == -1
+        assert len(await target.get_changes_since(0)) == 2
+    finally:
+        await source.close()
+        await target.close()
+
+
+async def test_load_rebuilds_metadata_index_and_data_versions() -> None:
+    """Derived tables whose triggers are suspended during a load are rebuilt in bulk."""
+    source = await initialize_temporal_database(":memory:")
+    target = await initialize_temporal_database(":memory:")
+
+    try:
+        pattern = ArchitecturalPattern.create(
+            pattern_name="Hexagonal",
+            pattern_type=PatternType.DOMAIN,
+            pattern_definition={"summary": "ports and adapters"},
+        )
+        pattern.metadata["canonical_decision_point"] = "service_boundaries"
+        await source.store_architectural_pattern(pattern)
+        recommendation = PatternRecommendation.create(
+            pattern_name="Hexagonal",
+            decision_point="service_boundaries",
+            confidence=0.8,
+            provenance="ADR",
+            rationale="Dumped",
+            ttl_days=30,
+            metadata={"tags": ["architecture"]},
+        )
+        await source.store_pattern_recommendation(recommendation)
+        buffer = io.StringIO()
+        dump_database(source.connection, buffer)
+
+        versions_before = await target.get_data_versions()
+        load_database(target.connection, io.StringIO(buffer.getvalue()))
+
+        matches = await target.find_patterns_by_metadata(
+            "canonical_decision_point", ["service_boundaries"]
+        )
+        assert [match.id for match in matches] == [pattern.id]
+        tagged = await target.find_recommendations_by_metadata("tags", ["architecture"])
+        assert [item.id for item in tagged] == [recommendation.id]
+        versions_after = await target.get_data_versions()
+        assert all(versions_after[name] > versions_before[name] for name in versions_before)
+
+        # The suspended triggers are back in place
+        await target.record_recommendation_feedback(recommendation.id, "accept")
+        accepted = await target.find_recommendations_by_metadata("last_feedback", ["accept"])
+        assert [item.id for item in accepted] == [recommendation.id]
+    finally:
+        await source.close()
+        await target.close()
+
+
+async def test_dump_reads_one_snapshot_while_other_connections_write() -> None:
+    """A writer arriving mid-dump cannot change the tables that are still to be read."""
+    tmp_dir = Path(tempfile.mkdtemp(prefix="temporal-dump-"))
+    source = await initialize_temporal_database(str(tmp_dir / "source"))
+    writer = sqlite3.connect(source.db_file, timeout=0, isolation_level=None)
+    blocked: list[str] = []
+
+    class ConcurrentWriteStream(io.StringIO):
+        def write(self, text: str) -> int:
+            if '"type": "table"' in text and '"type": "table"' not in self.getvalue():
+                try:
+                    writer.execute(
+                        "INSERT INTO changes (spec_id, change_type, field, new_value, author, context) "
+                        "VALUES ('late', 'update', 'title', 'Late', 'writer', '{}')"
+                    )
+                except sqlite3.OperationalError as exc:
+                    blocked.append(str(exc))
+            return super().write(text)
+
+    try:
+        await _seed(source)
+        buffer = ConcurrentWriteStream()
+        counts = dump_database(source.connection, buffer)
+
+        assert blocked and "locked" in blocked[0]
+        assert counts["changes"] == 2
+        assert not source.connection.in_transaction
+    finally:
+        writer.close()
+        await source.close()
+
+
+async def test_load_keeps_indexes_and_triggers_visible_to_other_connections() -> None:
+    """Indexes and triggers are dropped inside the load transaction, never committed away."""
+    tmp_dir = Path(tempfile.mkdtemp(prefix="temporal-dump-"))
+    source = await initialize_temporal_database(":memory:")
+    target = await initialize_temporal_database(str(tmp_dir / "target"))
+    observer = sqlite3.connect(target.db_file)
+    schema_query = "SELECT type, name FROM sqlite_master WHERE type IN ('index', 'trigger')"
+    seen_during_load: list[set[tuple[str, str]]] = []
+
+    def observed(lines: list[str]):
+        for line in lines:
+            seen_during_load.append(set(observer.execute(schema_query).fetchall()))
+            yield line
+
+    try:
+        await _seed(source)
+        buffer = io.StringIO()
+        dump_database(source.connection, buffer)
+        schema_before = set(observer.execute(schema_query).fetchall())
+
+        load_database(target.connection, observed(buffer.getvalue().splitlines(keepends=True)))
+
+        assert seen_during_load
+        assert all(seen == schema_before for seen in seen_during_load)
+        assert set(observer.execute(schema_query).fetchall()) == schema_before
+    finally:
+        observer.close()
+        await source.close()
+        await target.close()
@@ -10,6 +10,8 @@ import tempfile
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
+import pytest
+
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root / "temporal_db"))
 
@@ -24,8 +26,8 @@ from python.types import (  # noqa: E402
 )
 
 
-async def _bootstrap_repository(db_path: str) -> TemporalRepository:
-    repository = await initialize_temporal_database(db_path)
+async def _bootstrap_repository(db_path: str, **options: object) -> TemporalRepository:
+    repository = await initialize_temporal_database(db_path, **options)
 
     # Seed specification history to drive recognizer
     spec = SpecificationRecord.create(
@@ -86,9 +88,9 @@ def test_recommendation_generation_creates_entries() -> None:
     result, stored = asyncio.run(_generate_recommendations(tmp_dir))
 
     try:
-        assert (
-            hasattr(result, "recommendations") and result.recommendations
-        ), "Recognizer should emit recommendations"
+        assert hasattr(result, "recommendations") and result.recommendations, (
+            "Recognizer should emit recommendations"
+        )
         assert stored, "Recommendations should be stored in repository"
 
         recommendation = stored[0]
@@ -107,6 +109,21 @@ def test_recommendation_generation_creates_entries() -> None:
         tmp_dir.rmdir()
 
 
+@pytest.mark.asyncio
+async def test_canonical_patterns_resolve_without_the_metadata_index(tmp_path: Path) -> None:
+    """Repositories that do not index canonical_decision_point fall back to a scan."""
+    repository = await _bootstrap_repository(
+        str(tmp_path / "temporal"), indexed_metadata_keys={"patterns": ()}
+    )
+    try:
+        recognizer = ArchitecturalPatternRecognizer(repository, use_cache=False)
+        result = await recognizer.generate_recommendations(lookback_days=90, dry_run=True)
+    finally:
+        await repository.close()
+
+    assert [rec.pattern_name for rec in result.recommendations] == ["Hexagonal Architecture"]
+
+
 def test_retention_and_feedback_controls_confidence() -> None:
     """Retention purge and feedback adjustments should update stored confidence."""
 
@@ -151,3 +168,138 @@ def test_retention_and_feedback_controls_confidence() -> None:
             except OSError:
                 pass
         tmp_dir.rmdir()
+
+
+def test_dry_run_results_are_cached_until_data_changes() -> None:
+    """Identical dry runs are served from the cache until the database is written."""
+
+    async def scenario(db_path: str) -> None:
+        repository = await _bootstrap_repository(db_path)
+        recognizer = ArchitecturalPatternRecognizer(repository, retention_days=60)
+        try:
+            first = await recognizer.generate_recommendations(lookback_days=90, dry_run=True)
+            second = await recognizer.generate_recommendations(lookback_days=90, dry_run=True)
+            assert first.recommendations
+            assert not first.cached and second.cached
+            assert [
+                rec.to_dict() | {"id": None, "created_at": None, "expires_at": None}
+                for rec in second.recommendations
+            ] == [
+                rec.to_dict() | {"id": None, "created_at": None, "expires_at": None}
+                for rec in first.recommendations
+            ]
+            # A hit is stamped like a fresh run rather than replaying the first one
+            assert {rec.id for rec in second.recommendations}.isdisjoint(
+                rec.id for rec in first.recommendations
+            )
+            assert all(
+                later.created_at > earlier.created_at
+                and later.expires_at - later.created_at == timedelta(days=60)
+                for earlier, later in zip(first.recommendations, second.recommendations)
+            )
+            # The dry run persisted no recommendations, only the cache entry
+            assert await repository.get_pattern_recommendations(include_expired=True) == []
+            cache_rows = repository.connection.execute(
+                "SELECT COUNT(*) FROM recommendation_cache"
+            ).fetchone()[0]
+            assert cache_rows == 1
+
+            # Different arguments use a different cache entry
+            other = await recognizer.generate_recommendations(lookback_days=30, dry_run=True)
+            assert not other.cached
+
+            await repository.record_decision(
+                spec_id="ADR-AI-GUIDANCE-9",
+                decision_point="integration_strategy",
+                selected_option="hexagonal",
+                context="Follow-up",
+                author="architect",
+                confidence=0.95,
+            )
+            refreshed = await recognizer.generate_recommendations(lookback_days=90, dry_run=True)
+            assert not refreshed.cached
+            assert refreshed.recommendations[0].metadata["total_decisions"] == 4
+
+            # Feedback is joined to recommendations, so rewriting them invalidates too
+            await repository.replace_recommendations(refreshed.recommendations, 60)
+            rescored = await recognizer.generate_recommendations(lookback_days=90, dry_run=True)
+            assert not rescored.cached
+        finally:
+            await repository.close()
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="temporal-tests-"))
+    try:
+        asyncio.run(scenario(str(tmp_dir / "temporal")))
+    finally:
+        for file in tmp_dir.glob("*"):
+            try:
+                os.unlink(file)
+            except OSError:
+                pass
+        tmp_dir.rmdir()
+
+
+def test_replace_recommendations_is_a_single_transaction() -> None:
+    """Inserts and the retention purge commit together, or not at all."""
+
+    async def scenario() -> None:
+        repository = await initialize_temporal_database(":memory:")
+        try:
+            stale = PatternRecommendation.create(
+                pattern_name="CQRS",
+                decision_point="query_strategy",
+                confidence=0.65,
+                provenance="ADR",
+                rationale="Stale",
+                ttl_days=7,
+            )
+            stale.created_at = datetime.now(UTC) - timedelta(days=120)
+            await repository.store_pattern_recommendation(stale)
+
+            fresh = [
+                PatternRecommendation.create(
+                    pattern_name="Hexagonal Architecture",
+                    decision_point=f"integration_strategy_{index}",
+                    confidence=0.8,
+                    provenance="ADR",
+                    rationale="Fresh",
+                    ttl_days=30,
+                )
+                for index in range(3)
+            ]
+
+            statements: list[str] = []
+            repository.connection.set_trace_callback(statements.append)
+            deleted = await repository.replace_recommendations(fresh, retention_days=30)
+            repository.connection.set_trace_callback(None)
+
+            assert deleted == 1
+            assert sum(statement.strip().upper() == "COMMIT" for statement in statements) == 1
+            stored = await repository.get_pattern_recommendations(limit=10)
+            assert {rec.id for rec in stored} == {rec.id for rec in fresh}
+
+            # An invalid recommendation aborts the whole batch before anything is written
+            broken = PatternRecommendation.create(
+                pattern_name="Broken",
+                decision_point="broken",
+                confidence=0.5,
+                provenance="ADR",
+                rationale="Naive timestamp",
+                ttl_days=30,
+            )
+            broken.created_at = broken.created_at.replace(tzinfo=None)
+            extra = PatternRecommendation.create(
+                pattern_name="Layered",
+                decision_point="layering",
+                confidence=0.7,
+                provenance="ADR",
+                rationale="Should not be stored",
+                ttl_days=30,
+            )
+            with pytest.raises(ValueError):
+                await repository.replace_recommendations([extra, broken], retention_days=30)
+            assert len(await repository.get_pattern_recommendations(limit=10)) == 3
+        finally:
+            await repository.close()
+
+    asyncio.run(scenario())
@@ -13,12 +13,19 @@ import sys
 import tempfile
 from pathlib import Path
 
+import pytest
+
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root / "temporal_db"))
 
-from python.repository import initialize_temporal_database  # noqa: E402
+from python.repository import (  # noqa: E402
+    MEMORY_DB_PATH,
+    InMemoryTemporalRepository,
+    initialize_temporal_database,
+)
 from python.types import (  # noqa: E402
     ArchitecturalPattern,
+    PatternRecommendation,
     PatternType,
     SpecificationRecord,
     SpecificationType,
@@ -28,13 +35,22 @@ from python.types import (  # noqa: E402
 class TestTemporalRepository:
     """Test cases for TemporalRepository class focusing on data operations."""
 
+    backend = "file"
+
+    @pytest.fixture(autouse=True, params=["file", "memory"])
+    def repository_backend(self, request):
+        """Run every test against both the file and the in-memory backend."""
+        self.backend = request.param
+
     async def setup_temp_repository(self):
         """Create a temporary repository for testing."""
         temp_file = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
         db_path = temp_file.name
         temp_file.close()
 
-        repo = await initialize_temporal_database(db_path)
+        repo = await initialize_temporal_database(
+            MEMORY_DB_PATH if self.backend == "memory" else db_path
+        )
         return repo, db_path
 
     async def test_repository_initialization(self):
@@ -398,6 +414,266 @@ class TestTemporalRepository:
             await repo.close()
             os.unlink(db_path)
 
+    async def test_change_feed_tail(self):
+        """Test that the change feed yields new rows incrementally by id."""
+        repo, db_path = await self.setup_temp_repository()
+
+        try:
+            await repo.record_decision(
+                spec_id="ADR-FEED-001",
+                decision_point="messaging",
+                selected_option="kafka",
+                context="Existing history",
+                author="feed_tester",
+                confidence=0.8,
+            )
+
+            backlog = await repo.get_changes_since(0)
+            assert len(backlog) == 1
+            cursor = backlog[0].id
+
+            async def consume(count):
+                received = []
+                async for event in repo.tail(cursor, min_poll_interval=0.01):
+                    received.append(event)
+                    if len(received) == count:
+                        break
+                return received
+
+            consumer = asyncio.create_task(consume(2))
+            await asyncio.sleep(0)
+            for option in ("nats", "rabbitmq"):
+                await repo.record_decision(
+                    spec_id="ADR-FEED-001",
+                    decision_point="messaging",
+                    selected_option=option,
+                    context="Live update",
+                    author="feed_tester",
+                )
+
+            received = await asyncio.wait_for(consumer, timeout=5)
+            assert [event.change.new_value for event in received] == ["nats", "rabbitmq"]
+            assert all(event.id > cursor for event in received)
+            assert received[0].id < received[1].id
+            assert received[0].timestamp.tzinfo is not None
+
+        finally:
+            await repo.close()
+            os.unlink(db_path)
+
+    async def test_in_memory_backend(self):
+        """Test that the in-memory backend supports the same operations in isolation."""
+        repo = await initialize_temporal_database(":memory:")
+        other = await initialize_temporal_database(":memory:")
+
+        try:
+            assert isinstance(repo, InMemoryTemporalRepository)
+
+            spec = SpecificationRecord.create(
+                spec_type=SpecificationType.ADR,
+                identifier="ADR-MEMORY-001",
+                title="In-memory Test",
+                content="Testing the in-memory backend",
+                author="memory_tester",
+            )
+            await repo.store_specification(spec)
+            await repo.record_decision(
+                spec_id="ADR-MEMORY-001",
+                decision_point="storage_backend",
+                selected_option="memory",
+                context="Fast tests",
+                author="memory_tester",
+                confidence=0.9,
+            )
+
+            retrieved = await repo.get_latest_specification("ADR", "ADR-MEMORY-001")
+            assert retrieved is not None
+            assert retrieved.title == "In-memory Test"
+            assert len(await repo.analyze_decision_patterns(30)) == 1
+
+            # Instances cloned from the schema template must not share data
+            assert await other.get_latest_specification("ADR", "ADR-MEMORY-001") is None
+            assert await other.analyze_decision_patterns(30) == []
+
+        finally:
+            await repo.close()
+            await other.close()
+
+    async def test_traceability_matrix_index(self):
+        """Test matrix ID lookups and coverage served from the spec_matrix join table."""
+        repo, db_path = await self.setup_temp_repository()
+
+        try:
+            for identifier, matrix_ids in (
+                ("ADR-MATRIX-001", ["AI_ADR-001", "AI_PRD-002"]),
+                ("PRD-MATRIX-001", ["AI_PRD-002"]),
+            ):
+                spec = SpecificationRecord.create(
+                    spec_type=SpecificationType(identifier.split("-")[0]),
+                    identifier=identifier,
+                    title=f"{identifier} title",
+                    content=f"{identifier} content",
+                    author="matrix_tester",
+                )
+                spec.matrix_ids = matrix_ids
+                await repo.store_specification(spec)
+
+            # A newer version drops one link; only the latest version is returned
+            revised = SpecificationRecord.create(
+                spec_type=SpecificationType.ADR,
+                identifier="ADR-MATRIX-001",
+                title="ADR-MATRIX-001 revised",
+                content="Revised content",
+                author="matrix_tester",
+            )
+            revised.version = 2
+            revised.matrix_ids = ["AI_ADR-001"]
+            await repo.store_specification(revised)
+
+            linked = await repo.find_specifications_by_matrix_id("AI_ADR-001")
+            assert [(spec.identifier, spec.version) for spec in linked] == [("ADR-MATRIX-001", 2)]
+
+            shared = await repo.find_specifications_by_matrix_id("AI_PRD-002", latest_only=False)
+            assert sorted(spec.identifier for spec in shared) == [
+                "ADR-MATRIX-001",
+                "PRD-MATRIX-001",
+            ]
+
+            coverage = await repo.matrix_coverage(["AI_ADR-001", "AI_PRD-002", "AI_TS-404"])
+            assert coverage == {"AI_ADR-001": 1, "AI_PRD-002": 2, "AI_TS-404": 0}
+            assert set(await repo.matrix_coverage()) == {"AI_ADR-001", "AI_PRD-002"}
+
+            if self.backend == "memory":
+                return
+
+            # Databases created before the join table existed are backfilled on open
+            repo.connection.execute("DROP TABLE spec_matrix")
+            repo.connection.commit()
+            await repo.close()
+            repo = await initialize_temporal_database(db_path)
+            assert (await repo.matrix_coverage(["AI_PRD-002"]))["AI_PRD-002"] == 2
+
+        finally:
+            await repo.close()
+            os.unlink(db_path)
+
+    async def test_indexed_metadata_keys(self):
+        """Test metadata lookups served from the metadata_index side table."""
+        repo, db_path = await self.setup_temp_repository()
+
+        try:
+            for name, decision_point, usage in (
+                ("Hexagonal", "service_boundaries", 3),
+                ("Event Sourcing", "state_storage", 9),
+                ("Layered", "service_boundaries", 7),
+            ):
+                pattern = ArchitecturalPattern.create(
+                    pattern_name=name,
+                    pattern_type=PatternType.DOMAIN,
+                    pattern_definition={"summary": name},
+                )
+                pattern.usage_frequency = usage
+                pattern.metadata["canonical_decision_point"] = decision_point
+                await repo.store_architectural_pattern(pattern)
+
+            matches = await repo.find_patterns_by_metadata(
+                "canonical_decision_point", ["service_boundaries"]
+            )
+            assert [pattern.pattern_name for pattern in matches] == ["Layered", "Hexagonal"]
+            assert (
+                len(
+                    await repo.find_patterns_by_metadata(
+                        "canonical_decision_point", ["service_boundaries", "state_storage"]
+                    )
+                )
+                == 3
+            )
+
+            recommendation = PatternRecommendation.create(
+                pattern_name="Hexagonal",
+                decision_point="service_boundaries",
+                confidence=0.8,
+                provenance="ADR",
+                rationale="Indexed tags",
+                ttl_days=30,
+                metadata={"tags": ["architecture", "boundaries"]},
+            )
+            await repo.store_pattern_recommendation(recommendation)
+
+            tagged = await repo.find_recommendations_by_metadata("tags", ["boundaries"])
+            assert [item.id for item in tagged] == [recommendation.id]
+            assert await repo.find_recommendations_by_metadata("last_feedback", ["accept"]) == []
+
+            # Metadata updates keep the index in sync
+            await repo.record_recommendation_feedback(recommendation.id, "accept")
+            accepted = await repo.find_recommendations_by_metadata("last_feedback", ["accept"])
+            assert [item.id for item in accepted] == [recommendation.id]
+
+            with pytest.raises(ValueError):
+                await repo.find_patterns_by_metadata("summary", ["Hexagonal"])
+
+            if self.backend == "memory":
+                return
+
+            # Reopening with a different key set backfills added keys and drops removed ones
+            await repo.close()
+            repo = await initialize_temporal_database(
+                db_path, indexed_metadata_keys={"patterns": ("canonical_decision_point",)}
+            )
+            count = repo.connection.execute(
+                "SELECT COUNT(*) FROM metadata_index WHERE entity = 'pattern_recommendations'"
+            ).fetchone()[0]
+            assert count == 0
+            with pytest.raises(ValueError):
+                await repo.find_recommendations_by_metadata("tags", ["boundaries"])
+
+            await repo.close()
+            repo = await initialize_temporal_database(db_path)
+            tagged = await repo.find_recommendations_by_metadata("tags", ["architecture"])
+            assert [item.id for item in tagged] == [recommendation.id]
+
+        finally:
+            await repo.close()
+            os.unlink(db_path)
+
+    async def test_recent_specification_summaries(self):
+        """Test that summaries mirror get_recent_specifications without content."""
+        repo, db_path = await self.setup_temp_repository()
+
+        try:
+            for index, spec_type in enumerate(
+                (SpecificationType.ADR, SpecificationType.PRD, SpecificationType.ADR)
+            ):
+                spec = SpecificationRecord.create(
+                    spec_type=spec_type,
+                    identifier=f"{spec_type.value}-SUM-{index:03d}",
+                    title=f"Summary {index}",
+                    content="x" * 10_000,
+                    author="summary_tester",
+                )
+                spec.metadata = {"index": index}
+                await repo.store_specification(spec)
+                await asyncio.sleep(0.001)
+
+            for spec_type in (None, SpecificationType.ADR):
+                records = await repo.get_recent_specifications(limit=2, spec_type=spec_type)
+                summaries = await repo.get_recent_specification_summaries(
+                    limit=2, spec_type=spec_type
+                )
+                assert [summary.to_dict() for summary in summaries] == [
+                    {
+                        key: value
+                        for key, value in record.to_dict().items()
+                        if key not in ("content", "template_variables", "matrix_ids", "metadata")
+                    }
+                    for record in records
+                ]
+                assert not hasattr(summaries[0], "content")
+
+        finally:
+            await repo.close()
+            os.unlink(db_path)
+
 
 async def run_all_tests():
     """Run all repository tests."""
@@ -413,6 +689,11 @@ async def run_all_tests():
         test_repo.test_concurrent_operations,
         test_repo.test_error_handling,
         test_repo.test_data_integrity,
+        test_repo.test_change_feed_tail,
+        test_repo.test_in_memory_backend,
+        test_repo.test_traceability_matrix_index,
+        test_repo.test_indexed_metadata_keys,
+        test_repo.test_recent_specification_summaries,
     ]
 
     passed = 0
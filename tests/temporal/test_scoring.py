@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Tests for the vectorized confidence scoring engine."""
+
+from __future__ import annotations
+
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "temporal_db"))
+
+np = pytest.importorskip("numpy")
+
+from python.patterns import ArchitecturalPatternRecognizer  # noqa: E402
+from python.repository import initialize_temporal_database  # noqa: E402
+from python.scoring import ConfidenceScorer, ScoringModel  # noqa: E402
+from python.types import ChangeType  # noqa: E402
+
+
+def test_default_model_matches_selection_ratio() -> None:
+    """Without prior, feedback or decay the score is the clamped selection ratio."""
+    scorer = ConfidenceScorer()
+    scores = scorer.score([4, 10, 3, 0], [3, 0, 3, 0])
+    assert scores.tolist() == pytest.approx([0.75, 0.1, 0.98, 0.0])
+
+
+def test_decay_prior_and_feedback() -> None:
+    """Recent decisions dominate, and feedback shifts scores towards accepted points."""
+    decayed = ConfidenceScorer(ScoringModel(half_life_days=7))
+    # Point 0: old selections, recent misses. Point 1: the opposite.
+    totals, selected = decayed.aggregate(
+        [0, 0, 1, 1], [True, False, False, True], 2, age_days=[60, 1, 60, 1]
+    )
+    scores = decayed.score(totals, selected)
+    assert scores[0] < 0.2 < 0.8 < scores[1]
+
+    with_feedback = ConfidenceScorer(ScoringModel(prior_strength=2, feedback_weight=1.0)).score(
+        [4, 4], [2, 2], accepted=[3, 0], dismissed=[0, 3]
+    )
+    assert with_feedback[0] > 0.5 > with_feedback[1]
+
+
+def test_scores_many_decision_points_in_one_pass() -> None:
+    """Scoring is a single array operation over every decision point."""
+    rng = np.random.default_rng(7)
+    totals = rng.integers(1, 50, size=100_000)
+    selected = rng.integers(0, totals + 1)
+    scores = ConfidenceScorer().score(totals, selected)
+    assert scores.shape == (100_000,)
+    assert float(scores.min()) >= 0.1 and float(scores.max()) <= 0.98
+
+
+async def test_recognizer_uses_decayed_model() -> None:
+    """A decayed model follows the recent trend that the raw ratio averages away."""
+    repo = await initialize_temporal_database(":memory:")
+    try:
+        now = datetime.now(UTC)
+        rows = [(40, 0.9)] * 6 + [(1, 0.2)] * 4
+        for index, (days_ago, confidence) in enumerate(rows):
+            repo.connection.execute(
+                """
+                INSERT INTO changes
+                (spec_id, change_type, field, new_value, author, context, confidence, timestamp)
+                VALUES (?, ?, 'service_mesh', 'istio', 'tester', 'context', ?, ?)
+                """,
+                (
+                    f"ADR-SCORE-{index:03d}",
+                    ChangeType.DECISION.value,
+                    confidence,
+                    (now - timedelta(days=days_ago)).strftime("%Y-%m-%d %H:%M:%S"),
+                ),
+            )
+        repo.connection.commit()
+
+        plain = ArchitecturalPatternRecognizer(repo, minimum_confidence=0.5)
+        decayed = ArchitecturalPatternRecognizer(
+            repo, minimum_confidence=0.5, scoring_model=ScoringModel(half_life_days=5)
+        )
+        assert len((await plain.generate_recommendations(dry_run=True)).recommendations) == 1
+        assert (await decayed.generate_recommendations(dry_run=True)).recommendations == []
+    finally:
+        await repo.close()
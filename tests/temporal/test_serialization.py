@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Tests for the pluggable JSON serializer and generated record codecs."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "temporal_db"))
+
+from python import serialization  # noqa: E402
+from python.repository import initialize_temporal_database  # noqa: E402
+from python.serialization import LazyJSON  # noqa: E402
+from python.types import (  # noqa: E402
+    ArchitecturalPattern,
+    ChangeEvent,
+    ChangeType,
+    DecisionPoint,
+    PatternRecommendation,
+    PatternType,
+    SpecificationChange,
+    SpecificationRecord,
+    SpecificationSummary,
+    SpecificationType,
+)
+
+
+def _records() -> list[object]:
+    spec = SpecificationRecord.create(SpecificationType.ADR, "ADR-SER-001", "Title", "Body")
+    spec.template_variables = {"service": "billing"}
+    spec.metadata = {"tags": ["a", "b"], "nested": {"n": 1}}
+    pattern = ArchitecturalPattern.create("Repository", PatternType.DOMAIN, {"layers": 3})
+    used = ArchitecturalPattern.create("Gateway", PatternType.INFRASTRUCTURE, {})
+    used.use_pattern()
+    change = SpecificationChange(
+        spec_id=spec.id,
+        change_type=ChangeType.DECISION,
+        field="storage",
+        old_value=None,
+        new_value="sqlite",
+        author="dev",
+        context="ctx",
+        confidence=0.8,
+    )
+    summary = SpecificationSummary(
+        id=spec.id,
+        spec_type=spec.spec_type,
+        identifier=spec.identifier,
+        title=spec.title,
+        timestamp=spec.timestamp,
+        version=spec.version,
+        author=None,
+        hash=spec.hash,
+    )
+    return [
+        spec,
+        summary,
+        pattern,
+        used,
+        change,
+        ChangeEvent(id="evt", timestamp=datetime.now(UTC), change=change),
+        DecisionPoint(
+            id="dp",
+            specification_id=spec.identifier,
+            decision_point="storage",
+            context="ctx",
+            timestamp=datetime.now(UTC),
+            metadata={"k": "v"},
+        ),
+        PatternRecommendation.create(
+            pattern_name="Repository",
+            decision_point="storage",
+            confidence=0.7,
+            provenance="ADR-SER-001",
+            rationale="why",
+            ttl_days=30,
+        ),
+    ]
+
+
+@pytest.mark.parametrize("backend", serialization.BACKENDS)
+def test_generated_codecs_match_hand_written(backend: str) -> None:
+    """Generated encoders produce to_dict output and decoders round-trip on every backend."""
+    pytest.importorskip(backend)
+    active = serialization.get_backend()
+    serialization.set_backend(backend)
+    try:
+        for record in _records():
+            assert serialization.record_encoder(type(record))(record) == record.to_dict()
+            decoded = serialization.decode_record(type(record), serialization.encode_record(record))
+            assert decoded == type(record).from_dict(record.to_dict())
+    finally:
+        serialization.set_backend(active)
+
+
+def test_row_decoder_reads_columns_by_name() -> None:
+    """Row decoders parse JSON columns and hand object columns to ``decode_object``."""
+    decode = serialization.row_decoder(
+        ArchitecturalPattern,
+        json_fields=("examples", "metadata"),
+        object_fields=("pattern_definition",),
+    )
+    pattern = ArchitecturalPattern.create("Repository", PatternType.DOMAIN, {"layers": 3})
+    row = {
+        **pattern.to_dict(),
+        "pattern_definition": '{"layers": 3}',
+        "examples": '["orders"]',
+        "metadata": '{"owner": "team"}',
+    }
+
+    decoded = decode(row, LazyJSON)
+    assert isinstance(decoded.pattern_definition, LazyJSON)
+    assert decoded.pattern_definition == {"layers": 3}
+    assert decoded.examples == ["orders"] and decoded.metadata == {"owner": "team"}
+    assert decoded.last_used is None and decoded.pattern_type is PatternType.DOMAIN
+    assert decode(row).pattern_definition == {"layers": 3}
+
+    with pytest.raises(ValueError, match="no fields"):
+        serialization.row_decoder(ArchitecturalPattern, json_fields=("missing",))
+
+
+def test_unknown_backend_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        serialization.set_backend("yaml")
+
+
+def test_missing_configured_backend_falls_back_on_import() -> None:
+    """An unavailable TEMPORAL_DB_JSON backend warns instead of breaking the import."""
+    probe = (
+        "import sys, warnings\n"
+        "sys.modules['msgspec'] = None\n"
+        "warnings.simplefilter('error', RuntimeWarning)\n"
+        "try:\n"
+        "    import python.serialization\n"
+        "except RuntimeWarning as exc:\n"
+        "    print('warned:', exc)\n"
+        "warnings.simplefilter('ignore', RuntimeWarning)\n"
+        "from python import serialization\n"
+        "print(serialization.get_backend())\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=project_root / "temporal_db",
+        env={**os.environ, "TEMPORAL_DB_JSON": "msgspec"},
+    )
+
+    warning, backend = completed.stdout.splitlines()
+    assert warning.startswith("warned: TEMPORAL_DB_JSON='msgspec' is unavailable")
+    assert backend in ("orjson", "json")
+
+
+def test_lazy_json_decodes_on_access() -> None:
+    """LazyJSON defers parsing, compares like a dict and re-encodes edits."""
+    lazy = LazyJSON('{"a": 1, "b": [2, 3]}')
+    assert not lazy.decoded
+    assert serialization.dumps(lazy) == '{"a": 1, "b": [2, 3]}'
+    assert not lazy.decoded
+
+    assert lazy == {"a": 1, "b": [2, 3]}
+    assert lazy.decoded and lazy.raw is None
+
+    lazy["c"] = True
+    assert serialization.loads(serialization.dumps(lazy)) == {"a": 1, "b": [2, 3], "c": True}
+    assert serialization.loads(serialization.dumps({"wrapped": LazyJSON('{"x": 1}')})) == {
+        "wrapped": {"x": 1}
+    }
+
+
+async def test_repository_lazy_json_round_trip() -> None:
+    """Lazily hydrated JSON columns read back and store like plain dicts."""
+    repo = await initialize_temporal_database(":memory:", lazy_json=True)
+    try:
+        spec = SpecificationRecord.create(SpecificationType.ADR, "ADR-LAZY-001", "T", "Body")
+        spec.metadata = {"owner": "team"}
+        await repo.store_specification(spec)
+
+        loaded = await repo.get_latest_specification("ADR", "ADR-LAZY-001")
+        assert isinstance(loaded.metadata, LazyJSON) and not loaded.metadata.decoded
+        assert loaded.metadata == {"owner": "team"}
+
+        loaded.id = "second"
+        loaded.version = 2
+        loaded.timestamp = datetime.now(UTC)
+        loaded.metadata["reviewed"] = True
+        await repo.store_specification(loaded)
+        latest = await repo.get_latest_specification("ADR", "ADR-LAZY-001")
+        assert latest.metadata == {"owner": "team", "reviewed": True}
+    finally:
+        await repo.close()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""Tests for multi-file sharding of the temporal database."""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "temporal_db"))
+
+from python.repository import TemporalRepository  # noqa: E402
+from python.sharding import (  # noqa: E402
+    hash_router,
+    initialize_sharded_temporal_database,
+    project_router,
+    spec_type_router,
+)
+from python.types import SpecificationRecord, SpecificationType  # noqa: E402
+
+
+def _shard_paths(tmp_dir: Path) -> dict[str, str]:
+    return {name: str(tmp_dir / name) for name in ("ADR", "PRD", "misc")}
+
+
+async def test_routing_and_fan_out_reads(tmp_path: Path) -> None:
+    """Writes land on the routed shard; cross-shard reads merge per-shard results."""
+    repo = await initialize_sharded_temporal_database(
+        _shard_paths(tmp_path), spec_type_router(default_shard="misc")
+    )
+
+    try:
+        for spec_type, identifier in (
+            (SpecificationType.ADR, "ADR-SHARD-001"),
+            (SpecificationType.PRD, "PRD-SHARD-001"),
+        ):
+            await repo.store_specification(
+                SpecificationRecord.create(
+                    spec_type=spec_type,
+                    identifier=identifier,
+                    title=f"{identifier} title",
+                    content=f"{identifier} content",
+                    author="shard_tester",
+                )
+            )
+            await repo.record_decision(
+                spec_id=identifier,
+                decision_point="storage_layout",
+                selected_option="sharded",
+                context=f"{identifier} context",
+                author="shard_tester",
+                confidence=0.9,
+            )
+
+        assert await repo.shards["ADR"].get_latest_specification("ADR", "ADR-SHARD-001")
+        assert await repo.shards["PRD"].get_latest_specification("ADR", "ADR-SHARD-001") is None
+
+        recent = await repo.get_recent_specifications(limit=10)
+        assert {record.identifier for record in recent} == {"ADR-SHARD-001", "PRD-SHARD-001"}
+        summaries = await repo.get_recent_specification_summaries(limit=10)
+        assert [summary.identifier for summary in summaries] == [
+            record.identifier for record in recent
+        ]
+
+        stats = await repo.analyze_decision_patterns(30)
+        assert len(stats) == 1
+        assert stats[0]["total_decisions"] == 2
+        assert stats[0]["selected_count"] == 2
+    finally:
+        await repo.close()
+
+
+async def test_fan_out_reads_overlap_across_shards(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Each shard is read on its own worker thread, concurrently with the others."""
+    paths = _shard_paths(tmp_path)
+    repo = await initialize_sharded_temporal_database(paths)
+    # Every shard's read must be in flight at once for the barrier to open
+    barrier = threading.Barrier(len(paths), timeout=5)
+    threads: set[str] = set()
+    read_versions = TemporalRepository.get_data_versions
+
+    async def overlapping_read(self: TemporalRepository) -> dict[str, int]:
+        threads.add(threading.current_thread().name)
+        barrier.wait()
+        return await read_versions(self)
+
+    monkeypatch.setattr(TemporalRepository, "get_data_versions", overlapping_read)
+    try:
+        versions = await repo.get_data_versions()
+    finally:
+        await repo.close()
+
+    assert versions["changes"] == 0
+    assert len(threads) == len(paths)
+    assert threading.current_thread().name not in threads
+
+
+async def test_relative_shard_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Shard paths relative to the working directory open their read connections too."""
+    monkeypatch.chdir(tmp_path)
+    repo = await initialize_sharded_temporal_database({"ADR": "ADR", "misc": "misc"})
+    try:
+        versions = await repo.get_data_versions()
+    finally:
+        await repo.close()
+
+    assert versions["changes"] == 0
+
+
+async def test_rebalance_moves_rows_to_new_owner(tmp_path: Path) -> None:
+    """Rebalancing relocates specification history to match the new router."""
+    paths = _shard_paths(tmp_path)
+    repo = await initialize_sharded_temporal_database(paths, spec_type_router("misc"))
+
+    try:
+        for index in range(6):
+            identifier = f"ADR-REBALANCE-{index:03d}"
+            await repo.store_specification(
+                SpecificationRecord.create(
+                    spec_type=SpecificationType.ADR,
+                    identifier=identifier,
+                    title="Rebalance",
+                    content=f"Rebalance content {index}",
+                )
+            )
+
+        new_router = hash_router(list(paths))
+        moved = await repo.rebalance(new_router)
+        assert moved["specifications"] == moved["changes"]
+
+        for index in range(6):
+            identifier = f"ADR-REBALANCE-{index:03d}"
+            owner = repo.shards[new_router(identifier)]
+            assert await owner.get_latest_specification("ADR", identifier) is not None
+            assert await repo.get_latest_specification("ADR", identifier) is not None
+
+        assert len(await repo.get_recent_specifications(limit=20)) == 6
+    finally:
+        await repo.close()
+
+
+async def test_change_feed_resumes_from_cursors_after_rebalance(tmp_path: Path) -> None:
+    """Moved changes reappear on the destination feed; change_cursors resumes after them."""
+    paths = _shard_paths(tmp_path)
+    repo = await initialize_sharded_temporal_database(paths, spec_type_router("misc"))
+
+    def _spec(identifier: str) -> SpecificationRecord:
+        return SpecificationRecord.create(
+            spec_type=SpecificationType.ADR,
+            identifier=identifier,
+            title="Feed",
+            content=f"{identifier} content",
+        )
+
+    try:
+        await repo.store_specification(_spec("misc-FEED-000"))
+        stored_cursors = await repo.change_cursors()
+
+        await repo.store_specification(_spec("ADR-FEED-001"))
+        await repo.rebalance(lambda identifier: "misc")
+
+        misc = repo.shards["misc"]
+        redelivered = await misc.get_changes_since(stored_cursors["misc"])
+        assert [event.change.spec_id for event in redelivered] == ["ADR-FEED-001"]
+
+        cursors = await repo.change_cursors()
+        assert await misc.get_changes_since(cursors["misc"]) == []
+        await repo.store_specification(_spec("ADR-FEED-002"))
+        resumed = await misc.get_changes_since(cursors["misc"])
+        assert [event.change.spec_id for event in resumed] == ["ADR-FEED-002"]
+    finally:
+        await repo.close()
+
+
+def test_routers() -> None:
+    """Spec type routing falls back for types without a shard; projects stay together."""
+    route = spec_type_router("misc", shard_names=["ADR", "misc"])
+    assert [route(identifier) for identifier in ("ADR-001", "PRD-001", "NOTES")] == [
+        "ADR",
+        "misc",
+        "misc",
+    ]
+
+    route = project_router(["a", "b", "c"])
+    assert route("billing/ADR-001") == route("billing/PRD-042")
+    assert {route(f"project{index}/ADR-001") for index in range(20)} == {"a", "b", "c"}
+
+
+async def test_interrupted_rebalance_can_be_rerun(tmp_path: Path) -> None:
+    """A rebalance that fails part-way leaves no duplicates and completes when rerun."""
+    paths = _shard_paths(tmp_path)
+    repo = await initialize_sharded_temporal_database(paths, spec_type_router("misc"))
+    identifiers = [f"ADR-RESUME-{index:03d}" for index in range(10)]
+
+    try:
+        for identifier in identifiers:
+            await repo.store_specification(
+                SpecificationRecord.create(
+                    spec_type=SpecificationType.ADR,
+                    identifier=identifier,
+                    title="Resume",
+                    content=f"{identifier} content",
+                )
+            )
+
+        new_router = hash_router(list(paths))
+        calls = 0
+
+        def failing_router(identifier: str) -> str:
+            # Fail after validation (one call per row) and a few moved batches
+            nonlocal calls
+            calls += 1
+            if calls == 2 * len(identifiers) + 8:
+                raise RuntimeError("simulated crash")
+            return new_router(identifier)
+
+        with pytest.raises(sqlite3.OperationalError):
+            await repo.rebalance(failing_router, batch_size=2)
+
+        await repo.rebalance(new_router, batch_size=2)
+
+        for table in ("specifications", "changes"):
+            total = sum(
+                shard.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]  # noqa: S608
+                for shard in repo.shards.values()
+            )
+            assert total == len(identifiers)
+        for identifier in identifiers:
+            owner = repo.shards[new_router(identifier)]
+            assert await owner.get_latest_specification("ADR", identifier) is not None
+            (changes,) = owner.connection.execute(
+                "SELECT COUNT(*) FROM changes WHERE spec_id = ?", (identifier,)
+            ).fetchone()
+            assert changes == 1
+    finally:
+        await repo.close()
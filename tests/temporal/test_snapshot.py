@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Tests for columnar decision history snapshots."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "temporal_db"))
+
+from python.repository import initialize_temporal_database  # noqa: E402
+from python.snapshot import DecisionSnapshot, export_decision_snapshot  # noqa: E402
+
+pytest.importorskip("numpy")
+
+
+async def test_snapshot_stats_match_sql_analysis() -> None:
+    """Vectorized snapshot aggregation should agree with analyze_decision_patterns."""
+    repo = await initialize_temporal_database(":memory:")
+    snapshot_dir = Path(tempfile.mkdtemp(prefix="temporal-snapshot-"))
+
+    try:
+        decisions = [
+            ("ADR-SNAP-001", "database_type", "postgres", "ACID", 0.9),
+            ("ADR-SNAP-002", "database_type", "mongodb", "Flexible", 0.6),
+            ("PRD-SNAP-001", "caching_strategy", "redis", "Latency", None),
+            ("PRD-SNAP-002", "caching_strategy", "redis", "Latency", 0.95),
+            # Above the 0.7 threshold in SQL, but not once rounded to float32
+            ("PRD-SNAP-003", "caching_strategy", "memcached", "Latency", 0.70000001),
+        ]
+        for spec_id, point, option, context, confidence in decisions:
+            await repo.record_decision(spec_id, point, option, context, "tester", confidence)
+
+        manifest = export_decision_snapshot(repo, snapshot_dir)
+        assert manifest["rows"] == 5
+
+        snapshot = DecisionSnapshot.open(snapshot_dir)
+        assert len(snapshot) == 5
+        assert sorted(snapshot.dictionary("decision_point")) == [
+            "caching_strategy",
+            "database_type",
+        ]
+
+        expected = {
+            stat["decision_point"]: stat for stat in await repo.analyze_decision_patterns(30)
+        }
+        actual = snapshot.decision_stats(30)
+        assert [stat["decision_point"] for stat in actual] == sorted(expected)
+        for stat in actual:
+            reference = expected[stat["decision_point"]]
+            assert stat["total_decisions"] == reference["total_decisions"]
+            assert stat["selected_count"] == reference["selected_count"]
+            assert stat["spec_type"] == reference["spec_type"]
+            assert sorted(stat["contexts"]) == sorted(reference["contexts"])
+
+        assert snapshot.decision_stats(0) == []
+    finally:
+        await repo.close()
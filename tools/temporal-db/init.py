@@ -16,7 +16,15 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root / "temporal_db"))
 
+from python.dump import dump_to_path, load_from_path  # noqa: E402
 from python.repository import initialize_temporal_database  # noqa: E402
+from python.sharding import (  # noqa: E402
+    hash_router,
+    initialize_sharded_temporal_database,
+    project_router,
+    spec_type_router,
+)
+from python.snapshot import export_decision_snapshot  # noqa: E402
 from python.types import (  # noqa: E402
     ArchitecturalPattern,
     PatternType,
@@ -176,6 +184,7 @@ async def status_database(db_path: str) -> None:
         # Get some basic statistics
         patterns = await repo.get_similar_patterns("", 0.0, 365)
         decision_patterns = await repo.analyze_decision_patterns(365)
+        specifications = await repo.get_recent_specification_summaries(limit=3)
 
         await repo.close()
 
@@ -183,6 +192,11 @@ async def status_database(db_path: str) -> None:
         print(f"   🏗️  Architectural patterns: {len(patterns)}")
         print(f"   🎯 Decision patterns: {len(decision_patterns)}")
 
+        if specifications:
+            print("\n   📋 Recent specifications:")
+            for spec in specifications:
+                print(f"      • {spec.identifier} v{spec.version}: {spec.title}")
+
         if patterns:
             print("\n   📋 Recent patterns:")
             for pattern in patterns[:3]:
@@ -215,6 +229,90 @@ async def backup_database(db_path: str, backup_path: str) -> None:
         sys.exit(1)
 
 
+async def dump_database(db_path: str, output_path: str) -> None:
+    """Stream every table of the temporal database to an NDJSON dump."""
+    print(f"📤 Dumping temporal database: {db_path} → {output_path}")
+
+    try:
+        repo = await initialize_temporal_database(db_path)
+        counts = dump_to_path(repo.connection, output_path)
+        await repo.close()
+
+        print("✅ Dump written successfully")
+        for table, count in counts.items():
+            print(f"   • {table}: {count} rows")
+
+    except Exception as e:
+        print(f"❌ Dump failed: {e}")
+        sys.exit(1)
+
+
+async def load_database(db_path: str, input_path: str) -> None:
+    """Rebuild the temporal database from an NDJSON dump."""
+    print(f"📥 Loading temporal database: {input_path} → {db_path}")
+
+    try:
+        repo = await initialize_temporal_database(db_path)
+        counts = load_from_path(repo.connection, input_path)
+        await repo.close()
+
+        print("✅ Load completed successfully")
+        for table, count in counts.items():
+            if count < 0:
+                print(f"   • {table}: skipped (not in current schema)")
+            else:
+                print(f"   • {table}: {count} rows")
+
+    except Exception as e:
+        print(f"❌ Load failed: {e}")
+        sys.exit(1)
+
+
+async def snapshot_database(db_path: str, output_dir: str) -> None:
+    """Export the decision history as a columnar snapshot for analytics."""
+    print(f"🧊 Writing decision snapshot: {db_path} → {output_dir}")
+
+    try:
+        repo = await initialize_temporal_database(db_path)
+        manifest = export_decision_snapshot(repo, output_dir)
+        await repo.close()
+
+        print("✅ Snapshot written successfully")
+        print(f"   🎯 Decisions: {manifest['rows']}")
+        print(f"   📌 High-water change id: {manifest['high_water_id']}")
+
+    except Exception as e:
+        print(f"❌ Snapshot failed: {e}")
+        sys.exit(1)
+
+
+async def rebalance_shards(shard_specs: list[str], router_name: str) -> None:
+    """Move specification history between shards to match a routing strategy."""
+    print(f"🔀 Rebalancing {len(shard_specs)} shards using '{router_name}' routing")
+
+    try:
+        shard_paths = dict(spec.split("=", 1) for spec in shard_specs)
+        names = list(shard_paths)
+        if router_name == "spec-type":
+            router = spec_type_router(default_shard=names[0], shard_names=names)
+        elif router_name == "project":
+            router = project_router(names)
+        else:
+            router = hash_router(names)
+
+        repo = await initialize_sharded_temporal_database(shard_paths)
+        moved = await repo.rebalance(router)
+        await repo.close()
+
+        print("✅ Rebalance complete")
+        print(f"   📊 Moved {moved['specifications']} specifications")
+        print(f"   🎯 Moved {moved['changes']} change records")
+
+    except Exception as e:
+        print(f"❌ Rebalance failed: {e}")
+        sys.exit(1)
+
+
 def main():
     """Main CLI interface for temporal database management."""
     parser = argparse.ArgumentParser(description="VibesPro Temporal Database Management")
@@ -246,6 +344,57 @@ def main():
         help="Backup file path",
     )
 
+    # Dump command
+    dump_parser = subparsers.add_parser("dump", help="Dump database as NDJSON")
+    dump_parser.add_argument(
+        "--db-path", default="./temporal_db/project_specs.db", help="Database file path"
+    )
+    dump_parser.add_argument(
+        "--output",
+        default=f"./temporal_db/dump_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson.gz",
+        help="Dump file path (gzip-compressed when ending in .gz)",
+    )
+
+    # Load command
+    load_parser = subparsers.add_parser("load", help="Load database from an NDJSON dump")
+    load_parser.add_argument(
+        "--db-path", default="./temporal_db/project_specs.db", help="Database file path"
+    )
+    load_parser.add_argument(
+        "--input", required=True, help="Dump file path (gzip-compressed when ending in .gz)"
+    )
+
+    # Snapshot command
+    snapshot_parser = subparsers.add_parser(
+        "snapshot", help="Export decision history as a columnar snapshot"
+    )
+    snapshot_parser.add_argument(
+        "--db-path", default="./temporal_db/project_specs.db", help="Database file path"
+    )
+    snapshot_parser.add_argument(
+        "--output", default="./temporal_db/decision_snapshot", help="Snapshot directory"
+    )
+
+    # Rebalance command
+    rebalance_parser = subparsers.add_parser("rebalance", help="Rebalance a sharded database")
+    rebalance_parser.add_argument(
+        "--shard",
+        action="append",
+        required=True,
+        metavar="NAME=PATH",
+        help="Shard name and database path (repeat per shard; first is primary)",
+    )
+    rebalance_parser.add_argument(
+        "--router",
+        default="hash",
+        choices=["hash", "spec-type", "project"],
+        help=(
+            "Routing strategy to rebalance towards: 'spec-type' sends each spec type to "
+            "the shard of the same name (others to the first shard); 'project' keeps "
+            "every 'project/ID' identifier of a project on one shard"
+        ),
+    )
+
     args = parser.parse_args()
 
     if not args.command:
@@ -258,6 +407,14 @@ def main():
         asyncio.run(status_database(args.db_path))
     elif args.command == "backup":
         asyncio.run(backup_database(args.db_path, args.backup_path))
+    elif args.command == "dump":
+        asyncio.run(dump_database(args.db_path, args.output))
+    elif args.command == "load":
+        asyncio.run(load_database(args.db_path, args.input))
+    elif args.command == "snapshot":
+        asyncio.run(snapshot_database(args.db_path, args.output))
+    elif args.command == "rebalance":
+        asyncio.run(rebalance_shards(args.shard, args.router))
 
 
 if __name__ == "__main__":